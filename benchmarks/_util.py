@@ -0,0 +1,68 @@
+"""Helpers shared by the benchmark scripts."""
+
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+
+def make_payload(target_bytes: int, secrets: bool = True) -> Dict[str, Any]:
+    """
+    Build a Spotify-like paging payload of roughly `target_bytes` when serialized.
+    With `secrets`, every album also carries fields that default rules redact.
+    """
+    album = {
+        "album_type": "album",
+        "artists": [{"id": "0TnOYISbd1XYRBk9myaseg", "name": "Artist One"}],
+        "id": "4aawyAB9vmqN3uQ7FjRGTy",
+        "name": "Album " + "x" * 40,
+        "release_date": "2025-05-01",
+        "total_tracks": 12,
+        "images": [
+            {
+                "url": "https://i.scdn.co/image/ab67616d0000b273",
+                "height": 640,
+                "width": 640,
+            }
+        ],
+    }
+    if secrets:
+        album["owner"] = {"access_token": "secret-token", "password": "hunter2"}
+    per_item = len(json.dumps(album)) + 2
+    count = max(1, target_bytes // per_item)
+    return {
+        "albums": {
+            "href": "https://api.spotify.com/v1/browse/new-releases",
+            "items": [dict(album) for _ in range(count)],
+            "limit": count,
+            "next": None,
+            "offset": 0,
+            "previous": None,
+            "total": count,
+        }
+    }
+
+
+def measure(
+    fn: Callable[[], Any],
+    repeat: int = 5,
+    number: int = 1,
+    timer: Callable[[], float] = time.perf_counter,
+) -> float:
+    """
+    Best-of-`repeat` seconds per call, each sample averaging `number` calls.
+    Pass timer=time.process_time to measure CPU rather than wall time.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = timer()
+        for _ in range(number):
+            fn()
+        best = min(best, (timer() - start) / number)
+    return best
+
+
+def print_table(rows: List[Dict[str, Any]], columns: List[str]) -> None:
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
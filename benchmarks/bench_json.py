@@ -0,0 +1,50 @@
+"""
+Compare CPU time per call of the available JSON codecs for the three places
+the client uses them: decoding responses, encoding request bodies and
+pretty-printing attachments.
+
+    python -m benchmarks.bench_json
+"""
+
+import argparse
+import time
+
+from api_testing_framework.codec import available_codecs, load_codec
+from benchmarks._util import make_payload, measure, print_table
+
+SIZES = {"10KB": 10_000, "1MB": 1_000_000, "10MB": 10_000_000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    codecs = [load_codec(name) for name in available_codecs()]
+    baseline = codecs[0]
+    rows = []
+    for label, size in SIZES.items():
+        payload = make_payload(size, secrets=False)
+        body = baseline.dumps(payload)
+        number = max(1, 1_000_000 // size)
+        for codec in codecs:
+            assert codec.loads(body) == payload
+            timings = {
+                "decode": lambda: codec.loads(body),
+                "encode": lambda: codec.dumps(payload),
+                "pretty": lambda: codec.dumps_pretty(payload),
+            }
+            row = {"payload": label, "bytes": len(body), "codec": codec.name}
+            for op, fn in timings.items():
+                cpu = measure(
+                    fn, repeat=args.repeat, number=number, timer=time.process_time
+                )
+                row[f"{op}_ms"] = f"{cpu * 1000:.2f}"
+            rows.append(row)
+    print_table(
+        rows, ["payload", "bytes", "codec", "decode_ms", "encode_ms", "pretty_ms"]
+    )
+
+
+if __name__ == "__main__":
+    main()
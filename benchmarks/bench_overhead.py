@@ -0,0 +1,145 @@
+"""
+Measure what each client layer adds on top of a raw httpx call, offline
+against httpx.MockTransport, across payload sizes and client modes.
+
+    python -m benchmarks.bench_overhead [--json results.json]
+
+Every mode fetches the same new-releases payload. "overhead_us" is the time
+per call above the raw httpx baseline (Client.get + response.json()) for the
+same payload; use --json to keep results for comparison between releases.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+import httpx
+
+from api_testing_framework.client import APIClient
+from api_testing_framework.codec import available_codecs
+from api_testing_framework.spotify.client import SpotifyClient
+from api_testing_framework.spotify.models import NewReleasesResponse
+from api_testing_framework.timing import subscribe
+from benchmarks._util import make_payload, measure, print_table
+
+SIZES = {"1KB": 1_000, "100KB": 100_000, "1MB": 1_000_000}
+BASE_URL = "https://api.example.com"
+PATH = "/browse/new-releases"
+
+
+def mock_transport(body: bytes) -> httpx.MockTransport:
+    headers = {"Content-Type": "application/json"}
+    return httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers=headers)
+    )
+
+
+@contextmanager
+def env(**values: str) -> Iterator[None]:
+    saved = {k: os.environ.get(k) for k in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+@contextmanager
+def timing_subscriber() -> Iterator[None]:
+    unsubscribe = subscribe(lambda timing: None)
+    try:
+        yield
+    finally:
+        unsubscribe()
+
+
+def build_modes(transport: httpx.MockTransport) -> Dict[str, Callable[[], object]]:
+    """Name -> zero-argument call, each a single GET of PATH."""
+    raw = httpx.Client(base_url=BASE_URL, transport=transport)
+    client = APIClient(base_url=BASE_URL, token="dummy", transport=transport)
+    spotify = SpotifyClient(base_url=BASE_URL, token="dummy", transport=transport)
+    return {
+        "raw httpx": lambda: raw.get(PATH).json(),
+        "client.get": lambda: client.get(PATH),
+        "no retry wrapper": lambda: client._request_once("GET", PATH),
+        "record exchanges": lambda: client.get(PATH),  # run with ATTACH_ON_FAILURE
+        "attach=True": lambda: client.get(PATH, attach=True),
+        "timing subscriber": lambda: client.get(PATH),  # run with a subscriber
+        "dict + model_validate": lambda: NewReleasesResponse.model_validate(
+            spotify.get(PATH)
+        ),
+        "get_model": lambda: spotify.get_model(PATH, NewReleasesResponse),
+    }
+
+
+MODE_CONTEXT = {
+    "record exchanges": lambda: env(ATTACH_ON_FAILURE="true"),
+    "timing subscriber": timing_subscriber,
+}
+
+
+def run(repeat: int, codecs: List[str]) -> List[Dict[str, object]]:
+    rows = []
+    for codec in codecs:
+        with env(JSON_CODEC=codec, ATTACH_ON_FAILURE="false"):
+            for label, size in SIZES.items():
+                body = json.dumps(make_payload(size, secrets=False)).encode()
+                modes = build_modes(mock_transport(body))
+                number = max(5, 2_000_000 // (size + 10_000))
+                baseline = None
+                for mode, call in modes.items():
+                    with MODE_CONTEXT.get(mode, env)():
+                        call()  # warm up caches, adapters and the pool
+                        seconds = measure(call, repeat=repeat, number=number)
+                    if baseline is None:
+                        baseline = seconds
+                    rows.append(
+                        {
+                            "codec": codec,
+                            "payload": label,
+                            "bytes": len(body),
+                            "mode": mode,
+                            "us_per_call": round(seconds * 1e6, 1),
+                            "overhead_us": round((seconds - baseline) * 1e6, 1),
+                        }
+                    )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--codec",
+        action="append",
+        choices=available_codecs(),
+        help="Codec(s) to run with (default: all available)",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    args = parser.parse_args()
+
+    rows = run(args.repeat, args.codec or available_codecs())
+    print_table(
+        rows, ["codec", "payload", "bytes", "mode", "us_per_call", "overhead_us"]
+    )
+    if args.json:
+        result = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "httpx": httpx.__version__,
+            "results": rows,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare the compiled Redactor against the previous per-call redaction
+(rebuild the key set from the environment, then copy the whole tree).
+
+    python -m benchmarks.bench_redaction
+"""
+
+import argparse
+import json
+import os
+
+from api_testing_framework.redaction import get_redactor
+from benchmarks._util import make_payload, measure, print_table
+
+SIZES = {"1MB": 1_000_000, "10MB": 10_000_000}
+
+
+def legacy_redact(parsed):
+    redact_keys = set(
+        filter(None, os.getenv("REDACT_FIELDS", "access_token,password").split(","))
+    )
+
+    def _red(o):
+        if isinstance(o, dict):
+            return {
+                k: ("***REDACTED***" if k in redact_keys else _red(v))
+                for k, v in o.items()
+            }
+        if isinstance(o, list):
+            return [_red(i) for i in o]
+        return o
+
+    return _red(parsed)
+
+
+def compiled_redact(parsed):
+    return get_redactor().redact(parsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for label, size in SIZES.items():
+        for secrets in (True, False):
+            payload = make_payload(size, secrets=secrets)
+            assert legacy_redact(payload) == compiled_redact(payload)
+            legacy = measure(lambda: legacy_redact(payload), repeat=args.repeat)
+            compiled = measure(lambda: compiled_redact(payload), repeat=args.repeat)
+            rows.append(
+                {
+                    "payload": label,
+                    "bytes": len(json.dumps(payload)),
+                    "secrets": secrets,
+                    "legacy_ms": f"{legacy * 1000:.1f}",
+                    "compiled_ms": f"{compiled * 1000:.1f}",
+                    "speedup": f"{legacy / compiled:.1f}x",
+                }
+            )
+    print_table(
+        rows,
+        ["payload", "bytes", "secrets", "legacy_ms", "compiled_ms", "speedup"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Type
+
+import httpx
+
+from api_testing_framework.batch import (
+    BatchResult,
+    RequestSpec,
+    SpecLike,
+    as_spec,
+    check_concurrency,
+)
+from api_testing_framework.cache import ResponseCache, request_key
+from api_testing_framework.client import (
+    BODY_PREVIEW_EXTENSION,
+    BaseAPIClient,
+    BodyPreview,
+)
+from api_testing_framework.codec import T
+from api_testing_framework.exceptions import APIError
+from api_testing_framework.jsonstream import JSONItemStream
+from api_testing_framework.pool import VerifyTypes, get_registry
+from api_testing_framework.ratelimit import RateLimiter
+from api_testing_framework.retry import RetryPolicy, get_default_retry_policy
+from api_testing_framework.singleflight import AsyncSingleFlight
+from api_testing_framework.timing import start_timing
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """
+    asyncio counterpart of APIClient built on httpx.AsyncClient.
+    Same attach/ATTACH_ON_FAILURE semantics and retry behaviour; subclasses
+    override the async `_refresh_token_if_needed` to implement auth flows.
+
+    With `shared_pool`, the client borrows the registry's pool for its origin
+    on the running event loop (see TransportRegistry.acquire_async).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        verify: VerifyTypes = True,
+        shared_pool: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(base_url=base_url, token=token)
+        self._cache = cache
+        self._retry = retry if retry is not None else get_default_retry_policy()
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self._rate_limiter = rate_limiter
+
+        if shared_pool and transport is None:
+            transport = get_registry().acquire_async(
+                self.base_url, verify=verify, limits=limits, http2=http2
+            )
+
+        # Instantiate HTTPX async client
+        self._client = httpx.AsyncClient(
+            **self._client_args(
+                timeout, transport, limits=limits, http2=http2, verify=verify
+            )
+        )
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient (or release its shared pool lease)."""
+        await self._client.aclose()
+
+    async def warmup(self, connections: Optional[int] = None, path: str = "/") -> int:
+        """
+        Open pooled connections ahead of time; see APIClient.warmup.
+        """
+        count = self._warmup_count(connections)
+
+        async def _head() -> bool:
+            try:
+                await self._client.send(self._client.build_request("HEAD", path))
+            except httpx.HTTPError:
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(_head() for _ in range(count))))
+
+    async def _refresh_token_if_needed(self) -> None:
+        """
+        No-op by default. Subclasses override to implement token refresh
+        """
+        return
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Async counterpart of APIClient._send."""
+        response = self._cached_response(request)
+        if response is not None:
+            return response
+        if self._coalesces(request):
+            return await self._flights.do(
+                request_key(request), lambda: self._fetch(request)
+            )
+        return await self._fetch(request)
+
+    async def _fetch(
+        self, request: httpx.Request, stream: bool = False
+    ) -> httpx.Response:
+        """Async counterpart of APIClient._fetch."""
+        waited = 0.0
+        if self._rate_limiter is not None:
+            waited = await self._rate_limiter.aacquire(request)
+        probe = start_timing(request, asynchronous=True)
+        try:
+            response = await self._client.send(request, stream=stream)
+        except Exception as exc:
+            if probe is not None:
+                probe.finish(request, None, waited, error=exc)
+            raise
+        if probe is not None:
+            probe.finish(request, response, waited)
+        if self._rate_limiter is not None:
+            self._rate_limiter.feedback(request, response)
+        self._cache_response(request, response)
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+        model: Any = None,
+    ) -> Any:
+        """
+        Async HTTP request handler with retry, token refresh, and Allure attachment.
+        See APIClient._request for the argument and ATTACH_ON_FAILURE details.
+        """
+        return await self._retry.acall(
+            self._request_once,
+            method,
+            path,
+            params,
+            json,
+            attach=attach,
+            model=model,
+            request_method=method,
+        )
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+        model: Any = None,
+    ) -> Any:
+        """One attempt of _request, without retries."""
+        await self._refresh_token_if_needed()
+
+        # Check if we should record for later attachment (ATTACH_ON_FAILURE mode)
+        should_record = self._should_record(attach)
+
+        # Build request with appropriate parameters
+        request = self._build_request(method, path, params, json)
+        if should_record:
+            self._record_request(request)
+
+        # Send and record response
+        response = await self._send(request)
+        if should_record:
+            self._record_response(request, response)
+
+        # Handle status; if it errors, attach ONLY if explicit attach=True
+        try:
+            data = self._handle_response(response, model)
+        except APIError:
+            if attach:
+                self._attach_exchange_to_allure(request, response)
+            raise
+
+        if attach:
+            self._attach_exchange_to_allure(request, response)
+        return data
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+    ) -> dict:
+        """
+        GET request; if attach=True, record & attach the request/response in Allure
+        """
+        return await self._request("GET", path, params=params, attach=attach)
+
+    async def get_model(
+        self,
+        path: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+    ) -> T:
+        """
+        GET request whose body is validated straight into `model` from the raw
+        bytes, without building an intermediate dict
+        """
+        return await self._request(
+            "GET", path, params=params, attach=attach, model=model
+        )
+
+    async def post(
+        self, path: str, json: Optional[Dict[str, Any]] = None, *, attach: bool = False
+    ) -> dict:
+        """
+        POST request; if attach=True, record & attach the request/response in Allure
+        """
+        return await self._request("POST", path, json=json, attach=attach)
+
+    async def put(
+        self, path: str, json: Optional[Dict[str, Any]] = None, *, attach: bool = False
+    ) -> dict:
+        """
+        PUT request; if attach=True, record & attach the request/response in Allure
+        """
+        return await self._request("PUT", path, json=json, attach=attach)
+
+    async def delete(self, path: str, *, attach: bool = False) -> dict:
+        """
+        DELETE request; if attach=True, record & attach the request/response in Allure
+        """
+        return await self._request("DELETE", path, attach=attach)
+
+    async def iter_json_items(
+        self,
+        path: str,
+        json_pointer: str = "",
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a GET response and yield the elements of the JSON array at
+        `json_pointer`; see APIClient.iter_json_items.
+        """
+        await self._refresh_token_if_needed()
+        should_record = self._should_record(attach)
+
+        request = self._client.build_request("GET", path, params=params)
+        if should_record:
+            self._record_request(request)
+
+        response = await self._fetch(request, stream=True)
+        if should_record:
+            self._record_response(request, response)
+
+        preview = BodyPreview(self._preview_limit())
+        try:
+            if not response.is_success:
+                await response.aread()
+                self._handle_response(response)
+
+            parser = JSONItemStream(json_pointer)
+            async for chunk in response.aiter_text():
+                preview.add(chunk)
+                for item in parser.feed(chunk):
+                    yield item
+                if parser.done:
+                    break
+            else:
+                for item in parser.close():
+                    yield item
+        finally:
+            await response.aclose()
+            response.extensions[BODY_PREVIEW_EXTENSION] = preview.text
+            if attach:
+                self._attach_exchange_to_allure(request, response)
+
+    async def _run_spec(
+        self, index: int, spec: RequestSpec, semaphore: asyncio.Semaphore
+    ) -> BatchResult:
+        async with semaphore:
+            try:
+                data = await self._request(
+                    spec.method,
+                    spec.path,
+                    params=spec.params,
+                    json=spec.json,
+                    attach=spec.attach,
+                )
+            except Exception as exc:
+                return BatchResult(index=index, spec=spec, error=exc)
+        return BatchResult(index=index, spec=spec, data=data)
+
+    async def iter_batch(
+        self, specs: Iterable[SpecLike], max_concurrency: int = 10
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run requests with at most `max_concurrency` in flight and yield results
+        as they complete. Per-item errors are captured on the BatchResult.
+        """
+        check_concurrency(max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._run_spec(i, as_spec(spec), semaphore))
+            for i, spec in enumerate(specs)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def batch(
+        self,
+        specs: Iterable[SpecLike],
+        max_concurrency: int = 10,
+        *,
+        ordered: bool = True,
+    ) -> List[BatchResult]:
+        """
+        Async counterpart of APIClient.batch; see there for argument details.
+        """
+        results = [r async for r in self.iter_batch(specs, max_concurrency)]
+        if ordered:
+            results.sort(key=lambda r: r.index)
+        return results
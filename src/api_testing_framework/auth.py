@@ -1,25 +1,25 @@
 import base64
+import threading
+from typing import Optional
 
 import httpx
 
 TOKEN_URL = "https://accounts.spotify.com/api/token"
+TOKEN_REQUEST_DATA = {"grant_type": "client_credentials"}
 
 
-def fetch_spotify_token(client_id: str, client_secret: str) -> tuple[str, int]:
-    """
-    Returns (access_token, expires_in_seconds)
-    """
+def _token_request_headers(client_id: str, client_secret: str) -> dict:
     client_id = client_id.strip()
     client_secret = client_secret.strip()
     credentials = f"{client_id}:{client_secret}"
     encoded_credentials = base64.b64encode(credentials.encode("ascii")).decode()
-    headers = {
+    return {
         "Authorization": f"Basic {encoded_credentials}",
         "Content-Type": "application/x-www-form-urlencoded",
     }
-    data = {"grant_type": "client_credentials"}
-    json = True
-    resp = httpx.post(TOKEN_URL, data=data, headers=headers, json=json)
+
+
+def _parse_token_response(resp: httpx.Response) -> tuple[str, int]:
     try:
         resp.raise_for_status()
     except httpx.HTTPStatusError:
@@ -30,3 +30,115 @@ def fetch_spotify_token(client_id: str, client_secret: str) -> tuple[str, int]:
         raise RuntimeError(f"Spotify token fetch failed ({resp.status_code}): {err!r}")
     body = resp.json()
     return body["access_token"], body["expires_in"]
+
+
+class SpotifyTokenProvider:
+    """
+    Fetches client-credentials tokens over one pooled httpx.Client, so repeat
+    fetches reuse the connection (and TLS session) to the accounts host.
+
+    Args:
+        token_url: Token endpoint
+        transport: Custom httpx transport (e.g. a local stand-in for tests
+                   and benchmarks)
+        timeout: Request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        token_url: str = TOKEN_URL,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        timeout: float = 10.0,
+    ):
+        self.token_url = token_url
+        self._client = httpx.Client(transport=transport, timeout=timeout)
+
+    def __enter__(self) -> "SpotifyTokenProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def fetch(self, client_id: str, client_secret: str) -> tuple[str, int]:
+        """
+        Returns (access_token, expires_in_seconds)
+        """
+        resp = self._client.post(
+            self.token_url,
+            data=TOKEN_REQUEST_DATA,
+            headers=_token_request_headers(client_id, client_secret),
+        )
+        return _parse_token_response(resp)
+
+
+class AsyncSpotifyTokenProvider:
+    """
+    asyncio counterpart of SpotifyTokenProvider. The pooled httpx.AsyncClient
+    is bound to the event loop it is first used on, so create one per loop
+    (e.g. per AsyncSpotifyClient).
+    """
+
+    def __init__(
+        self,
+        token_url: str = TOKEN_URL,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: float = 10.0,
+    ):
+        self.token_url = token_url
+        self._client = httpx.AsyncClient(transport=transport, timeout=timeout)
+
+    async def __aenter__(self) -> "AsyncSpotifyTokenProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def fetch(self, client_id: str, client_secret: str) -> tuple[str, int]:
+        """
+        Returns (access_token, expires_in_seconds)
+        """
+        resp = await self._client.post(
+            self.token_url,
+            data=TOKEN_REQUEST_DATA,
+            headers=_token_request_headers(client_id, client_secret),
+        )
+        return _parse_token_response(resp)
+
+
+_provider: Optional[SpotifyTokenProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_token_provider() -> SpotifyTokenProvider:
+    """Return the process-wide SpotifyTokenProvider, creating it on first use."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = SpotifyTokenProvider()
+        return _provider
+
+
+def fetch_spotify_token(client_id: str, client_secret: str) -> tuple[str, int]:
+    """
+    Returns (access_token, expires_in_seconds), using the shared provider
+    """
+    return get_token_provider().fetch(client_id, client_secret)
+
+
+async def async_fetch_spotify_token(
+    client_id: str, client_secret: str
+) -> tuple[str, int]:
+    """
+    Async variant of fetch_spotify_token. Returns (access_token, expires_in_seconds)
+    Opens a provider per call; keep an AsyncSpotifyTokenProvider to reuse it.
+    """
+    async with AsyncSpotifyTokenProvider() as provider:
+        return await provider.fetch(client_id, client_secret)
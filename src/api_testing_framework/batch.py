@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Union
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """One request in a batch; mirrors the arguments of APIClient._request."""
+
+    method: str
+    path: str
+    params: Optional[Dict[str, Any]] = None
+    json: Optional[Dict[str, Any]] = None
+    attach: bool = False
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one batch item. Exactly one of `data` / `error` is set, so a
+    failing item never aborts the rest of the batch.
+    """
+
+    index: int
+    spec: RequestSpec
+    data: Optional[dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+SpecLike = Union[RequestSpec, Mapping[str, Any]]
+
+
+def as_spec(spec: SpecLike) -> RequestSpec:
+    """Accept a RequestSpec or a plain dict such as {"method": "GET", "path": "/x"}."""
+    if isinstance(spec, RequestSpec):
+        return spec
+    return RequestSpec(**spec)
+
+
+def check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
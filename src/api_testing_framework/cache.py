@@ -0,0 +1,191 @@
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Tuple
+
+import httpx
+
+CacheKey = Tuple[str, str]
+
+CACHEABLE_METHODS = frozenset({"GET"})
+
+
+def request_key(request: httpx.Request) -> CacheKey:
+    """
+    Identity of a request for caching and coalescing: the method plus the URL
+    with lower-cased scheme/host and sorted query parameters.
+    """
+    url = request.url
+    normalized = url.copy_with(
+        scheme=url.scheme.lower(),
+        host=url.host.lower(),
+        params=sorted(url.params.multi_items()),
+    )
+    return request.method.upper(), str(normalized)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    evictions: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry:
+    __slots__ = ("response", "expires_at", "size", "elapsed")
+
+    def __init__(
+        self, response: httpx.Response, expires_at: float, size: int, elapsed: float
+    ):
+        self.response = response
+        self.expires_at = expires_at
+        self.size = size
+        self.elapsed = elapsed
+
+
+def _response_size(response: httpx.Response) -> int:
+    headers = sum(len(k) + len(v) for k, v in response.headers.raw)
+    return len(response.content) + headers
+
+
+def _elapsed(response: httpx.Response) -> float:
+    try:
+        return response.elapsed.total_seconds()
+    except RuntimeError:  # elapsed is only set once the response is closed
+        return 0.0
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of successful GET responses with a TTL and a memory
+    budget. Share one instance between clients to cache per session, or give
+    each client its own.
+
+    Keys are the method plus the normalized URL (lower-cased scheme and host,
+    query parameters sorted), so `?a=1&b=2` and `?b=2&a=1` hit the same entry.
+    Credentials are not part of the key: only cache endpoints whose responses
+    do not depend on the caller.
+
+    Args:
+        ttl: Seconds an entry stays fresh
+        max_entries: Entry count after which the least recently used is evicted
+        max_bytes: Approximate body + header bytes kept; larger responses are
+                   never stored
+        bypass: fnmatch patterns on the URL path that are never cached,
+                e.g. "/me*" or "/browse/*"
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        bypass: Iterable[str] = (),
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bypass = tuple(bypass)
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request: httpx.Request) -> CacheKey:
+        return request_key(request)
+
+    def is_bypassed(self, request: httpx.Request) -> bool:
+        path = request.url.path
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.bypass)
+
+    def _cacheable(self, request: httpx.Request) -> bool:
+        return request.method.upper() in CACHEABLE_METHODS
+
+    def get(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """Return the cached response for `request`, or None on a miss."""
+        if not self._cacheable(request):
+            return None
+        if self.is_bypassed(request):
+            with self._lock:
+                self.stats.bypassed += 1
+            return None
+        key = self.make_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            self.stats.saved_seconds += entry.elapsed
+            return entry.response
+
+    def put(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """
+        Store a fully read, successful response. Returns False when the
+        response is not cacheable (method, status, bypass rule, Cache-Control
+        no-store, or bigger than the whole budget).
+        """
+        if not (self._cacheable(request) and response.is_success):
+            return False
+        if self.is_bypassed(request):
+            return False
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return False
+        try:
+            size = _response_size(response)
+        except httpx.ResponseNotRead:
+            return False  # streamed responses are not cached
+        if size > self.max_bytes:
+            return False
+
+        key = self.make_key(request)
+        entry = _Entry(response, self._clock() + self.ttl, size, _elapsed(response))
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return True
+
+    def _drop(self, key: CacheKey) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def invalidate(self, request: httpx.Request) -> None:
+        """Forget the entry for `request`, e.g. after a write to that resource."""
+        key = self.make_key(request)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        """Drop all entries; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,104 +1,232 @@
-import json
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 import allure
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
+from api_testing_framework.batch import (
+    BatchResult,
+    RequestSpec,
+    SpecLike,
+    as_spec,
+    check_concurrency,
+)
+from api_testing_framework.cache import ResponseCache, request_key
+from api_testing_framework.codec import JSON_CONTENT_TYPE, T, get_codec, validate_json
 from api_testing_framework.exceptions import APIError
+from api_testing_framework.jsonstream import JSONItemStream
+from api_testing_framework.pool import DEFAULT_LIMITS, VerifyTypes, get_registry
+from api_testing_framework.ratelimit import RateLimiter
+from api_testing_framework.recorder import ExchangeRecorder
+from api_testing_framework.redaction import get_redactor, redact_json_prefix
+from api_testing_framework.retry import RetryPolicy, get_default_retry_policy
+from api_testing_framework.singleflight import COALESCABLE_METHODS, SingleFlight
+from api_testing_framework.timing import TIMING_EXTENSION, get_timing, start_timing
+
+# Response extension holding the body prefix kept for a streamed response
+BODY_PREVIEW_EXTENSION = "api_testing_framework.body_preview"
+
+
+class BodyPreview:
+    """Keeps at most `limit` characters of a streamed body for Allure."""
 
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._parts: List[str] = []
+        self._size = 0
 
-class APIClient:
+    def add(self, chunk: str) -> None:
+        if self._size < self.limit:
+            part = chunk[: self.limit - self._size]
+            self._parts.append(part)
+            self._size += len(part)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+class BaseAPIClient:
     """
-    Generic HTTP client that handles requests with optional token refresh hook.
-    Subclasses should override `_refresh_token_if_needed` to implement auth flows.
+    State and Allure helpers shared by the sync and async clients.
+    Concrete clients own the underlying httpx client and the request loop.
     """
 
-    def __init__(
-        self,
-        base_url: Optional[str] = None,
-        token: Optional[str] = None,
-        timeout: float = 10.0,
-        transport: Optional[httpx.BaseTransport] = None,
-    ):
+    def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None):
         # Store base URL and optional token
         self.base_url = base_url.rstrip("/")
         self._token = token
         self._token_expires_at: float = 0.0
 
+        self._last_request: Optional[httpx.Request] = None
+        self._last_response: Optional[httpx.Response] = None
+        self._exchanges = ExchangeRecorder()
+        self._cache: Optional[ResponseCache] = None
+        self._flights = None
+        self._rate_limiter: Optional[RateLimiter] = None
+
+    def _client_args(
+        self,
+        timeout: float,
+        transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]],
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        verify: VerifyTypes = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the keyword arguments shared by httpx.Client and httpx.AsyncClient.
+        Pool limits and HTTP/2 only apply to httpx's default transport; a custom
+        `transport` is responsible for its own pooling.
+        """
         # Prepare headers
         headers: Dict[str, str] = {}
-        if token is not None:
-            headers["Authorization"] = f"Bearer {token}"
+        if self._token is not None:
+            headers["Authorization"] = f"Bearer {self._token}"
 
-        # Instantiate HTTPX client
+        self._limits = limits or DEFAULT_LIMITS
         client_args: Dict[str, Any] = {
             "base_url": self.base_url,
             "headers": headers,
             "timeout": timeout,
+            "limits": self._limits,
+            "http2": http2,
+            "verify": verify,
         }
 
         if transport is not None:
             client_args["transport"] = transport
+        return client_args
+
+    def _warmup_count(self, connections: Optional[int]) -> int:
+        if connections is None:
+            # Connections beyond the keep-alive limit are closed after use
+            connections = self._limits.max_keepalive_connections or 1
+        if connections < 1:
+            raise ValueError(f"connections must be >= 1, got {connections}")
+        return connections
+
+    @staticmethod
+    def _should_record(attach: bool) -> bool:
+        """
+        Record the exchange when attaching explicitly or in ATTACH_ON_FAILURE mode
+        """
+        attach_on_failure = os.getenv("ATTACH_ON_FAILURE", "").lower() == "true"
+        return attach or attach_on_failure
 
-        self._client = httpx.Client(**client_args)
-        self._last_request: Optional[httpx.Request] = None
-        self._last_response: Optional[httpx.Response] = None
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Request:
+        """Build a request, encoding any JSON body with the configured codec."""
+        if json is None:
+            return self._client.build_request(method, path, params=params)
+        return self._client.build_request(
+            method,
+            path,
+            params=params,
+            content=get_codec().dumps(json),
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+        )
 
-    def _refresh_token_if_needed(self) -> None:
+    def _handle_response(self, response: httpx.Response, model: Any = None) -> Any:
         """
-        No-op by default. Subclasses override to implement token refresh
+        Raise APIError for error statuses; otherwise decode the body, straight
+        into `model` when one is given.
         """
-        return
-
-    def _handle_response(self, response: httpx.Response) -> dict:
-        data = response.json()
+        codec = get_codec()
         if not response.is_success:
-            raise APIError(response.status_code, data.get("error", response.text), data)
-        return data
+            # Gateways and proxies often answer errors with HTML or plain text
+            try:
+                data = codec.loads(response.content)
+            except ValueError:
+                data = {}
+            message = response.text
+            if isinstance(data, dict):
+                message = data.get("error", message)
+            raise APIError(
+                response.status_code, message, data, headers=response.headers
+            )
+        if model is not None:
+            return validate_json(model, response.content)
+        return codec.loads(response.content)
+
+    @staticmethod
+    def _response_text(response: httpx.Response) -> str:
+        """Full body text, or the bounded prefix kept for streamed responses."""
+        try:
+            return response.text or ""
+        except httpx.ResponseNotRead:
+            return response.extensions.get(BODY_PREVIEW_EXTENSION, "")
+
+    @staticmethod
+    def _preview_limit() -> int:
+        # One extra char so _sanitize_payload still sees the body as truncated
+        return int(os.getenv("MAX_PAYLOAD_CHARS", "5120")) + 1
 
     def _record_request(self, request: httpx.Request) -> None:
         """Store the outgoing Request object for later attachment."""
         self._last_request = request
+        # Time recorded exchanges so the attachment can show where time went
+        request.extensions[TIMING_EXTENSION] = True
+
+    def _record_response(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> None:
+        """Store the Response and push the exchange into the history buffer."""
+        self._last_response = response
+        self._exchanges.record(request, response)
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The ResponseCache serving GETs, if one was configured."""
+        return self._cache
+
+    def _cached_response(self, request: httpx.Request) -> Optional[httpx.Response]:
+        if self._cache is None:
+            return None
+        return self._cache.get(request)
+
+    def _cache_response(self, request: httpx.Request, response: httpx.Response) -> None:
+        if self._cache is not None:
+            self._cache.put(request, response)
+
+    def _coalesces(self, request: httpx.Request) -> bool:
+        return self._flights is not None and request.method in COALESCABLE_METHODS
 
     def _sanitize_payload(self, raw_text: str) -> tuple[str, Any]:
         """
-        Truncate and redact JSON paloads based on env settings
+        Truncate and redact JSON payloads based on env settings.
+        Oversized JSON is redacted while streaming and cut at MAX_PAYLOAD_CHARS
+        into still-valid JSON; only non-JSON text falls back to a raw slice.
         """
         max_chars = int(os.getenv("MAX_PAYLOAD_CHARS", "5120"))
-        redact_keys = set(
-            filter(None, os.getenv("REDACT_FIELDS", "access_token,password").split(","))
-        )
+        redactor = get_redactor()
 
-        # Truncate
-        text = raw_text
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n\n<truncated>"
+        if len(raw_text) <= max_chars:
+            codec = get_codec()
+            try:
+                parsed = codec.loads(raw_text)
+            except ValueError:
+                return raw_text, allure.attachment_type.TEXT
+            sanitized = codec.dumps_pretty(redactor.redact(parsed))
+            return sanitized, allure.attachment_type.JSON
 
-        # Attempt JSON parse and redact
         try:
-            parsed = json.loads(text)
-
-            def _red(o):
-                if isinstance(o, dict):
-                    return {
-                        k: ("***REDACTED***" if k in redact_keys else _red(v))
-                        for k, v in o.items()
-                    }
-                if isinstance(o, list):
-                    return [_red(i) for i in o]
-                return o
-
-            sanitized = json.dumps(_red(parsed), indent=2)
-            return sanitized, allure.attachment_type.JSON
-        except Exception:
-            return text, allure.attachment_type.TEXT
+            sanitized = redact_json_prefix(raw_text, max_chars, redactor)
+        except ValueError:
+            sanitized = None
+        if sanitized is None:
+            return raw_text[:max_chars] + "\n\n<truncated>", allure.attachment_type.TEXT
+        return sanitized, allure.attachment_type.JSON
+
+    @staticmethod
+    def _format_headers(headers: httpx.Headers) -> str:
+        redacted = get_redactor().redact_headers(headers.items())
+        return "\n".join(f"{k}: {v}" for k, v in redacted)
 
     def _attach_last_exchange_to_allure(self) -> None:
         """
@@ -107,9 +235,36 @@ class APIClient:
         """
         if not (self._last_request and self._last_response):
             return
+        self._attach_exchange_to_allure(self._last_request, self._last_response)
 
+    def _attach_recorded_exchanges_to_allure(self) -> None:
+        """
+        Attach every exchange in the history buffer, oldest first, each in its
+        own Allure step. This is where the deferred serialization and redaction
+        happen, so it should only run on failure.
+        """
+        exchanges = self._exchanges.exchanges()
+        if len(exchanges) == 1:
+            self._attach_exchange_to_allure(*exchanges[0])
+            return
+        for i, (request, response) in enumerate(exchanges, start=1):
+            title = (
+                f"HTTP exchange {i}/{len(exchanges)}: {request.method} "
+                f"{request.url.path} -> {response.status_code}"
+            )
+            with allure.step(title):
+                self._attach_exchange_to_allure(request, response)
+
+    def clear_exchanges(self) -> None:
+        """Forget the recorded exchange history, e.g. between tests."""
+        self._exchanges.clear()
+        self._last_request = None
+        self._last_response = None
+
+    def _attach_exchange_to_allure(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> None:
         # Attach HTTP request
-        request: httpx.Request = self._last_request
         allure.attach(
             f"{request.method} {request.url}",
             name="HTTP Request",
@@ -117,22 +272,21 @@ class APIClient:
         )
 
         # Attach request headers
-        headers = "\n".join(f"{k}: {v}" for k, v in request.headers.items())
+        headers = self._format_headers(request.headers)
         allure.attach(
             headers, name="Request Headers", attachment_type=allure.attachment_type.TEXT
         )
 
         # Attach request body
-        if self._last_request.content:
+        if request.content:
             try:
-                raw_body = self._last_request.content.decode("utf-8", errors="ignore")
+                raw_body = request.content.decode("utf-8", errors="ignore")
             except Exception:
                 raw_body = "<binary content>"
             body_text, atype = self._sanitize_payload(raw_body)
             allure.attach(body_text, name="Request Body", attachment_type=atype)
 
         # Attach response status
-        response: httpx.Response = self._last_response
         allure.attach(
             f"{response.status_code} {response.reason_phrase}",
             name="HTTP Response Status",
@@ -140,7 +294,7 @@ class APIClient:
         )
 
         # Attach response headers
-        response_headers = "\n".join(f"{k}: {v}" for k, v in response.headers.items())
+        response_headers = self._format_headers(response.headers)
         allure.attach(
             response_headers,
             name="Response Headers",
@@ -148,16 +302,155 @@ class APIClient:
         )
 
         # Attach response body
-        raw_response = response.text or ""
+        raw_response = self._response_text(response)
         response_text, atype = self._sanitize_payload(raw_response)
         allure.attach(response_text, name="Response Body", attachment_type=atype)
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(APIError),
-    )
+        timing = get_timing(response)
+        if timing is not None:
+            allure.attach(
+                timing.as_text(),
+                name="Timing",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+
+class APIClient(BaseAPIClient):
+    """
+    Generic HTTP client that handles requests with optional token refresh hook.
+    Subclasses should override `_refresh_token_if_needed` to implement auth flows.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.BaseTransport] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        verify: VerifyTypes = True,
+        shared_pool: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Args:
+            base_url: Base URL every request path is joined to
+            token: Optional bearer token sent on every request
+            timeout: Request timeout in seconds
+            transport: Custom httpx transport (e.g. for tests)
+            limits: Connection pool size and keep-alive expiry (httpx.Limits)
+            http2: Negotiate HTTP/2; requires the `h2` package (httpx[http2])
+            verify: TLS verification flag or CA bundle path
+            shared_pool: Borrow the process-wide pooled transport for this
+                         origin instead of opening a private pool
+            cache: ResponseCache for GET requests; pass the same instance to
+                   several clients to share it across a session
+            coalesce: Merge identical GET/HEAD requests that are in flight at
+                      the same time into one upstream call
+            retry: RetryPolicy deciding which failures are retried and how
+                   long to wait; defaults to the shared process-wide policy
+            rate_limiter: RateLimiter pacing requests on the wire; share one
+                          instance to pace several clients together
+        """
+        super().__init__(base_url=base_url, token=token)
+        self._cache = cache
+        self._retry = retry if retry is not None else get_default_retry_policy()
+        self._flights = SingleFlight() if coalesce else None
+        self._rate_limiter = rate_limiter
+
+        if shared_pool and transport is None:
+            transport = get_registry().acquire(
+                self.base_url, verify=verify, limits=limits, http2=http2
+            )
+
+        # Instantiate HTTPX client
+        self._client = httpx.Client(
+            **self._client_args(
+                timeout, transport, limits=limits, http2=http2, verify=verify
+            )
+        )
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying httpx.Client (or release its shared pool lease)."""
+        self._client.close()
+
+    def warmup(self, connections: Optional[int] = None, path: str = "/") -> int:
+        """
+        Open pooled connections ahead of time by sending concurrent HEAD requests,
+        so the first timed calls skip the TCP/TLS handshake.
+
+        Args:
+            connections: Number of connections to open; defaults to the
+                         keep-alive limit, which is how many the pool retains
+            path: Path to send the HEAD requests to; the status is ignored
+
+        Returns:
+            Number of warm-up requests that reached the server
+        """
+        count = self._warmup_count(connections)
+
+        def _head(_: int) -> bool:
+            try:
+                self._client.send(self._client.build_request("HEAD", path))
+            except httpx.HTTPError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            return sum(pool.map(_head, range(count)))
+
+    def _refresh_token_if_needed(self) -> None:
+        """
+        No-op by default. Subclasses override to implement token refresh
+        """
+        return
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request through the response cache and, for idempotent methods,
+        the single-flight table, so concurrent identical calls share one
+        upstream request.
+        """
+        response = self._cached_response(request)
+        if response is not None:
+            return response
+        if self._coalesces(request):
+            return self._flights.do(request_key(request), lambda: self._fetch(request))
+        return self._fetch(request)
+
+    def _fetch(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """
+        Put `request` on the wire, paced by the rate limiter if any, and time
+        it when timings are being collected.
+        """
+        waited = 0.0
+        if self._rate_limiter is not None:
+            waited = self._rate_limiter.acquire(request)
+        probe = start_timing(request)
+        try:
+            response = self._client.send(request, stream=stream)
+        except Exception as exc:
+            if probe is not None:
+                probe.finish(request, None, waited, error=exc)
+            raise
+        if probe is not None:
+            probe.finish(request, response, waited)
+        if self._rate_limiter is not None:
+            self._rate_limiter.feedback(request, response)
+        self._cache_response(request, response)
+        return response
+
     def _request(
         self,
         method: str,
@@ -166,7 +459,8 @@ class APIClient:
         json: Optional[Dict[str, Any]] = None,
         *,
         attach: bool = False,
-    ) -> dict:
+        model: Any = None,
+    ) -> Any:
         """
         Generic HTTP request handler with retry, token refresh, and Allure attachment.
 
@@ -176,9 +470,10 @@ class APIClient:
             params: Query parameters for the request
             json: JSON body for the request
             attach: If True, attach request/response to Allure report immediately
+            model: Validate the body into this type instead of returning a dict
 
         Returns:
-            Parsed JSON response as dict
+            Parsed JSON response as dict, or an instance of `model`
 
         Raises:
             APIError: If the response status indicates an error
@@ -187,33 +482,54 @@ class APIClient:
             ATTACH_ON_FAILURE: If "true", records request/response for all calls.
                               Pytest hook can then attach on test failure.
         """
+        return self._retry.call(
+            self._request_once,
+            method,
+            path,
+            params,
+            json,
+            attach=attach,
+            model=model,
+            request_method=method,
+        )
+
+    def _request_once(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+        model: Any = None,
+    ) -> Any:
+        """One attempt of _request, without retries."""
         self._refresh_token_if_needed()
 
         # Check if we should record for later attachment (ATTACH_ON_FAILURE mode)
-        attach_on_failure = os.getenv("ATTACH_ON_FAILURE", "").lower() == "true"
-        should_record = attach or attach_on_failure
+        should_record = self._should_record(attach)
 
         # Build request with appropriate parameters
-        request = self._client.build_request(method, path, params=params, json=json)
+        request = self._build_request(method, path, params, json)
         if should_record:
             self._record_request(request)
 
         # Send and record response
-        response = self._client.send(request)
+        response = self._send(request)
         if should_record:
-            self._last_response = response
+            self._record_response(request, response)
 
         # Handle status; if it errors, attach ONLY if explicit attach=True
         try:
-            data = self._handle_response(response)
+            data = self._handle_response(response, model)
         except APIError:
             if attach:  # Only attach immediately if explicitly requested
-                self._attach_last_exchange_to_allure()
+                self._attach_exchange_to_allure(request, response)
             raise  # Pytest hook will handle attachment if ATTACH_ON_FAILURE=true
 
         # On success, attach ONLY if explicit attach=True
         if attach:
-            self._attach_last_exchange_to_allure()
+            self._attach_exchange_to_allure(request, response)
         return data
 
     def get(
@@ -228,6 +544,20 @@ class APIClient:
         """
         return self._request("GET", path, params=params, attach=attach)
 
+    def get_model(
+        self,
+        path: str,
+        model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+    ) -> T:
+        """
+        GET request whose body is validated straight into `model` from the raw
+        bytes, without building an intermediate dict
+        """
+        return self._request("GET", path, params=params, attach=attach, model=model)
+
     def post(
         self, path: str, json: Optional[Dict[str, Any]] = None, *, attach: bool = False
     ) -> dict:
@@ -249,3 +579,115 @@ class APIClient:
         DELETE request; if attach=True, record & attach the request/response in Allure
         """
         return self._request("DELETE", path, attach=attach)
+
+    def iter_json_items(
+        self,
+        path: str,
+        json_pointer: str = "",
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        attach: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Stream a GET response and yield the elements of the JSON array at
+        `json_pointer` (RFC 6901, e.g. "/albums/items") as they are parsed.
+
+        Memory stays flat however large the body is: only the current item and
+        a MAX_PAYLOAD_CHARS prefix for Allure are held. The call is not retried,
+        since earlier items may already have been consumed.
+
+        Raises:
+            APIError: If the response status indicates an error
+            KeyError: If the body contains nothing at `json_pointer`
+        """
+        self._refresh_token_if_needed()
+        should_record = self._should_record(attach)
+
+        request = self._client.build_request("GET", path, params=params)
+        if should_record:
+            self._record_request(request)
+
+        response = self._fetch(request, stream=True)
+        if should_record:
+            self._record_response(request, response)
+
+        preview = BodyPreview(self._preview_limit())
+        try:
+            if not response.is_success:
+                response.read()
+                self._handle_response(response)
+
+            parser = JSONItemStream(json_pointer)
+            for chunk in response.iter_text():
+                preview.add(chunk)
+                yield from parser.feed(chunk)
+                if parser.done:
+                    break
+            else:
+                yield from parser.close()
+        finally:
+            response.close()
+            response.extensions[BODY_PREVIEW_EXTENSION] = preview.text
+            if attach:
+                self._attach_exchange_to_allure(request, response)
+
+    def _run_spec(self, index: int, spec: RequestSpec) -> BatchResult:
+        try:
+            data = self._request(
+                spec.method,
+                spec.path,
+                params=spec.params,
+                json=spec.json,
+                attach=spec.attach,
+            )
+        except Exception as exc:
+            return BatchResult(index=index, spec=spec, error=exc)
+        return BatchResult(index=index, spec=spec, data=data)
+
+    def iter_batch(
+        self, specs: Iterable[SpecLike], max_concurrency: int = 10
+    ) -> Iterator[BatchResult]:
+        """
+        Run requests on a bounded thread pool and yield results as they complete.
+        All workers share this client's connection pool; per-item errors are
+        captured on the BatchResult instead of aborting the batch. Closing the
+        iterator early cancels the requests that have not started and returns
+        without waiting for those in flight.
+        """
+        check_concurrency(max_concurrency)
+        specs = [as_spec(s) for s in specs]
+        if not specs:
+            return
+        workers = min(max_concurrency, len(specs))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(self._run_spec, i, spec) for i, spec in enumerate(specs)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def batch(
+        self,
+        specs: Iterable[SpecLike],
+        max_concurrency: int = 10,
+        *,
+        ordered: bool = True,
+    ) -> List[BatchResult]:
+        """
+        Run many requests with at most `max_concurrency` in flight.
+
+        Args:
+            specs: RequestSpec objects or dicts with RequestSpec fields
+            max_concurrency: Upper bound on concurrent requests
+            ordered: If True, results follow input order; otherwise completion order
+
+        Returns:
+            One BatchResult per spec
+        """
+        results = list(self.iter_batch(specs, max_concurrency))
+        if ordered:
+            results.sort(key=lambda r: r.index)
+        return results
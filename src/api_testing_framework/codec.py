@@ -0,0 +1,143 @@
+"""
+JSON encoding and decoding for request bodies, responses and attachments.
+
+orjson is used when it is installed and the stdlib json module otherwise.
+Set JSON_CODEC=json (or orjson) to force one; "auto" is the default. Both
+accept and reject the same documents and objects, so switching codecs never
+changes what a test sends or sees.
+Typed responses skip the codec: validate_json() hands the raw bytes to
+pydantic, which parses and validates them in one pass.
+"""
+
+import json
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Any, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+
+T = TypeVar("T")
+
+
+class JSONCodec:
+    """Stdlib codec; encodes compactly as UTF-8, like httpx does for `json=`."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a document; raises ValueError if it is not valid JSON."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def dumps_pretty(self, obj: Any) -> str:
+        """Indented text for attachments."""
+        return json.dumps(obj, indent=2)
+
+
+# A number of 20+ digits may not fit in 64 bits; orjson would load it as a float
+_LONG_INT = re.compile(rb"(?:^|[\[:,])\s*-?\d{20}")
+_LONG_INT_TEXT = re.compile(r"(?:^|[\[:,])\s*-?\d{20}")
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """True if `obj` holds a NaN or infinite float (as a value or a key)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(k) or _has_nonfinite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson on the fast path, with the stdlib codec taking over wherever the
+    two would disagree: ints wider than 64 bits, NaN/Infinity, non-string
+    keys (json's rendering of e.g. float keys differs) and the datetimes and
+    dataclasses orjson serializes but json rejects. Attachments use the
+    stdlib pretty-printer, so they look the same under either codec.
+    """
+
+    name = "orjson"
+
+    _DUMPS_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson is not None
+        else 0
+    )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        pattern = _LONG_INT if isinstance(data, bytes) else _LONG_INT_TEXT
+        if pattern.search(data):
+            return super().loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json also accepts NaN, Infinity and out-of-range floats, and
+            # raises its own ValueError for documents that are really invalid
+            return super().loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj, option=self._DUMPS_OPTIONS)
+        except TypeError:  # includes orjson.JSONEncodeError
+            return super().dumps(obj)
+        if b"null" in data and _has_nonfinite(obj):
+            return super().dumps(obj)  # orjson wrote NaN as null; json raises
+        return data
+
+
+CODECS = {"json": JSONCodec, "orjson": OrjsonCodec}
+
+
+def available_codecs() -> list[str]:
+    """Names of the codecs usable in this environment."""
+    return ["json"] + (["orjson"] if orjson is not None else [])
+
+
+@lru_cache(maxsize=None)
+def load_codec(name: str) -> JSONCodec:
+    """Return the codec called `name`, or the fastest available for "auto"."""
+    name = name.strip().lower() or "auto"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; choose from {list(CODECS)}")
+    if name not in available_codecs():
+        raise ValueError(f"JSON codec {name!r} is not installed")
+    return CODECS[name]()
+
+
+def get_codec() -> JSONCodec:
+    """Return the codec selected by JSON_CODEC (default "auto")."""
+    return load_codec(os.getenv("JSON_CODEC", "auto"))
+
+
+@lru_cache(maxsize=256)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """TypeAdapter for `tp`, built once; building one compiles a validator."""
+    return TypeAdapter(tp)
+
+
+def validate_json(model: Type[T], data: Union[bytes, str]) -> T:
+    """
+    Validate a JSON document straight into `model` (a pydantic model or any
+    type TypeAdapter accepts, e.g. list[Album]) without building a dict first.
+    """
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.model_validate_json(data)
+    return type_adapter(model).validate_json(data)
@@ -1,7 +1,17 @@
+from typing import Mapping, Optional
+
+
 class APIError(Exception):
     """Raised when an API call returns a non-2xx status."""
 
-    def __init__(self, status_code: int, message: str, response: dict):
+    def __init__(
+        self,
+        status_code: int,
+        message: str,
+        response: dict,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
         super().__init__(f"{status_code} Error: {message}")
         self.status_code = status_code
         self.response = response
+        self.headers = headers or {}
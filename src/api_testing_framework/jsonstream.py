@@ -0,0 +1,339 @@
+"""
+Incremental JSON tokenizer and item extractor.
+
+Both are push parsers: feed them text chunks as they arrive from the network
+and they return whatever became complete, holding only the unparsed tail of
+the current chunk in memory.
+"""
+
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+START_OBJECT = "start_object"
+END_OBJECT = "end_object"
+START_ARRAY = "start_array"
+END_ARRAY = "end_array"
+KEY = "key"
+VALUE = "value"
+END = "end"
+INCOMPLETE = "incomplete"
+
+Token = Tuple[str, Any]
+
+_WS = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]+")
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+_DECODER = json.JSONDecoder()
+_CLOSERS = {"}": ("{", END_OBJECT), "]": ("[", END_ARRAY)}
+
+
+class JSONTokenizer:
+    """
+    Turns a stream of text chunks into (kind, value) tokens. Tokens split across
+    chunk boundaries are held back until the next `feed` (or `close`).
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._expect_key = False
+        self._eof = False
+        self._retry_at = 0
+        self.consumed = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def feed(self, chunk: str) -> List[Token]:
+        """Add a chunk of text and return the tokens it completed."""
+        self.push(chunk)
+        return self.drain()
+
+    def close(self) -> List[Token]:
+        """Flush the final token and check the document is complete."""
+        self.end()
+        tokens = self.drain()
+        self.check_complete()
+        return tokens
+
+    def push(self, chunk: str) -> None:
+        """Buffer a chunk without tokenizing it yet."""
+        if self._pos:
+            self.consumed += self._pos
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        self._buf += chunk
+
+    def end(self) -> None:
+        """Mark end of input so trailing numbers/literals can be emitted."""
+        self._eof = True
+
+    def check_complete(self) -> None:
+        if self._buf[self._pos :].strip() or self._stack:
+            raise ValueError("Incomplete JSON document")
+
+    def decode_value(self) -> Tuple[str, Any]:
+        """
+        Decode the next array element in one C-level json call, skipping a
+        leading comma. Returns ("value", obj), ("end", None) when the array
+        closes next, or ("incomplete", None) when more input is needed.
+        """
+        buf = self._buf
+        n = len(buf)
+        pos = _WS.match(buf, self._pos).end()
+        if pos < n and buf[pos] == ",":
+            pos = _WS.match(buf, pos + 1).end()
+        if pos >= n:
+            return INCOMPLETE, None
+        if buf[pos] == "]":
+            return END, None
+        if n - pos < self._retry_at and not self._eof:
+            return INCOMPLETE, None
+        try:
+            value, end = _DECODER.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise ValueError(f"Invalid JSON at offset {self.consumed + pos}")
+            # Wait until the buffer doubles so huge items are not re-parsed per chunk
+            self._retry_at = 2 * (n - pos)
+            return INCOMPLETE, None
+        if not self._eof:
+            if end == n:
+                return INCOMPLETE, None  # a trailing number may continue
+            # A number cut at the end of a chunk ("12.", "1e", "1E-") decodes
+            # as a shorter valid prefix; wait until its characters stop
+            c = buf[pos]
+            if (c == "-" or c.isdigit()) and _NUMBER_CHARS.match(buf, pos).end() == n:
+                return INCOMPLETE, None
+        self._retry_at = 0
+        self._pos = end
+        return VALUE, value
+
+    def drain(self, max_tokens: Optional[int] = None) -> List[Token]:
+        """Tokenize buffered input, stopping after `max_tokens` if given."""
+        buf = self._buf
+        n = len(buf)
+        pos = self._pos
+        stack = self._stack
+        tokens: List[Token] = []
+        append = tokens.append
+
+        while max_tokens is None or len(tokens) < max_tokens:
+            pos = _WS.match(buf, pos).end()
+            if pos >= n:
+                break
+            c = buf[pos]
+            if c == '"':
+                m = _STRING.match(buf, pos)
+                if m is None:
+                    break  # string continues in the next chunk
+                raw = m.group()
+                pos = m.end()
+                text = json.loads(raw) if "\\" in raw else raw[1:-1]
+                if self._expect_key:
+                    self._expect_key = False
+                    append((KEY, text))
+                else:
+                    append((VALUE, text))
+            elif c == ",":
+                self._expect_key = bool(stack) and stack[-1] == "{"
+                pos += 1
+            elif c == ":":
+                pos += 1
+            elif c == "{":
+                stack.append("{")
+                self._expect_key = True
+                pos += 1
+                append((START_OBJECT, None))
+            elif c == "[":
+                stack.append("[")
+                pos += 1
+                append((START_ARRAY, None))
+            elif c in _CLOSERS:
+                opener, kind = _CLOSERS[c]
+                if not stack or stack.pop() != opener:
+                    raise ValueError(
+                        f"Unexpected {c!r} at offset {self.consumed + pos}"
+                    )
+                self._expect_key = False
+                pos += 1
+                append((kind, None))
+            elif c == "-" or c.isdigit():
+                m = _NUMBER_CHARS.match(buf, pos)
+                if m.end() == n and not self._eof:
+                    break  # more digits may follow in the next chunk
+                text = m.group()
+                if not _NUMBER.fullmatch(text):
+                    raise ValueError(f"Invalid number at offset {self.consumed + pos}")
+                pos = m.end()
+                if "." in text or "e" in text or "E" in text:
+                    append((VALUE, float(text)))
+                else:
+                    append((VALUE, int(text)))
+            elif c in _LITERALS:
+                word, value = _LITERALS[c]
+                if buf.startswith(word, pos):
+                    pos += len(word)
+                    append((VALUE, value))
+                elif (
+                    not self._eof and n - pos < len(word) and word.startswith(buf[pos:])
+                ):
+                    break
+                else:
+                    raise ValueError(f"Invalid literal at offset {self.consumed + pos}")
+            else:
+                raise ValueError(f"Unexpected {c!r} at offset {self.consumed + pos}")
+
+        self._pos = pos
+        return tokens
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON pointer ("/albums/items") into unescaped keys."""
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSON pointer must start with '/': {pointer!r}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer[1:].split("/")]
+
+
+class _Builder:
+    """Assembles one container value from tokens."""
+
+    def __init__(self, kind: str):
+        self.value: Any = {} if kind == START_OBJECT else []
+        self._stack: List[Any] = [self.value]
+        self._keys: List[Optional[str]] = [None]
+
+    def add(self, kind: str, value: Any) -> bool:
+        """Consume a token; return True once the root container is closed."""
+        if kind == KEY:
+            self._keys[-1] = value
+            return False
+        if kind == END_OBJECT or kind == END_ARRAY:
+            self._stack.pop()
+            self._keys.pop()
+            return not self._stack
+        if kind == START_OBJECT:
+            value = {}
+        elif kind == START_ARRAY:
+            value = []
+        parent = self._stack[-1]
+        if isinstance(parent, dict):
+            parent[self._keys[-1]] = value
+        else:
+            parent.append(value)
+        if kind == START_OBJECT or kind == START_ARRAY:
+            self._stack.append(value)
+            self._keys.append(None)
+        return False
+
+
+class JSONItemStream:
+    """
+    Push parser yielding the elements of the array found at `pointer`, one at a
+    time. A pointer to a non-array value yields that single value. Parsing stops
+    (`done`) as soon as the target has been fully read.
+    """
+
+    def __init__(self, pointer: str = ""):
+        self.pointer = pointer
+        self._target = parse_pointer(pointer)
+        self._tokenizer = JSONTokenizer()
+        # One entry per open container: the current key for objects, None for arrays
+        self._path: List[Optional[str]] = []
+        self._items_depth: Optional[int] = None
+        self._builder: Optional[_Builder] = None
+        self._single = False
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        if self.done:
+            return []
+        self._tokenizer.push(chunk)
+        return self._run()
+
+    def close(self) -> List[Any]:
+        if self.done:
+            return []
+        self._tokenizer.end()
+        items = self._run()
+        if not self.done:
+            self._tokenizer.check_complete()
+            raise KeyError(f"JSON pointer {self.pointer!r} not found in response")
+        return items
+
+    def _run(self) -> List[Any]:
+        items: List[Any] = []
+        tokenizer = self._tokenizer
+        while not self.done:
+            in_items = (
+                self._items_depth is not None
+                and self._builder is None
+                and len(self._path) == self._items_depth
+            )
+            if in_items:
+                # Fast path: decode whole elements straight from the buffer
+                status, value = tokenizer.decode_value()
+                if status == VALUE:
+                    items.append(value)
+                    continue
+                if status == INCOMPLETE:
+                    break
+            # Step one token at a time so the fast path kicks in on time
+            tokens = tokenizer.drain(1)
+            if not tokens:
+                break
+            items.extend(self._process(tokens))
+        return items
+
+    def _process(self, tokens: List[Token]) -> List[Any]:
+        items: List[Any] = []
+        path = self._path
+        for kind, value in tokens:
+            if self._builder is not None:
+                if self._builder.add(kind, value):
+                    items.append(self._builder.value)
+                    self._builder = None
+                    if self._single:
+                        self.done = True
+                        break
+                continue
+
+            if kind == KEY:
+                path[-1] = value
+                continue
+            if kind == END_OBJECT or kind == END_ARRAY:
+                path.pop()
+                if self._items_depth is not None and len(path) < self._items_depth:
+                    self.done = True
+                    break
+                continue
+
+            # A value starts here: a scalar or the opening of a container
+            if self._items_depth is not None and len(path) == self._items_depth:
+                if kind == VALUE:
+                    items.append(value)
+                else:
+                    self._builder = _Builder(kind)
+                continue
+            if self._items_depth is None and path == self._target:
+                if kind == START_ARRAY:
+                    path.append(None)
+                    self._items_depth = len(path)
+                elif kind == VALUE:
+                    items.append(value)
+                    self.done = True
+                    break
+                else:
+                    self._single = True
+                    self._builder = _Builder(kind)
+                continue
+            if kind != VALUE:
+                path.append(None)
+        return items
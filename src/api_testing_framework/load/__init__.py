@@ -0,0 +1,22 @@
+"""
+Open-loop load generation that reuses the functional clients as scenarios.
+See runner.py for the scheduling model and cli.py for the command line.
+"""
+
+from api_testing_framework.load.runner import LoadReport, run_async, run_load
+from api_testing_framework.load.scenario import (
+    LoadProfile,
+    LoadSuite,
+    Scenario,
+    load_suite,
+)
+
+__all__ = [
+    "LoadProfile",
+    "LoadReport",
+    "LoadSuite",
+    "Scenario",
+    "load_suite",
+    "run_async",
+    "run_load",
+]
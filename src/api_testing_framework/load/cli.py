@@ -0,0 +1,86 @@
+"""
+Run a LoadSuite from the command line, e.g.
+
+    python -m api_testing_framework.load api_testing_framework.load.spotify \
+        --rps 20 --ramp-up 10 --duration 60 --processes 2 --json load.json
+"""
+
+import argparse
+import json
+import logging
+from typing import List, Optional
+
+from api_testing_framework.load.runner import run_load
+from api_testing_framework.load.scenario import LoadProfile
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m api_testing_framework.load",
+        description="Run weighted scenarios open-loop at a target rate.",
+    )
+    parser.add_argument(
+        "suite",
+        help="LoadSuite to run as 'package.module[:attribute]' (default SUITE)",
+    )
+    parser.add_argument(
+        "--rps", type=float, required=True, help="Steady-state scenarios per second"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="Steady phase in seconds"
+    )
+    parser.add_argument(
+        "--ramp-up", type=float, default=0.0, help="Linear ramp-up in seconds"
+    )
+    parser.add_argument(
+        "--processes", type=int, default=1, help="Worker processes sharing the rate"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=32,
+        help="Threads per process for synchronous scenarios",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="Drop arrivals beyond this many unfinished scenarios per process",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=None,
+        help="Exit with status 1 if the error rate (dropped arrivals included) "
+        "is higher",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Per-request INFO lines would swamp the report at load-test rates
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    profile = LoadProfile(
+        rate=args.rps,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        threads=args.threads,
+        max_in_flight=args.max_in_flight,
+        seed=args.seed,
+    )
+    report = run_load(args.suite, profile, processes=args.processes)
+    print("\n".join(report.format()))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+
+    if args.max_error_rate is not None:
+        phases = report.summary().values()
+        total = report.dropped + sum(s["count"] for p in phases for s in p.values())
+        errors = report.dropped + sum(s["errors"] for p in phases for s in p.values())
+        if total and errors / total > args.max_error_rate:
+            return 1
+    return 0
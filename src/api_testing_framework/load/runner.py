@@ -0,0 +1,253 @@
+"""
+Open-loop load runner.
+
+Each process runs one asyncio loop that starts scenarios at their scheduled
+times without waiting for earlier ones to finish. Latency is measured from
+the scheduled start, not the actual one, so a slow system cannot hide its
+latency by slowing the send rate (coordinated omission). Processes take
+interleaved slices of one global schedule and their histograms are merged.
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any, Dict, List, Union
+
+from api_testing_framework.load.scenario import (
+    PHASES,
+    LoadProfile,
+    LoadSuite,
+    Scenario,
+    load_suite,
+)
+from api_testing_framework.metrics import (
+    EndpointStats,
+    LatencyRecorder,
+    format_summary,
+)
+from api_testing_framework.timing import subscribe
+
+# Leave the workers a moment to import the suite before the schedule starts
+PROCESS_START_DELAY = 1.0
+
+
+@dataclass
+class LoadReport:
+    """
+    Scenario latencies per phase, request latencies per endpoint, and the
+    arrivals that were dropped because max_in_flight was reached.
+    """
+
+    profile: LoadProfile
+    phases: Dict[str, Dict[str, EndpointStats]] = field(default_factory=dict)
+    endpoints: Dict[str, EndpointStats] = field(default_factory=dict)
+    dropped: int = 0
+    max_lag: float = 0.0
+
+    def scenario_stats(self, phase: str, name: str) -> EndpointStats:
+        by_name = self.phases.setdefault(phase, {})
+        if name not in by_name:
+            by_name[name] = EndpointStats()
+        return by_name[name]
+
+    def merge(self, other: "LoadReport") -> None:
+        for phase, by_name in other.phases.items():
+            for name, stats in by_name.items():
+                self.scenario_stats(phase, name).merge(stats)
+        for key, stats in other.endpoints.items():
+            if key in self.endpoints:
+                self.endpoints[key].merge(stats)
+            else:
+                self.endpoints[key] = stats
+        self.dropped += other.dropped
+        self.max_lag = max(self.max_lag, other.max_lag)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        out = {}
+        for phase in PHASES:
+            seconds = self.profile.phase_seconds(phase)
+            by_name = self.phases.get(phase, {})
+            out[phase] = {
+                name: {
+                    **stats.summary(),
+                    "rps": stats.histogram.count / seconds if seconds else 0.0,
+                }
+                for name, stats in sorted(by_name.items())
+            }
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dropped": self.dropped,
+            "max_lag_ms": self.max_lag * 1000,
+            "phases": self.summary(),
+            "endpoints": {k: s.summary() for k, s in sorted(self.endpoints.items())},
+            "histograms": {
+                phase: {name: s.to_dict() for name, s in by_name.items()}
+                for phase, by_name in self.phases.items()
+            },
+            "endpoint_histograms": {k: s.to_dict() for k, s in self.endpoints.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, profile: LoadProfile, data: Dict[str, Any]) -> "LoadReport":
+        return cls(
+            profile=profile,
+            phases={
+                phase: {n: EndpointStats.from_dict(d) for n, d in by_name.items()}
+                for phase, by_name in data["histograms"].items()
+            },
+            endpoints=LatencyRecorder.from_dict(data["endpoint_histograms"]),
+            dropped=data["dropped"],
+            max_lag=data["max_lag_ms"] / 1000,
+        )
+
+    def format(self) -> List[str]:
+        lines = []
+        for phase, by_name in self.summary().items():
+            if not by_name:
+                continue
+            rps = sum(s["rps"] for s in by_name.values())
+            lines.append(f"{phase} ({rps:.1f} scenarios/s achieved)")
+            lines += format_summary(by_name, label="scenario")
+            lines.append("")
+        if self.endpoints:
+            lines.append("requests by endpoint")
+            lines += format_summary(
+                {k: s.summary() for k, s in sorted(self.endpoints.items())}
+            )
+            lines.append("")
+        lines.append(
+            f"dropped arrivals: {self.dropped}, "
+            f"max dispatch lag: {self.max_lag * 1000:.1f} ms"
+        )
+        return lines
+
+
+async def _close(client: Any) -> None:
+    if hasattr(client, "aclose"):
+        await client.aclose()
+    elif hasattr(client, "close"):
+        client.close()
+
+
+async def _invoke(
+    scenario: Scenario,
+    client: Any,
+    due: float,
+    stats: EndpointStats,
+    executor: ThreadPoolExecutor,
+) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        if inspect.iscoroutinefunction(scenario.fn):
+            await scenario.fn(client)
+        else:
+            await loop.run_in_executor(executor, scenario.fn, client)
+    except Exception:
+        stats.errors += 1
+    stats.histogram.record(loop.time() - due)
+
+
+async def run_async(
+    suite: LoadSuite,
+    profile: LoadProfile,
+    *,
+    worker: int = 0,
+    workers: int = 1,
+    start_at: float = 0.0,
+) -> LoadReport:
+    """
+    Run this process's share (every `workers`-th arrival, offset `worker`) of
+    the profile's schedule. `start_at` is the wall-clock start of the
+    schedule; 0 starts now.
+    """
+    loop = asyncio.get_running_loop()
+    report = LoadReport(profile)
+    recorder = LatencyRecorder()
+    rng = Random(profile.seed + worker)
+    weights = [s.weight for s in suite.scenarios]
+    executor = ThreadPoolExecutor(profile.threads, thread_name_prefix="load")
+    in_flight: set = set()
+    client = suite.client_factory()
+    unsubscribe = subscribe(recorder)
+    origin = loop.time()
+    if start_at:
+        origin += max(0.0, start_at - time.time())
+    try:
+        for index, (phase, offset) in enumerate(profile.arrivals()):
+            if index % workers != worker:
+                continue
+            due = origin + offset
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            report.max_lag = max(report.max_lag, loop.time() - due)
+            if len(in_flight) >= profile.max_in_flight:
+                report.dropped += 1
+                continue
+            scenario = rng.choices(suite.scenarios, weights)[0]
+            task = loop.create_task(
+                _invoke(
+                    scenario,
+                    client,
+                    due,
+                    report.scenario_stats(phase, scenario.name),
+                    executor,
+                )
+            )
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+    finally:
+        unsubscribe()
+        executor.shutdown(wait=True)
+        await _close(client)
+    report.endpoints = recorder.endpoints
+    return report
+
+
+def _run_worker(
+    spec: str, profile: LoadProfile, worker: int, workers: int, start_at: float
+) -> Dict[str, Any]:
+    report = asyncio.run(
+        run_async(
+            load_suite(spec),
+            profile,
+            worker=worker,
+            workers=workers,
+            start_at=start_at,
+        )
+    )
+    return report.to_dict()
+
+
+def run_load(
+    suite: Union[str, LoadSuite], profile: LoadProfile, processes: int = 1
+) -> LoadReport:
+    """
+    Run `suite` (a LoadSuite, or a "module:attribute" spec) against the
+    profile. With processes > 1 the suite must be given as a spec, so every
+    worker process can import it.
+    """
+    if processes <= 1:
+        if isinstance(suite, str):
+            suite = load_suite(suite)
+        return asyncio.run(run_async(suite, profile))
+    if not isinstance(suite, str):
+        raise ValueError("Pass the suite as a 'module:attribute' spec to use processes")
+
+    start_at = time.time() + PROCESS_START_DELAY
+    report = LoadReport(profile)
+    with ProcessPoolExecutor(processes) as pool:
+        futures = [
+            pool.submit(_run_worker, suite, profile, worker, processes, start_at)
+            for worker in range(processes)
+        ]
+        for future in futures:
+            report.merge(LoadReport.from_dict(profile, future.result()))
+    return report
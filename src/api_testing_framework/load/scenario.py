@@ -0,0 +1,101 @@
+import importlib
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence, Tuple
+
+RAMP_UP = "ramp-up"
+STEADY = "steady"
+PHASES = (RAMP_UP, STEADY)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One unit of simulated user work: `fn(client)` is called with the suite's
+    client and may be a plain function (run on a worker thread) or a
+    coroutine function. Scenarios are picked in proportion to `weight`.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    weight: float = 1.0
+
+
+@dataclass
+class LoadSuite:
+    """
+    Scenarios plus the factory for the client they share within a process,
+    e.g. `SpotifyClient` or `lambda: APIClient(base_url=...)`. The client is
+    closed (close() or aclose()) when the run ends.
+    """
+
+    scenarios: Sequence[Scenario]
+    client_factory: Callable[[], Any]
+
+    def __post_init__(self):
+        if not self.scenarios:
+            raise ValueError("A LoadSuite needs at least one scenario")
+        if any(s.weight < 0 for s in self.scenarios) or not any(
+            s.weight for s in self.scenarios
+        ):
+            raise ValueError("Scenario weights must be >= 0 and not all zero")
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    Open-loop arrival schedule: requests start at fixed times whatever the
+    response times, ramping linearly from 0 to `rate` over `ramp_up` seconds
+    and then holding `rate` for `duration` seconds.
+
+    Args:
+        rate: Target scenario starts per second in the steady phase
+        duration: Length of the steady phase in seconds
+        ramp_up: Length of the ramp-up phase in seconds
+        threads: Worker threads per process for synchronous scenarios
+        max_in_flight: Arrivals beyond this many unfinished scenarios (per
+                       process) are dropped and counted, instead of queueing
+        seed: Seed for the weighted scenario choice
+    """
+
+    rate: float
+    duration: float
+    ramp_up: float = 0.0
+    threads: int = 32
+    max_in_flight: int = 1000
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"rate must be > 0, got {self.rate}")
+        if self.duration < 0 or self.ramp_up < 0:
+            raise ValueError("duration and ramp_up must be >= 0")
+
+    def phase_seconds(self, phase: str) -> float:
+        return self.ramp_up if phase == RAMP_UP else self.duration
+
+    def arrivals(self) -> Iterator[Tuple[str, float]]:
+        """Yield (phase, seconds since start) for every scheduled arrival."""
+        # During the ramp the k-th arrival is where rate * t^2 / (2 * ramp_up) == k
+        k = 0
+        while self.ramp_up:
+            t = math.sqrt(2 * self.ramp_up * k / self.rate)
+            if t >= self.ramp_up:
+                break
+            yield RAMP_UP, t
+            k += 1
+        for n in range(math.ceil(self.duration * self.rate)):
+            yield STEADY, self.ramp_up + n / self.rate
+
+
+def load_suite(spec: str) -> LoadSuite:
+    """
+    Import a LoadSuite from "package.module:attribute" (attribute defaults to
+    SUITE). The attribute may also be a callable returning the suite.
+    """
+    module_name, _, attr = spec.partition(":")
+    target = getattr(importlib.import_module(module_name), attr or "SUITE")
+    suite = target() if callable(target) else target
+    if not isinstance(suite, LoadSuite):
+        raise TypeError(f"{spec} is not a LoadSuite")
+    return suite
@@ -0,0 +1,48 @@
+"""
+Load suite built from the functional SpotifyClient helpers:
+
+    python -m api_testing_framework.load api_testing_framework.load.spotify --rps 5
+
+Set SPOTIFY_LOAD_ARTISTS to a comma-separated list of artist ids to spread
+the top-tracks scenario over other artists. With SPOTIFY_STUB=1 the suite runs
+against the in-process SpotifyStub (about 50 ms median latency, 1% errors)
+instead of the live API.
+"""
+
+import os
+from itertools import cycle
+
+from api_testing_framework.auth import SpotifyTokenProvider
+from api_testing_framework.load.scenario import LoadSuite, Scenario
+from api_testing_framework.spotify.client import SpotifyClient
+from api_testing_framework.spotify.stub import Behavior, SpotifyStub, lognormal
+
+DEFAULT_ARTISTS = "0TnOYISbd1XYRBk9myaseg,3TVXtAsR1Inumwj472S9r4"
+
+_artists = cycle(os.getenv("SPOTIFY_LOAD_ARTISTS", DEFAULT_ARTISTS).split(","))
+
+
+def new_releases(client: SpotifyClient) -> None:
+    client.get_new_releases(limit=20)
+
+
+def artist_top_tracks(client: SpotifyClient) -> None:
+    client.get_artist_top_tracks(next(_artists))
+
+
+def make_client() -> SpotifyClient:
+    if os.getenv("SPOTIFY_STUB"):
+        stub = SpotifyStub(Behavior(latency=lognormal(0.05, 0.5), error_rate=0.01))
+        return SpotifyClient(
+            transport=stub, token_provider=SpotifyTokenProvider(transport=stub)
+        )
+    return SpotifyClient(shared_pool=True)
+
+
+SUITE = LoadSuite(
+    scenarios=[
+        Scenario("new_releases", new_releases, weight=3),
+        Scenario("artist_top_tracks", artist_top_tracks, weight=1),
+    ],
+    client_factory=make_client,
+)
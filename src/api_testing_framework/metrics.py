@@ -0,0 +1,344 @@
+"""
+Latency aggregation by endpoint.
+
+LatencyHistogram is an HDR-style log-linear histogram: values are bucketed
+with a fixed relative precision, so memory is constant however many values
+are recorded, and two histograms merge exactly by adding their counts. That
+makes them safe to combine across pytest-xdist workers or stored runs.
+"""
+
+import re
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from api_testing_framework.timing import RequestTiming
+
+SUMMARY_PERCENTILES = (50, 90, 95, 99)
+
+# Path segments that identify a resource rather than a route
+_ID_SEGMENT = re.compile(
+    r"""^(?:
+        \d+                                     # numeric ids
+      | [0-9a-fA-F]{8}(?:-?[0-9a-fA-F]{4}){3}-?[0-9a-fA-F]{12}  # UUIDs
+      | [0-9a-zA-Z]{22}                         # Spotify ids, with or without digits
+      | (?=[0-9a-zA-Z]*\d)[0-9a-zA-Z]{16,}      # other base62 / hex ids
+    )$""",
+    re.VERBOSE,
+)
+
+
+def normalize_route(path: str) -> str:
+    """Replace id-like segments with "{id}", e.g. /artists/{id}/top-tracks."""
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("?", 1)[0].split("/")
+    )
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations in microseconds. Buckets are exact below
+    2**precision_bits µs and keep a relative error under 2**-(precision_bits-1)
+    above it; values beyond `max_seconds` are counted in the top bucket.
+    min, max and the sum are tracked exactly.
+
+    Args:
+        precision_bits: 7 gives <1.6% relative error in 1.7k buckets
+        max_seconds: Largest value tracked with full precision
+    """
+
+    def __init__(self, precision_bits: int = 7, max_seconds: float = 3600.0):
+        self.precision_bits = precision_bits
+        self.max_seconds = max_seconds
+        self._max_value = int(max_seconds * 1_000_000)
+        self.counts = array("Q", bytes(8 * (self._index(self._max_value) + 1)))
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _index(self, value: int) -> int:
+        p = self.precision_bits
+        if value < 1 << p:
+            return value
+        shift = value.bit_length() - p
+        return (
+            (1 << p) + (shift - 1) * (1 << (p - 1)) + (value >> shift) - (1 << (p - 1))
+        )
+
+    def _highest_value(self, index: int) -> int:
+        """Largest value that lands in bucket `index`."""
+        p = self.precision_bits
+        if index < 1 << p:
+            return index
+        shift, offset = divmod(index - (1 << p), 1 << (p - 1))
+        shift += 1
+        mantissa = offset + (1 << (p - 1))
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        self.counts[self._index(min(value, self._max_value))] += 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def percentile(self, p: float) -> float:
+        """Value in seconds at or below which `p` percent of values fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * p // 100))  # ceil, at least the first value
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                value = min(self._highest_value(index), self.max_us)
+                return max(value, self.min_us or 0) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def _check_compatible(self, other: "LatencyHistogram") -> None:
+        if (other.precision_bits, other.max_seconds) != (
+            self.precision_bits,
+            self.max_seconds,
+        ):
+            raise ValueError("Cannot merge histograms with different layouts")
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add `other`'s values to this histogram in place; returns self."""
+        self._check_compatible(other)
+        for index, n in enumerate(other.counts):
+            if n:
+                self.counts[index] += n
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = (
+                other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            )
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form; only non-empty buckets are listed."""
+        return {
+            "precision_bits": self.precision_bits,
+            "max_seconds": self.max_seconds,
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "counts": {str(i): n for i, n in enumerate(self.counts) if n},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        hist = cls(data["precision_bits"], data["max_seconds"])
+        for index, n in data["counts"].items():
+            hist.counts[int(index)] = n
+        hist.count = data["count"]
+        hist.total_us = data["total_us"]
+        hist.min_us = data["min_us"]
+        hist.max_us = data["max_us"]
+        return hist
+
+    def summary(self) -> Dict[str, float]:
+        """Count plus mean, percentiles and max in milliseconds."""
+        out: Dict[str, float] = {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 3),
+        }
+        for p in SUMMARY_PERCENTILES:
+            out[f"p{p}_ms"] = round(self.percentile(p) * 1000, 3)
+        out["max_ms"] = self.max_us / 1000
+        return out
+
+
+class EndpointStats:
+    """Latency histogram and error count for one method + route."""
+
+    def __init__(self, histogram: Optional[LatencyHistogram] = None, errors: int = 0):
+        self.histogram = histogram or LatencyHistogram()
+        self.errors = errors
+
+    @property
+    def error_rate(self) -> float:
+        count = self.histogram.count
+        return self.errors / count if count else 0.0
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"errors": self.errors, "histogram": self.histogram.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointStats":
+        return cls(LatencyHistogram.from_dict(data["histogram"]), data["errors"])
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            **self.histogram.summary(),
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+        }
+
+
+class LatencyRecorder:
+    """
+    Thread-safe EndpointStats per "METHOD /route", fed from RequestTimings
+    (see timing.subscribe). Responses with status >= 400 count as errors.
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        path = re.sub(r"^[a-z][a-z0-9+.-]*://[^/]*", "", url, flags=re.IGNORECASE)
+        return f"{method} {normalize_route(path or '/')}"
+
+    def __call__(self, timing: RequestTiming) -> None:
+        self.record(timing)
+
+    def record(self, timing: RequestTiming) -> None:
+        key = self.endpoint_key(timing.method, timing.url)
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats()
+            stats.histogram.record(timing.total)
+            if timing.status_code is None or timing.status_code >= 400:
+                stats.errors += 1
+
+    def merge(self, other: Dict[str, EndpointStats]) -> None:
+        with self._lock:
+            for key, stats in other.items():
+                if key in self.endpoints:
+                    self.endpoints[key].merge(stats)
+                else:
+                    self.endpoints[key] = stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {key: s.to_dict() for key, s in sorted(self.endpoints.items())}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> Dict[str, EndpointStats]:
+        return {key: EndpointStats.from_dict(d) for key, d in data.items()}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {key: s.summary() for key, s in sorted(self.endpoints.items())}
+
+    def combined(self) -> EndpointStats:
+        """All endpoints folded into one EndpointStats."""
+        total = EndpointStats()
+        with self._lock:
+            for stats in self.endpoints.values():
+                total.merge(stats)
+        return total
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric of one endpoint (or test) that exceeded its allowed limit."""
+
+    endpoint: str
+    metric: str
+    current: float
+    limit: float
+    baseline: Optional[float] = None
+
+    def __str__(self) -> str:
+        text = f"{self.endpoint}: {self.metric} {self.current:.3f} > {self.limit:.3f}"
+        if self.baseline is not None:
+            text += f" (baseline {self.baseline:.3f})"
+        return text
+
+
+def compare_to_baseline(
+    current: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    *,
+    tolerance: float = 0.2,
+    min_delta_ms: float = 5.0,
+    error_rate_tolerance: float = 0.05,
+    min_samples: int = 5,
+    metric: str = "p95_ms",
+) -> List[Regression]:
+    """
+    Compare summaries (LatencyRecorder.summary() or a saved summary's
+    "endpoints") endpoint by endpoint. Latency regresses when it exceeds the
+    baseline by more than `tolerance` (relative) plus `min_delta_ms`, which
+    keeps sub-millisecond noise from failing runs; the error rate when it
+    rises by more than `error_rate_tolerance`. Endpoints with fewer than
+    `min_samples` requests in either run, or missing from one, are skipped.
+    """
+    regressions = []
+    for key, now in current.items():
+        base = baseline.get(key)
+        if base is None or min(now["count"], base["count"]) < min_samples:
+            continue
+        limit = base[metric] * (1 + tolerance) + min_delta_ms
+        if now[metric] > limit:
+            regressions.append(
+                Regression(key, metric, now[metric], limit, base[metric])
+            )
+        limit = base["error_rate"] + error_rate_tolerance
+        if now["error_rate"] > limit:
+            regressions.append(
+                Regression(
+                    key, "error_rate", now["error_rate"], limit, base["error_rate"]
+                )
+            )
+    return regressions
+
+
+def check_slo(
+    name: str, summary: Dict[str, float], **limits: float
+) -> List[Regression]:
+    """
+    Check one summary against absolute limits named like its keys, e.g.
+    p95_ms=300 or error_rate=0.01.
+    """
+    unknown = set(limits) - set(summary)
+    if unknown:
+        raise ValueError(f"Unknown latency limit(s): {sorted(unknown)}")
+    return [
+        Regression(name, metric, summary[metric], limit)
+        for metric, limit in limits.items()
+        if summary[metric] > limit
+    ]
+
+
+def format_summary(
+    summary: Dict[str, Dict[str, float]], label: str = "endpoint"
+) -> List[str]:
+    """Render a LatencyRecorder.summary() as aligned table lines."""
+    columns = ["count", "errors", "p50_ms", "p90_ms", "p99_ms", "max_ms"]
+    rows = [[label] + columns]
+    for key, stats in summary.items():
+        rows.append(
+            [key]
+            + [
+                f"{stats[c]:.0f}" if c in ("count", "errors") else f"{stats[c]:.1f}"
+                for c in columns
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return [
+        "  ".join(
+            [row[0].ljust(widths[0])]
+            + [cell.rjust(w) for cell, w in zip(row[1:], widths[1:])]
+        )
+        for row in rows
+    ]
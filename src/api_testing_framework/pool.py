@@ -0,0 +1,342 @@
+import asyncio
+import threading
+import weakref
+from typing import Dict, NamedTuple, Optional, Set, Tuple, Union
+
+import httpx
+
+from api_testing_framework.logger import logger
+
+VerifyTypes = Union[bool, str]
+
+# Same defaults as httpx; exposed so callers can derive larger pools from them
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+
+
+class PoolKey(NamedTuple):
+    """Identity of a shared pool: origin plus everything that changes the sockets."""
+
+    scheme: str
+    host: str
+    port: Optional[int]
+    verify: VerifyTypes
+    cert: Optional[Union[str, Tuple[str, str]]]
+    http2: bool
+    limits: Tuple[Optional[int], Optional[int], Optional[float]]
+
+
+class _PoolEntry:
+    def __init__(self, transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]):
+        self.transport = transport
+        self.refs = 0
+        # Bumped whenever the last lease goes, so a stale idle close is ignored
+        self.generation = 0
+
+
+def _idle_timeout(key: PoolKey, idle_timeout: Optional[float]) -> float:
+    if idle_timeout is not None:
+        return idle_timeout
+    keepalive_expiry = key.limits[2]
+    return (
+        DEFAULT_LIMITS.keepalive_expiry
+        if keepalive_expiry is None
+        else keepalive_expiry
+    )
+
+
+class SharedTransport(httpx.BaseTransport):
+    """
+    Lease on a registry-owned transport. Closing it (e.g. via httpx.Client.close)
+    only drops the reference; the pooled sockets stay open for other clients.
+    """
+
+    def __init__(
+        self, registry: "TransportRegistry", key: PoolKey, inner: httpx.BaseTransport
+    ):
+        self._registry = registry
+        self._key = key
+        self._inner = inner
+        self._released = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._inner.handle_request(request)
+
+    def close(self) -> None:
+        if not self._released:
+            self._released = True
+            self._registry._release(self._key)
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """
+    Async lease on a registry-owned transport. httpx's async pools belong to
+    the event loop that opened them, so the lease attaches to the pool of the
+    loop it first sends on; closing it only drops the reference.
+    """
+
+    def __init__(self, registry: "TransportRegistry", key: PoolKey):
+        self._registry = registry
+        self._key = key
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._entry: Optional[_PoolEntry] = None
+        self._released = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._entry is None:
+            self._loop = asyncio.get_running_loop()
+            self._entry = self._registry._acquire_on_loop(self._key, self._loop)
+        return await self._entry.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if not self._released:
+            self._released = True
+            if self._entry is not None:
+                await self._registry._release_on_loop(
+                    self._key, self._loop, self._entry
+                )
+
+
+class TransportRegistry:
+    """
+    Hands out one pooled httpx.HTTPTransport per origin + TLS settings, with
+    reference counting. When the last lease on a pool is released the pool
+    stays open for `idle_timeout` seconds (default: its keep-alive expiry,
+    after which its idle sockets would be dropped anyway), so short-lived
+    clients in a row reuse the same sockets; then it is closed.
+
+    Async clients lease with `acquire_async()` and share one
+    httpx.AsyncHTTPTransport per origin and event loop. An idle async pool is
+    closed on its loop, at the latest when asyncio.run() cancels the loop's
+    remaining tasks on exit.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._entries: Dict[PoolKey, _PoolEntry] = {}
+        # event loop -> {PoolKey: _PoolEntry}
+        self._async_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._closers: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def make_key(
+        base_url: str,
+        *,
+        verify: VerifyTypes = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ) -> PoolKey:
+        url = httpx.URL(base_url)
+        limits = limits or DEFAULT_LIMITS
+        return PoolKey(
+            scheme=url.scheme,
+            host=url.host,
+            port=url.port,
+            verify=verify,
+            cert=cert,
+            http2=http2,
+            limits=(
+                limits.max_connections,
+                limits.max_keepalive_connections,
+                limits.keepalive_expiry,
+            ),
+        )
+
+    def acquire(
+        self,
+        base_url: str,
+        *,
+        verify: VerifyTypes = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ) -> SharedTransport:
+        """
+        Return a lease on the shared transport for `base_url`'s origin,
+        creating the pool on first use.
+        """
+        key = self.make_key(
+            base_url, verify=verify, cert=cert, limits=limits, http2=http2
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                transport = httpx.HTTPTransport(
+                    verify=verify,
+                    cert=cert,
+                    limits=limits or DEFAULT_LIMITS,
+                    http2=http2,
+                )
+                entry = self._entries[key] = _PoolEntry(transport)
+            entry.refs += 1
+            return SharedTransport(self, key, entry.transport)
+
+    def acquire_async(
+        self,
+        base_url: str,
+        *,
+        verify: VerifyTypes = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ) -> AsyncSharedTransport:
+        """
+        Return an async lease for `base_url`'s origin. It takes its reference
+        on the running loop's pool (creating it) when it first sends.
+        """
+        key = self.make_key(
+            base_url, verify=verify, cert=cert, limits=limits, http2=http2
+        )
+        return AsyncSharedTransport(self, key)
+
+    def _acquire_on_loop(
+        self, key: PoolKey, loop: asyncio.AbstractEventLoop
+    ) -> _PoolEntry:
+        with self._lock:
+            pools = self._async_pools.setdefault(loop, {})
+            entry = pools.get(key)
+            if entry is None:
+                max_connections, max_keepalive, keepalive_expiry = key.limits
+                transport = httpx.AsyncHTTPTransport(
+                    verify=key.verify,
+                    cert=key.cert,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                    http2=key.http2,
+                )
+                entry = pools[key] = _PoolEntry(transport)
+            entry.refs += 1
+            return entry
+
+    def _release(self, key: PoolKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs == 0:
+                return
+            entry.refs -= 1
+            if entry.refs:
+                return
+            entry.generation += 1
+            generation = entry.generation
+        delay = _idle_timeout(key, self.idle_timeout)
+        if delay <= 0:
+            self._close_idle(key, entry, generation)
+            return
+        timer = threading.Timer(delay, self._close_idle, (key, entry, generation))
+        timer.daemon = True
+        timer.start()
+
+    def _close_idle(self, key: PoolKey, entry: _PoolEntry, generation: int) -> None:
+        with self._lock:
+            if entry.refs or entry.generation != generation:
+                return  # leased again since
+            if self._entries.get(key) is not entry:
+                return  # already closed by close_all()
+            del self._entries[key]
+        entry.transport.close()
+
+    async def _release_on_loop(
+        self, key: PoolKey, loop: asyncio.AbstractEventLoop, entry: _PoolEntry
+    ) -> None:
+        with self._lock:
+            if entry.refs == 0:
+                return
+            entry.refs -= 1
+            if entry.refs:
+                return
+            entry.generation += 1
+            generation = entry.generation
+        delay = _idle_timeout(key, self.idle_timeout)
+        if delay <= 0:
+            await self._aclose_idle(key, loop, entry, generation)
+            return
+        task = loop.create_task(
+            self._aclose_when_idle(key, loop, entry, generation, delay)
+        )
+        self._closers.add(task)
+        task.add_done_callback(self._closers.discard)
+
+    async def _aclose_when_idle(
+        self,
+        key: PoolKey,
+        loop: asyncio.AbstractEventLoop,
+        entry: _PoolEntry,
+        generation: int,
+        delay: float,
+    ) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Also runs when the loop shuts down and cancels this task
+            await self._aclose_idle(key, loop, entry, generation)
+
+    async def _aclose_idle(
+        self,
+        key: PoolKey,
+        loop: asyncio.AbstractEventLoop,
+        entry: _PoolEntry,
+        generation: int,
+    ) -> None:
+        with self._lock:
+            if entry.refs or entry.generation != generation:
+                return
+            pools = self._async_pools.get(loop, {})
+            if pools.get(key) is not entry:
+                return
+            del pools[key]
+        await entry.transport.aclose()
+
+    def refcount(self, key: PoolKey) -> int:
+        """Open sync leases on `key`, plus async ones that have sent a request."""
+        with self._lock:
+            entry = self._entries.get(key)
+            refs = entry.refs if entry else 0
+            for pools in self._async_pools.values():
+                if key in pools:
+                    refs += pools[key].refs
+            return refs
+
+    def __len__(self) -> int:
+        """Number of open pools, sync and async."""
+        with self._lock:
+            return len(self._entries) + sum(
+                len(pools) for pools in self._async_pools.values()
+            )
+
+    def close_all(self) -> None:
+        """Close every pooled transport; call once at session end."""
+        with self._lock:
+            entries, self._entries = self._entries, {}
+            # Async pools can only be closed on their own loop (aclose_all);
+            # any left are dropped together with that loop
+            self._async_pools.clear()
+        for key, entry in entries.items():
+            if entry.refs:
+                logger.debug(
+                    "Closing shared pool for %s://%s with %d open lease(s)",
+                    key.scheme,
+                    key.host,
+                    entry.refs,
+                )
+            entry.transport.close()
+
+    async def aclose_all(self) -> None:
+        """Close the async pools opened on the running event loop."""
+        with self._lock:
+            pools = self._async_pools.pop(asyncio.get_running_loop(), {})
+        for entry in pools.values():
+            await entry.transport.aclose()
+
+
+_registry = TransportRegistry()
+
+
+def get_registry() -> TransportRegistry:
+    """Return the process-wide transport registry."""
+    return _registry
@@ -0,0 +1,234 @@
+"""
+pytest plugin: per-endpoint request latency for the test session.
+
+Every request sent by a framework client is recorded by method and route
+template (see metrics.normalize_route). At the end of the session the plugin
+prints p50/p90/p99/max per endpoint and attaches the table to Allure;
+--latency-summary PATH also writes it as JSON. Under pytest-xdist each
+worker ships its histograms to the controller, which merges them before
+reporting; Allure attachments are per worker, since only workers run tests.
+
+Performance gates:
+
+* --latency-save-baseline PATH stores this run's summary as a baseline;
+  --latency-baseline PATH fails the session when an endpoint's p95 or error
+  rate regresses past the --latency-tolerance / --latency-error-tolerance
+  limits relative to that baseline.
+* @pytest.mark.latency(p95_ms=300) fails a test whose own requests exceed
+  the limits (any summary key: p50_ms ... max_ms, mean_ms, error_rate);
+  pass endpoint="GET /route" to only check one endpoint. A test with no
+  requests to judge fails too.
+
+Enable it from a conftest.py:
+
+    pytest_plugins = ["api_testing_framework.pytest_plugin"]
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import allure
+import pytest
+
+from api_testing_framework.metrics import (
+    LatencyRecorder,
+    Regression,
+    check_slo,
+    compare_to_baseline,
+    format_summary,
+)
+from api_testing_framework.timing import subscribe
+
+WORKER_OUTPUT_KEY = "api_testing_framework_latency"
+
+recorder_key = pytest.StashKey[LatencyRecorder]()
+regressions_key = pytest.StashKey[List[Regression]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency", "request latency summary")
+    group.addoption(
+        "--latency-summary",
+        metavar="PATH",
+        default="",
+        help="Write the per-endpoint latency summary as JSON to PATH",
+    )
+    group.addoption(
+        "--no-latency",
+        action="store_true",
+        default=False,
+        help="Do not record request latencies",
+    )
+    group.addoption(
+        "--latency-save-baseline",
+        metavar="PATH",
+        default=None,
+        help="Save this run's latency summary as a baseline to PATH",
+    )
+    group.addoption(
+        "--latency-baseline",
+        metavar="PATH",
+        default=None,
+        help="Fail the session if latency regresses against the baseline at PATH",
+    )
+    group.addoption(
+        "--latency-tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative p95 increase over the baseline (default: 0.2)",
+    )
+    group.addoption(
+        "--latency-min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Absolute p95 slack in ms on top of the tolerance (default: 5)",
+    )
+    group.addoption(
+        "--latency-error-tolerance",
+        type=float,
+        default=0.05,
+        help="Allowed absolute error-rate increase (default: 0.05)",
+    )
+    group.addoption(
+        "--latency-min-samples",
+        type=int,
+        default=5,
+        help="Skip endpoints with fewer requests than this (default: 5)",
+    )
+
+
+def get_recorder(config: pytest.Config) -> Optional[LatencyRecorder]:
+    """The session's LatencyRecorder, or None when recording is disabled."""
+    return config.stash.get(recorder_key, None)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "latency(p95_ms=None, ..., endpoint=None): fail the test if its requests "
+        "exceed the given latency percentiles (ms) or error_rate",
+    )
+    if config.getoption("no_latency"):
+        return
+    recorder = LatencyRecorder()
+    config.stash[recorder_key] = recorder
+    config.add_cleanup(subscribe(recorder))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _latency_summary_attachment(pytestconfig):
+    yield
+    recorder = get_recorder(pytestconfig)
+    summary = recorder.summary() if recorder is not None else {}
+    if summary:
+        allure.attach(
+            "\n".join(format_summary(summary)),
+            name="Latency summary",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("latency")
+    if marker is None:
+        return (yield)
+    limits = dict(marker.kwargs)
+    endpoint = limits.pop("endpoint", None)
+    recorder = LatencyRecorder()
+    unsubscribe = subscribe(recorder)
+    try:
+        result = yield
+    finally:
+        unsubscribe()
+
+    if endpoint is not None:
+        stats = recorder.endpoints.get(endpoint)
+        if stats is None:
+            pytest.fail(f"latency marker: no requests to {endpoint!r}", pytrace=False)
+    elif not recorder.endpoints:
+        pytest.fail("latency marker: the test made no requests", pytrace=False)
+    else:
+        stats = recorder.combined()
+    regressions = check_slo(endpoint or item.name, stats.summary(), **limits)
+    if regressions:
+        pytest.fail(
+            "Latency SLO exceeded:\n" + "\n".join(f"  {r}" for r in regressions),
+            pytrace=False,
+        )
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller: merge the histograms a worker collected."""
+    recorder = get_recorder(node.config)
+    data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if recorder is not None and data:
+        recorder.merge(LatencyRecorder.from_dict(data))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    recorder = get_recorder(config)
+    if recorder is None:
+        return
+    if hasattr(config, "workerinput"):  # xdist worker: report to the controller
+        config.workeroutput[WORKER_OUTPUT_KEY] = recorder.to_dict()
+        return
+
+    summary = recorder.summary()
+    if not summary:
+        return
+    histograms = recorder.to_dict()
+    report = {
+        "endpoints": {
+            key: {**stats, "histogram": histograms[key]["histogram"]}
+            for key, stats in summary.items()
+        }
+    }
+    for option in ("latency_summary", "latency_save_baseline"):
+        path = config.getoption(option)
+        if path:
+            _write_json(config.rootpath / path, report)
+
+    baseline_path = config.getoption("latency_baseline")
+    if baseline_path:
+        with open(config.rootpath / baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)["endpoints"]
+        regressions = compare_to_baseline(
+            summary,
+            baseline,
+            tolerance=config.getoption("latency_tolerance"),
+            min_delta_ms=config.getoption("latency_min_delta_ms"),
+            error_rate_tolerance=config.getoption("latency_error_tolerance"),
+            min_samples=config.getoption("latency_min_samples"),
+        )
+        config.stash[regressions_key] = regressions
+        if regressions and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def _write_json(path, data: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    recorder = get_recorder(config)
+    if recorder is None or hasattr(config, "workerinput"):
+        return
+    summary = recorder.summary()
+    if not summary:
+        return
+    terminalreporter.write_sep("-", "request latency (ms)")
+    for line in format_summary(summary):
+        terminalreporter.write_line(line)
+
+    regressions = config.stash.get(regressions_key, [])
+    if regressions:
+        terminalreporter.write_sep(
+            "!", "latency regressions against baseline", red=True
+        )
+        for regression in regressions:
+            terminalreporter.write_line(str(regression), red=True)
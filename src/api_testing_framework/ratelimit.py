@@ -0,0 +1,202 @@
+import asyncio
+import fnmatch
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from api_testing_framework.retry import parse_retry_after
+
+
+class TokenBucket:
+    """
+    Token bucket whose rate adapts to throttling. `reserve()` takes a token
+    and returns how long the caller must wait for it, so the lock is only held
+    for the arithmetic and callers queue up at evenly spaced times instead of
+    waking together.
+
+    On a 429 the rate is multiplied by `decrease` (down to `min_rate`) and a
+    Retry-After pause is charged as token debt; every success then adds
+    `recovery` tokens/s back until the configured rate is reached again.
+
+    Args:
+        rate: Sustained requests per second
+        burst: Bucket size, i.e. requests allowed back-to-back; defaults to
+               max(1, rate)
+        min_rate: Floor for the adaptive rate; defaults to 5% of `rate`
+        decrease: Factor applied to the rate on each 429
+        recovery: Rate added back per successful response; defaults to 5% of
+                  `rate`
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        min_rate: Optional[float] = None,
+        decrease: float = 0.5,
+        recovery: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.decrease = decrease
+        self.recovery = recovery if recovery is not None else rate * 0.05
+        self._clock = clock
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> float:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        return now
+
+    def reserve(self) -> float:
+        """Take one token; return the seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429: slow down and, if asked, pause everyone."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+    def succeeded(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+
+BucketFactory = Callable[[str, float, Optional[float]], TokenBucket]
+
+
+@dataclass(frozen=True)
+class RateRule:
+    """
+    Limit for requests whose "host/path" matches the fnmatch `pattern`, e.g.
+    "api.spotify.com/*" or "*/v1/search*". One bucket is shared by all
+    matching requests.
+    """
+
+    pattern: str
+    rate: float
+    burst: Optional[float] = None
+
+
+@dataclass
+class RateLimiterStats:
+    requests: int = 0
+    delayed: int = 0
+    waited_seconds: float = 0.0
+    throttled: int = 0
+
+
+class RateLimiter:
+    """
+    Client-side pacing for outgoing requests. Every request takes a token from
+    its host's bucket (when `per_host` is set) and from the bucket of each
+    matching RateRule, waiting for the slowest. Share one instance between
+    clients, threads and event loops to pace them together.
+
+    Args:
+        per_host: Requests per second allowed to each host; None for no
+                  host-wide limit
+        rules: Extra limits for endpoint patterns
+        burst: Bucket size for the per-host buckets
+        sleep: Sleep function for sync callers (tests can pass a recorder)
+        bucket_factory: Called as factory(name, rate, burst) to create each
+                        bucket, e.g. to share them between processes
+    """
+
+    def __init__(
+        self,
+        per_host: Optional[float] = None,
+        rules: Iterable[RateRule] = (),
+        *,
+        burst: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        bucket_factory: Optional[BucketFactory] = None,
+    ):
+        self.per_host = per_host
+        self.burst = burst
+        self.rules = tuple(rules)
+        self.sleep = sleep
+        self.stats = RateLimiterStats()
+        self._new_bucket = bucket_factory or (
+            lambda name, rate, burst: TokenBucket(rate, burst, clock=clock)
+        )
+        self._rule_buckets = [
+            self._new_bucket(f"rule:{rule.pattern}", rule.rate, rule.burst)
+            for rule in self.rules
+        ]
+        self._host_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def buckets_for(self, request: httpx.Request) -> List[TokenBucket]:
+        url = request.url
+        buckets = []
+        if self.per_host is not None:
+            with self._lock:
+                bucket = self._host_buckets.get(url.host)
+                if bucket is None:
+                    bucket = self._host_buckets[url.host] = self._new_bucket(
+                        f"host:{url.host}", self.per_host, self.burst
+                    )
+            buckets.append(bucket)
+        target = f"{url.host}{url.path}"
+        for rule, bucket in zip(self.rules, self._rule_buckets):
+            if fnmatch.fnmatchcase(target, rule.pattern):
+                buckets.append(bucket)
+        return buckets
+
+    def _reserve(self, request: httpx.Request) -> float:
+        wait = max((b.reserve() for b in self.buckets_for(request)), default=0.0)
+        with self._lock:
+            self.stats.requests += 1
+            if wait > 0:
+                self.stats.delayed += 1
+                self.stats.waited_seconds += wait
+        return wait
+
+    def acquire(self, request: httpx.Request) -> float:
+        """Block until `request` may be sent; return the seconds waited."""
+        wait = self._reserve(request)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    async def aacquire(self, request: httpx.Request) -> float:
+        """Async counterpart of acquire."""
+        wait = self._reserve(request)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def feedback(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Adapt the buckets of `request` to the server's answer."""
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            with self._lock:
+                self.stats.throttled += 1
+            for bucket in self.buckets_for(request):
+                bucket.throttled(retry_after)
+        elif response.is_success:
+            for bucket in self.buckets_for(request):
+                bucket.succeeded()
@@ -0,0 +1,72 @@
+import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import httpx
+
+Exchange = Tuple[httpx.Request, httpx.Response]
+
+
+def _body_size(request: httpx.Request, response: httpx.Response) -> int:
+    """Bytes the exchange keeps alive; streamed bodies are not retained."""
+    try:
+        size = len(request.content)
+    except httpx.RequestNotRead:
+        size = 0
+    try:
+        size += len(response.content)
+    except httpx.ResponseNotRead:
+        pass
+    return size
+
+
+class ExchangeRecorder:
+    """
+    Ring buffer of the most recent exchanges, bounded by count and body bytes.
+    Only references are stored; formatting and redaction happen when the
+    exchanges are attached, i.e. on the failure path only.
+
+    Limits default to ATTACH_HISTORY_SIZE (10) and ATTACH_HISTORY_BYTES (5 MiB).
+    The newest exchange is always kept, even if it alone exceeds the byte budget.
+    """
+
+    def __init__(
+        self, max_exchanges: Optional[int] = None, max_bytes: Optional[int] = None
+    ):
+        self.max_exchanges = max_exchanges or int(
+            os.getenv("ATTACH_HISTORY_SIZE", "10")
+        )
+        self.max_bytes = max_bytes or int(
+            os.getenv("ATTACH_HISTORY_BYTES", str(5 * 1024 * 1024))
+        )
+        self._items: Deque[Tuple[httpx.Request, httpx.Response, int]] = deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        size = _body_size(request, response)
+        with self._lock:
+            self._items.append((request, response, size))
+            self._bytes += size
+            while len(self._items) > 1 and (
+                len(self._items) > self.max_exchanges or self._bytes > self.max_bytes
+            ):
+                self._bytes -= self._items.popleft()[2]
+
+    def exchanges(self) -> List[Exchange]:
+        """Recorded exchanges, oldest first."""
+        with self._lock:
+            return [(req, resp) for req, resp, _ in self._items]
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
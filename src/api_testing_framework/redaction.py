@@ -0,0 +1,269 @@
+import fnmatch
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from api_testing_framework.jsonstream import (
+    END_ARRAY,
+    END_OBJECT,
+    KEY,
+    START_ARRAY,
+    START_OBJECT,
+    VALUE,
+    JSONTokenizer,
+)
+
+REDACTED = "***REDACTED***"
+TRUNCATED = "<truncated>"
+DEFAULT_REDACT_FIELDS = "access_token,password"
+DEFAULT_REDACT_HEADERS = "authorization,proxy-authorization,cookie,set-cookie"
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _is_glob(pattern: str) -> bool:
+    return not _GLOB_CHARS.isdisjoint(pattern)
+
+
+class Redactor:
+    """
+    Compiled redaction rules for JSON payloads and HTTP headers.
+
+    Field patterns are comma-separated in REDACT_FIELDS and come in three forms:
+        password          exact key, anywhere in the payload
+        *token*           glob on a single key, anywhere in the payload
+        user.credentials  dotted key path, matched against the trailing keys
+                          of the path (list levels are transparent); each
+                          segment may itself be a glob
+    """
+
+    def __init__(self, fields: Iterable[str] = (), headers: Iterable[str] = ()):
+        keys = set()
+        key_globs: List[str] = []
+        paths: List[Tuple[re.Pattern, ...]] = []
+        for pattern in fields:
+            pattern = pattern.strip()
+            if not pattern:
+                continue
+            segments = pattern.split(".")
+            if len(segments) > 1:
+                paths.append(
+                    tuple(re.compile(fnmatch.translate(seg)) for seg in segments)
+                )
+            elif _is_glob(pattern):
+                key_globs.append(fnmatch.translate(pattern))
+            else:
+                keys.add(pattern)
+
+        self._keys = frozenset(keys)
+        self._key_re: Optional[re.Pattern] = (
+            re.compile("|".join(key_globs)) if key_globs else None
+        )
+        self._paths = tuple(paths)
+        self._headers = frozenset(h.strip().lower() for h in headers if h and h.strip())
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._keys or self._key_re or self._paths)
+
+    @property
+    def tracks_paths(self) -> bool:
+        """True when rules need the parent keys, not just the key itself."""
+        return bool(self._paths)
+
+    def is_sensitive(self, key: str, parents: Tuple[str, ...] = ()) -> bool:
+        """Whether the value under `key` (nested below `parents`) is redacted."""
+        if key in self._keys:
+            return True
+        if self._key_re is not None and self._key_re.match(key):
+            return True
+        for segments in self._paths:
+            depth = len(segments) - 1
+            if depth > len(parents) or not segments[-1].match(key):
+                continue
+            tail = parents[len(parents) - depth :]
+            if all(seg.match(p) for seg, p in zip(segments, tail)):
+                return True
+        return False
+
+    def redact(self, obj: Any) -> Any:
+        """
+        Return `obj` with sensitive values replaced, in a single pass. Subtrees
+        without sensitive keys are returned as-is rather than copied, so the
+        result may share structure with the input.
+        """
+        if not self.enabled:
+            return obj
+        return self._redact(obj, () if self._paths else None)
+
+    def _redact(self, obj: Any, parents: Optional[Tuple[str, ...]]) -> Any:
+        # Hot loop: inline the exact-key check, which is what most rules are
+        keys = self._keys
+        slow = self._key_re is not None or parents is not None
+        if type(obj) is dict:
+            out = None
+            for k, v in obj.items():
+                if k in keys or (slow and self.is_sensitive(k, parents or ())):
+                    new = REDACTED
+                elif type(v) is dict or type(v) is list:
+                    new = self._redact(v, None if parents is None else parents + (k,))
+                    if new is v:
+                        continue
+                else:
+                    continue
+                if out is None:
+                    out = dict(obj)
+                out[k] = new
+            return obj if out is None else out
+        if type(obj) is list:
+            out = None
+            for i, v in enumerate(obj):
+                if type(v) is dict or type(v) is list:
+                    new = self._redact(v, parents)
+                    if new is not v:
+                        if out is None:
+                            out = list(obj)
+                        out[i] = new
+            return obj if out is None else out
+        return obj
+
+    def is_sensitive_header(self, name: str) -> bool:
+        return name.lower() in self._headers
+
+    def redact_headers(
+        self, headers: Iterable[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        """Replace the values of sensitive headers (case-insensitive names)."""
+        return [(k, REDACTED if k.lower() in self._headers else v) for k, v in headers]
+
+
+@lru_cache(maxsize=16)
+def compile_redactor(fields: str, headers: str) -> Redactor:
+    """Compile comma-separated field and header rules; cached per rule set."""
+    return Redactor(fields.split(","), headers.split(","))
+
+
+def get_redactor() -> Redactor:
+    """
+    Return the Redactor for the current REDACT_FIELDS / REDACT_HEADERS settings.
+    Rules are compiled once per distinct setting, so changing the environment
+    takes effect on the next call without recompiling on every payload.
+    """
+    return compile_redactor(
+        os.getenv("REDACT_FIELDS", DEFAULT_REDACT_FIELDS),
+        os.getenv("REDACT_HEADERS", DEFAULT_REDACT_HEADERS),
+    )
+
+
+class _Frame:
+    __slots__ = ("closer", "count", "key")
+
+    def __init__(self, closer: str, key: Optional[str]):
+        self.closer = closer
+        self.count = 0
+        self.key = key
+
+
+def redact_json_prefix(
+    text: str, max_chars: int, redactor: Redactor, chunk_size: int = 8192
+) -> Optional[str]:
+    """
+    Redact and pretty-print (indent=2) a JSON document while streaming it,
+    stopping once `max_chars` of output are produced. Open containers are then
+    closed, and the innermost gets a "<truncated>" entry, so the result is
+    always valid, redacted JSON. Input is read only as far as the budget needs,
+    so cost grows with `max_chars` rather than with the document. `text` may
+    itself be an incomplete prefix (e.g. a streamed body preview).
+
+    Returns None when the document is not a JSON object or array.
+
+    Raises:
+        ValueError: If the text is not valid JSON up to the cut
+    """
+    tokenizer = JSONTokenizer()
+    out: List[str] = []
+    size = 0
+    stack: List[_Frame] = []
+    key: Optional[str] = None
+    skip_depth = 0  # > 0 while dropping a redacted container
+    skip_value = False  # drop the next scalar/container (its key was redacted)
+    truncated = False
+
+    for start in range(0, len(text), chunk_size):
+        for kind, value in tokenizer.feed(text[start : start + chunk_size]):
+            if skip_depth:
+                if kind == START_OBJECT or kind == START_ARRAY:
+                    skip_depth += 1
+                elif kind == END_OBJECT or kind == END_ARRAY:
+                    skip_depth -= 1
+                continue
+            if skip_value:
+                skip_value = False
+                if kind == START_OBJECT or kind == START_ARRAY:
+                    skip_depth = 1
+                continue
+
+            if kind == END_OBJECT or kind == END_ARRAY:
+                frame = stack.pop()
+                if frame.count:
+                    piece = "\n" + "  " * len(stack) + frame.closer
+                else:
+                    piece = frame.closer
+                out.append(piece)
+                size += len(piece)
+                continue
+            if kind == KEY:
+                parents = (
+                    tuple(f.key for f in stack if f.key is not None)
+                    if redactor.tracks_paths
+                    else ()
+                )
+                if redactor.is_sensitive(value, parents):
+                    skip_value = True
+                    body = json.dumps(REDACTED)
+                else:
+                    key = value
+                    continue
+            elif kind == VALUE:
+                body = json.dumps(value)
+            else:
+                body = "{" if kind == START_OBJECT else "["
+
+            if not stack:
+                if kind == VALUE:
+                    return None
+                piece = body
+            else:
+                frame = stack[-1]
+                prefix = ",\n" if frame.count else "\n"
+                name = value if kind == KEY else key
+                label = json.dumps(name) + ": " if frame.closer == "}" else ""
+                piece = prefix + "  " * len(stack) + label + body
+            if stack and size + len(piece) > max_chars:
+                truncated = True
+                break
+            out.append(piece)
+            size += len(piece)
+            if stack:
+                stack[-1].count += 1
+            if kind == START_OBJECT or kind == START_ARRAY:
+                stack.append(_Frame("}" if kind == START_OBJECT else "]", key))
+            key = None
+        if truncated:
+            break
+
+    if not out:
+        return None
+    if stack:
+        # Budget reached (or the text was a prefix): mark the cut and close up
+        frame = stack[-1]
+        prefix = ",\n" if frame.count else "\n"
+        marker = f'"{TRUNCATED}": true' if frame.closer == "}" else f'"{TRUNCATED}"'
+        out.append(prefix + "  " * len(stack) + marker)
+        frame.count += 1
+        while stack:
+            frame = stack.pop()
+            out.append("\n" + "  " * len(stack) + frame.closer)
+    return "".join(out)
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from api_testing_framework.cache import request_key
+from api_testing_framework.codec import get_codec
+from api_testing_framework.redaction import get_redactor
+
+# File layout: MAGIC | index length (u64 LE) | JSON index | concatenated bodies
+MAGIC = b"ATF-CASSETTE\x01\n"
+_LENGTH = struct.Struct("<Q")
+
+REPLAY_MODES = ("once", "record", "replay")
+
+# Describe the stored (decoded, possibly re-encoded) body, not the original
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class CassetteMiss(KeyError):
+    """Raised in replay mode for a request the cassette has no exchange for."""
+
+
+def cassette_key(request: httpx.Request) -> str:
+    """
+    Index key of a request: method, normalized URL (see cache.request_key) and
+    a digest of the body, so POSTs with different payloads are told apart.
+    Credentials in headers are not part of the key.
+    """
+    method, url = request_key(request)
+    content = request.read()
+    digest = hashlib.sha256(content).hexdigest()[:16] if content else "-"
+    return f"{method} {url} {digest}"
+
+
+class _Exchange:
+    __slots__ = ("status", "headers", "body", "offset", "length")
+
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: Optional[bytes] = None,
+        offset: int = 0,
+        length: int = 0,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.offset = offset
+        self.length = length
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport that records real exchanges into a cassette file once and
+    serves them back offline afterwards. Pass it as `transport=` to APIClient,
+    SpotifyClient or their async variants (and to a SpotifyTokenProvider to
+    replay the token fetch too).
+
+    Modes (default: REPLAY_MODE, or "once"):
+        once    replay when the cassette exists, otherwise record it
+        record  always go to the network and rewrite the cassette
+        replay  never go to the network; unknown requests raise CassetteMiss
+
+    Recorded response bodies and headers pass through the configured
+    redaction rules before they are written. On replay the index is read into
+    a dict and the bodies stay memory-mapped, so opening a large cassette
+    costs only its index and each response copies just its own body. A
+    request recorded several times is answered with those responses in order,
+    then the last one repeats.
+
+    Args:
+        path: Cassette file
+        mode: One of REPLAY_MODES
+        transport: Transport used while recording; defaults to httpx's
+                   HTTPTransport / AsyncHTTPTransport
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        mode: Optional[str] = None,
+        transport: Optional[
+            Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+        ] = None,
+    ):
+        mode = mode or os.getenv("REPLAY_MODE", "once")
+        if mode not in REPLAY_MODES:
+            raise ValueError(
+                f"Unknown replay mode {mode!r}; choose from {REPLAY_MODES}"
+            )
+        self.path = os.fspath(path)
+        self.recording = mode == "record" or (
+            mode == "once" and not os.path.exists(self.path)
+        )
+        self._transport = transport
+        self._index: Dict[str, List[_Exchange]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._dirty = False
+        if not self.recording:
+            self._load()
+
+    # -- cassette file -------------------------------------------------------
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = self._mmap
+        if view[: len(MAGIC)] != MAGIC:
+            view.close()
+            self._mmap = None
+            raise ValueError(f"{self.path} is not a cassette file")
+        start = len(MAGIC) + _LENGTH.size
+        (index_size,) = _LENGTH.unpack_from(view, len(MAGIC))
+        base = start + index_size
+        for key, exchanges in json.loads(view[start:base]).items():
+            self._index[key] = [
+                _Exchange(status, [tuple(h) for h in headers], None, base + off, size)
+                for status, headers, off, size in exchanges
+            ]
+
+    def save(self) -> None:
+        """
+        Write the recorded exchanges to the cassette, atomically. Identical
+        bodies are stored once. Called by close() after recording.
+        """
+        with self._lock:
+            bodies: List[bytes] = []
+            offsets: Dict[bytes, int] = {}
+            size = 0
+            index = {}
+            for key, exchanges in self._index.items():
+                rows = []
+                for exchange in exchanges:
+                    body = exchange.body or b""
+                    if body not in offsets:
+                        offsets[body] = size
+                        bodies.append(body)
+                        size += len(body)
+                    rows.append(
+                        [exchange.status, exchange.headers, offsets[body], len(body)]
+                    )
+                index[key] = rows
+            self._dirty = False
+        header = json.dumps(index, separators=(",", ":")).encode()
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(header)))
+            f.write(header)
+            f.writelines(bodies)
+        os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self._index.values())
+
+    # -- record / replay -----------------------------------------------------
+
+    def _record(self, key: str, response: httpx.Response) -> None:
+        redactor = get_redactor()
+        headers = [
+            (k, v)
+            for k, v in redactor.redact_headers(response.headers.multi_items())
+            if k.lower() not in _DROPPED_HEADERS
+        ]
+        body = response.content
+        if redactor.enabled and "json" in response.headers.get("Content-Type", ""):
+            codec = get_codec()
+            try:
+                data = codec.loads(body)
+            except ValueError:
+                pass
+            else:
+                redacted = redactor.redact(data)
+                if redacted is not data:
+                    body = codec.dumps(redacted)
+        with self._lock:
+            self._index.setdefault(key, []).append(
+                _Exchange(response.status_code, headers, body)
+            )
+            self._dirty = True
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        key = cassette_key(request)
+        with self._lock:
+            exchanges = self._index.get(key)
+            if not exchanges:
+                raise CassetteMiss(f"No recorded exchange for {key} in {self.path}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        exchange = exchanges[min(served, len(exchanges) - 1)]
+        if exchange.body is not None:
+            body = exchange.body
+        else:
+            body = self._mmap[exchange.offset : exchange.offset + exchange.length]
+        return httpx.Response(
+            exchange.status, headers=exchange.headers, content=body, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.recording:
+            return self._replay(request)
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        response = self._transport.handle_request(request)
+        response.read()
+        self._record(cassette_key(request), response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.recording:
+            return self._replay(request)
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        await request.aread()
+        response = await self._transport.handle_async_request(request)
+        await response.aread()
+        self._record(cassette_key(request), response)
+        return response
+
+    def close(self) -> None:
+        """
+        Save the cassette if anything was recorded and close the recording
+        transport. Replay keeps working afterwards, so one instance can be
+        shared by several clients (and a token provider) that close it in
+        turn; the memory map is released with the object.
+        """
+        if self._dirty:
+            self.save()
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if self._dirty:
+            self.save()
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
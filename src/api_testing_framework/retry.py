@@ -0,0 +1,263 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple, Type, TypeVar
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    stop_after_attempt,
+)
+
+from api_testing_framework.exceptions import APIError
+
+T = TypeVar("T")
+
+# Throttling and server-side failures; other 4xx are deterministic
+RETRY_STATUSES = frozenset({429, *range(500, 600)})
+
+# Methods that are safe to repeat even if the server already acted on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Failures before the request was sent, so any method can be retried
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class RetryBudget:
+    """
+    Process-wide allowance for retries. Every logical request deposits `ratio`
+    tokens (up to `max_tokens`) and every retry spends one, so retries stay a
+    fraction of the traffic instead of multiplying it when a dependency is down.
+
+    Args:
+        ratio: Retries allowed per request on average, e.g. 0.2 = 20%
+        initial: Tokens available at start so early failures can still retry
+        max_tokens: Cap on saved-up tokens
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, initial: float = 10.0, max_tokens: float = 100.0
+    ):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(initial, max_tokens)
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.exhausted += 1
+            return False
+
+
+@dataclass
+class RetryStats:
+    calls: int = 0
+    retries: int = 0
+    gave_up: int = 0
+    budget_denied: int = 0
+    slept_seconds: float = 0.0
+    by_reason: Dict[str, int] = field(default_factory=dict)
+
+
+def _reason(exc: BaseException) -> str:
+    if isinstance(exc, APIError):
+        return str(exc.status_code)
+    return type(exc).__name__
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait in between.
+
+    Retries 429 and 5xx APIErrors and httpx transport errors (connect/read
+    timeouts, dropped connections); other errors are raised immediately.
+    Requests with a method outside `methods` (POST and PATCH by default) may
+    already have been applied, so they are only retried after connect errors.
+    Waits honour Retry-After when present, otherwise use exponential backoff
+    with full jitter. Each retry must also be paid for from the RetryBudget.
+
+    Args:
+        max_attempts: Total attempts including the first
+        backoff: Base wait in seconds, doubled per attempt before jitter
+        max_backoff: Upper bound for the backoff wait
+        max_retry_after: Give up rather than wait when the server asks for
+                         longer than this
+        statuses: Status codes that are retried
+        exceptions: Exception types that are retried
+        methods: Methods retried on any of the above; add e.g. "POST" to opt
+                 in for endpoints where repeating a write is safe
+        budget: Budget to draw from; defaults to the process-wide one
+        sleep: Sleep function for sync calls (tests can pass a no-op)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        max_retry_after: float = 60.0,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,),
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+        self.methods = frozenset(m.upper() for m in methods)
+        self.budget = budget if budget is not None else get_retry_budget()
+        self.sleep = sleep
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def retry_after(self, exc: BaseException) -> Optional[float]:
+        if isinstance(exc, APIError) and exc.headers:
+            return parse_retry_after(exc.headers.get("Retry-After"))
+        return None
+
+    def is_retryable(self, exc: BaseException, method: Optional[str] = None) -> bool:
+        """
+        Whether `exc` is worth retrying; pass the request `method` to apply the
+        idempotency rule.
+        """
+        if method is not None and method.upper() not in self.methods:
+            return isinstance(exc, CONNECT_ERRORS) and isinstance(exc, self.exceptions)
+        if isinstance(exc, APIError):
+            if exc.status_code not in self.statuses:
+                return False
+            delay = self.retry_after(exc)
+            return delay is None or delay <= self.max_retry_after
+        return isinstance(exc, self.exceptions)
+
+    def wait_seconds(self, attempt: int, exc: Optional[BaseException]) -> float:
+        """Wait before attempt `attempt + 1`, after `attempt` failures."""
+        delay = self.retry_after(exc) if exc is not None else None
+        if delay is not None:
+            # Never earlier than asked; spread a little so clients don't stampede
+            return delay + random.uniform(0, self.backoff)
+        cap = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def _should_retry(self, state: RetryCallState, method: Optional[str]) -> bool:
+        exc = state.outcome.exception()
+        if exc is None or not self.is_retryable(exc, method):
+            return False
+        if state.attempt_number >= self.max_attempts:
+            return True  # the stop condition gives up; nothing to pay for
+        if not self.budget.try_spend():
+            with self._lock:
+                self.stats.budget_denied += 1
+            return False
+        return True
+
+    def _wait(self, state: RetryCallState) -> float:
+        exc = state.outcome.exception() if state.outcome else None
+        return self.wait_seconds(state.attempt_number, exc)
+
+    def _before_sleep(self, state: RetryCallState) -> None:
+        reason = _reason(state.outcome.exception())
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.slept_seconds += state.next_action.sleep
+            self.stats.by_reason[reason] = self.stats.by_reason.get(reason, 0) + 1
+
+    def _retry_error_callback(self, state: RetryCallState):
+        # Attempts ran out while the error was still retryable
+        with self._lock:
+            self.stats.gave_up += 1
+        return state.outcome.result()
+
+    def _retry_args(self, method: Optional[str]) -> dict:
+        return dict(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self._wait,
+            retry=lambda state: self._should_retry(state, method),
+            before_sleep=self._before_sleep,
+            retry_error_callback=self._retry_error_callback,
+        )
+
+    def _start(self) -> None:
+        self.budget.deposit()
+        with self._lock:
+            self.stats.calls += 1
+
+    def call(
+        self,
+        fn: Callable[..., T],
+        *args,
+        request_method: Optional[str] = None,
+        **kwargs,
+    ) -> T:
+        """
+        Run `fn` under this policy. `request_method` is the HTTP method `fn`
+        sends, for the idempotency rule; None retries as if it were safe.
+        """
+        self._start()
+        retrying = Retrying(sleep=self.sleep, **self._retry_args(request_method))
+        return retrying(fn, *args, **kwargs)
+
+    async def acall(
+        self,
+        fn: Callable[..., Awaitable[T]],
+        *args,
+        request_method: Optional[str] = None,
+        **kwargs,
+    ) -> T:
+        """Run the coroutine function `fn` under this policy; see call()."""
+        self._start()
+        retrying = AsyncRetrying(**self._retry_args(request_method))
+        return await retrying(fn, *args, **kwargs)
+
+
+_budget = RetryBudget()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Return the process-wide retry budget."""
+    return _budget
+
+
+_default_policy = RetryPolicy()
+
+
+def get_default_retry_policy() -> RetryPolicy:
+    """Return the policy shared by clients that are not given one."""
+    return _default_policy
@@ -0,0 +1,251 @@
+"""
+Machine-local state shared between processes, e.g. pytest-xdist workers.
+
+State lives in small JSON files next to a lock file; every read-modify-write
+happens under an exclusive OS file lock, so no external service is needed.
+Files go to API_TESTING_SHARED_DIR, or by default to a per-run directory under
+the system temp dir keyed on xdist's PYTEST_XDIST_TESTRUNUID. Outside xdist
+nothing needs sharing, so each process gets a private temp directory that is
+removed when it exits; cached tokens never outlive the run that fetched them.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from api_testing_framework.ratelimit import RateLimiter, RateRule, TokenBucket
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+_private_dir: Optional[str] = None
+
+
+def _process_dir() -> str:
+    global _private_dir
+    if _private_dir is None:
+        _private_dir = tempfile.mkdtemp(prefix="api-testing-framework-")
+        atexit.register(shutil.rmtree, _private_dir, ignore_errors=True)
+    return _private_dir
+
+
+def shared_dir() -> str:
+    """Directory holding the shared state files, created on first use."""
+    path = os.getenv("API_TESTING_SHARED_DIR")
+    if not path:
+        run_id = os.getenv("PYTEST_XDIST_TESTRUNUID")
+        if not run_id:
+            return _process_dir()
+        path = os.path.join(tempfile.gettempdir(), "api-testing-framework", run_id)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def _digest(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()[:16]
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on `path` (created if missing)."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+class SharedJSON:
+    """A JSON object on disk, updated only inside `transaction()`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def read(self) -> Dict[str, Any]:
+        with file_lock(self.lock_path):
+            return self._read()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the current state under the lock; changes are written back when
+        the block exits without an exception.
+        """
+        with file_lock(self.lock_path):
+            state = self._read()
+            before = dict(state)
+            yield state
+            if state != before:
+                self._write(state)
+
+
+class SharedTokenCache:
+    """
+    Client-credentials tokens shared by every process on the machine, keyed by
+    client id (hashed; secrets are never written). The file is only readable
+    by the current user.
+
+    Args:
+        directory: Where to keep the cache; defaults to shared_dir()
+        margin: Seconds before expiry at which a cached token is considered
+                stale
+    """
+
+    def __init__(self, directory: Optional[str] = None, margin: float = 10.0):
+        self._store = SharedJSON(os.path.join(directory or shared_dir(), "tokens.json"))
+        self.margin = margin
+
+    def _valid(self, entry: Optional[dict], min_ttl: Optional[float]) -> bool:
+        ttl = self.margin if min_ttl is None else min_ttl
+        return bool(entry) and entry["expires_at"] - ttl > time.time()
+
+    def get(
+        self, key: str, min_ttl: Optional[float] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Return (token, expires_at) if a token is cached that stays valid for
+        at least `min_ttl` seconds (default: the cache's margin).
+        """
+        entry = self._store.read().get(_digest(key))
+        if not self._valid(entry, min_ttl):
+            return None
+        return entry["token"], entry["expires_at"]
+
+    def put(self, key: str, token: str, expires_in: float) -> float:
+        """Store a token; returns its absolute (epoch) expiry."""
+        expires_at = time.time() + expires_in
+        with self._store.transaction() as state:
+            state[_digest(key)] = {"token": token, "expires_at": expires_at}
+        return expires_at
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Tuple[str, float]],
+        min_ttl: Optional[float] = None,
+    ) -> Tuple[str, float]:
+        """
+        Return the cached (token, expires_at), calling `fetch` (which returns
+        (token, expires_in)) only if no process holds a fresh one. The lock is
+        held during the fetch so concurrent workers wait for it instead of
+        requesting tokens of their own.
+        """
+        digest = _digest(key)
+        with self._store.transaction() as state:
+            entry = state.get(digest)
+            if self._valid(entry, min_ttl):
+                return entry["token"], entry["expires_at"]
+            token, expires_in = fetch()
+            expires_at = time.time() + expires_in
+            state[digest] = {"token": token, "expires_at": expires_at}
+        return token, expires_at
+
+    def invalidate(self, key: str) -> None:
+        with self._store.transaction() as state:
+            state.pop(_digest(key), None)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    TokenBucket whose tokens, last refill time and adaptive rate live in a
+    shared file, so all processes using the same `name` draw from one budget.
+    Time is wall-clock because monotonic clocks are per process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        directory: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(rate, burst, clock=time.time, **kwargs)
+        self.name = name
+        path = os.path.join(directory or shared_dir(), f"bucket-{_digest(name)}.json")
+        self._store = SharedJSON(path)
+
+    @contextmanager
+    def _synced(self) -> Iterator[None]:
+        with self._store.transaction() as state:
+            if state:
+                self._tokens = state["tokens"]
+                self._last = state["last"]
+                self.rate = state["rate"]
+            yield
+            state.update(tokens=self._tokens, last=self._last, rate=self.rate)
+
+    def reserve(self) -> float:
+        with self._synced():
+            return super().reserve()
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        with self._synced():
+            super().throttled(retry_after)
+
+    def succeeded(self) -> None:
+        with self._synced():
+            super().succeeded()
+
+
+def shared_rate_limiter(
+    per_host: Optional[float] = None,
+    rules: Iterable[RateRule] = (),
+    *,
+    burst: Optional[float] = None,
+    directory: Optional[str] = None,
+) -> RateLimiter:
+    """RateLimiter whose buckets are shared by every process on the machine."""
+    return RateLimiter(
+        per_host,
+        rules,
+        burst=burst,
+        bucket_factory=partial(SharedTokenBucket, directory=directory),
+    )
+
+
+_token_cache: Optional[SharedTokenCache] = None
+
+
+def get_shared_token_cache() -> SharedTokenCache:
+    """Return the process-wide SharedTokenCache for the default directory."""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = SharedTokenCache()
+    return _token_cache
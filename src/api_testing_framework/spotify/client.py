@@ -1,17 +1,71 @@
+import asyncio
+import sys
+import threading
 import time
-from typing import Optional
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Deque, Iterator, Optional
 
 import httpx
 
-from api_testing_framework.auth import fetch_spotify_token
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.auth import (
+    AsyncSpotifyTokenProvider,
+    SpotifyTokenProvider,
+    get_token_provider,
+)
+from api_testing_framework.batch import check_concurrency
+from api_testing_framework.cache import ResponseCache
 from api_testing_framework.client import APIClient
 from api_testing_framework.config import get_settings
-from api_testing_framework.spotify.models import NewReleasesResponse, TopTracksResponse
+from api_testing_framework.logger import logger
+from api_testing_framework.ratelimit import RateLimiter
+from api_testing_framework.retry import RetryPolicy
+from api_testing_framework.shared import SharedTokenCache
+from api_testing_framework.spotify.models import (
+    Album,
+    NewReleasesResponse,
+    PagingAlbums,
+    TopTracksResponse,
+)
+
+# Stop using a token this many seconds before it expires
+TOKEN_EXPIRY_MARGIN = 10.0
+
+NEW_RELEASES_PATH = "/browse/new-releases"
+# Largest `limit` Spotify accepts on paged endpoints
+MAX_PAGE_SIZE = 50
+
+
+def _check_page_size(page_size: int) -> None:
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be 1-{MAX_PAGE_SIZE}, got {page_size}")
+
+
+def _remaining_offsets(page: PagingAlbums, max_items: Optional[int]) -> range:
+    """Offsets of the pages after `page`, as far as `total` and `max_items` go."""
+    end = page.total if max_items is None else min(page.total, max_items)
+    return range(page.offset + page.limit, end, page.limit)
+
+
+def _refresh_in_background(client_ref: "weakref.ref[SpotifyClient]") -> None:
+    client = client_ref()
+    if client is not None:
+        client._refresh_token_ahead()
 
 
 class SpotifyClient(APIClient):
     """
-    Spotify-specific client: handles OAuth and endpoint helpers
+    Spotify-specific client: handles OAuth and endpoint helpers.
+
+    Without a static token, none is fetched until the first request. After
+    that a background timer renews it `refresh_ahead` seconds before expiry,
+    so no request has to wait for the token endpoint; if that refresh fails,
+    the next request after expiry refreshes inline.
+
+    Tokens come from `token_provider`, by default the process-wide
+    SpotifyTokenProvider that keeps a pooled connection to the accounts host.
     """
 
     def __init__(
@@ -20,35 +74,107 @@ class SpotifyClient(APIClient):
         token: Optional[str] = None,
         timeout: float = 10.0,
         transport: Optional[httpx.BaseTransport] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        shared_pool: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_cache: Optional[SharedTokenCache] = None,
+        refresh_ahead: Optional[float] = 60.0,
+        token_provider: Optional[SpotifyTokenProvider] = None,
     ):
         cfg = get_settings()
         actual_base = base_url or cfg.spotify_api_base_url
 
-        if token:
-            init_token = token
-            expires_at = float("inf")
-        else:
-            init_token, expires_in = fetch_spotify_token(
-                cfg.spotify_client_id,
-                cfg.spotify_client_secret,
-            )
-            expires_at = time.time() + expires_in - 10
-
         super().__init__(
-            base_url=actual_base, token=init_token, timeout=timeout, transport=transport
+            base_url=actual_base,
+            token=token,
+            timeout=timeout,
+            transport=transport,
+            limits=limits,
+            http2=http2,
+            shared_pool=shared_pool,
+            cache=cache,
+            coalesce=coalesce,
+            retry=retry,
+            rate_limiter=rate_limiter,
         )
 
-        self._token_expires_at = expires_at
+        self._token_expires_at = float("inf") if token else 0.0
+        self._token_lock = threading.Lock()
+        self._token_cache = token_cache
+        self._token_provider = token_provider or get_token_provider()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self.refresh_ahead = refresh_ahead
         self._cfg = cfg
 
-    def _refresh_token_if_needed(self):
-        if time.time() >= self._token_expires_at:
-            self._token, expires_in = fetch_spotify_token(
-                self._cfg.spotify_client_id,
-                self._cfg.spotify_client_secret,
+    def close(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        super().close()
+
+    def _min_token_ttl(self) -> float:
+        # A cached token must outlive the refresh-ahead window to be reused
+        return TOKEN_EXPIRY_MARGIN + (self.refresh_ahead or 0.0)
+
+    def _fetch_token(self) -> tuple[str, float]:
+        """
+        Return (token, expires_at). With a token_cache, a token fetched by any
+        process on the machine is reused while it is fresh enough.
+        """
+        client_id = self._cfg.spotify_client_id
+
+        def fetch() -> tuple[str, int]:
+            return self._token_provider.fetch(
+                client_id, self._cfg.spotify_client_secret
+            )
+
+        if self._token_cache is not None:
+            return self._token_cache.get_or_fetch(
+                client_id, fetch, min_ttl=self._min_token_ttl()
+            )
+        token, expires_in = fetch()
+        return token, time.time() + expires_in
+
+    def _apply_token(self, token: str, expires_at: float) -> None:
+        self._token = token
+        self._token_expires_at = expires_at - TOKEN_EXPIRY_MARGIN
+        self._client.headers["Authorization"] = f"Bearer {token}"
+
+        if self.refresh_ahead is None:
+            return
+        delay = expires_at - self.refresh_ahead - time.time()
+        if delay <= 0:
+            return  # short-lived token: refresh inline at expiry instead
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        # A weak reference so a forgotten client can still be collected
+        timer = threading.Timer(delay, _refresh_in_background, (weakref.ref(self),))
+        timer.daemon = True
+        timer.start()
+        self._refresh_timer = timer
+
+    def _refresh_token_ahead(self) -> None:
+        try:
+            with self._token_lock:
+                self._apply_token(*self._fetch_token())
+        except Exception:
+            logger.warning(
+                "Background Spotify token refresh failed; will retry inline",
+                exc_info=True,
             )
-            self._token_expires_at = time.time() + expires_in - 10
-            self._client.headers["Authorization"] = f"Bearer {self._token}"
+
+    def _refresh_token_if_needed(self):
+        if time.time() < self._token_expires_at:
+            return
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if time.time() < self._token_expires_at:
+                return
+            self._apply_token(*self._fetch_token())
 
     def get_new_releases(
         self, limit: int = 20, *, attach: bool = False
@@ -56,8 +182,84 @@ class SpotifyClient(APIClient):
         """
         Fetch new album releases from Spotify and return a validated model.
         """
-        raw = self.get(f"/browse/new-releases?limit={limit}", attach=attach)
-        return NewReleasesResponse.model_validate(raw)
+        return self.get_model(
+            f"/browse/new-releases?limit={limit}", NewReleasesResponse, attach=attach
+        )
+
+    def _new_releases_page(
+        self, offset: int, limit: int, attach: bool = False
+    ) -> PagingAlbums:
+        return self.get_model(
+            NEW_RELEASES_PATH,
+            NewReleasesResponse,
+            params={"limit": limit, "offset": offset},
+            attach=attach,
+        ).albums
+
+    def iter_new_releases(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        *,
+        max_items: Optional[int] = None,
+        max_concurrency: int = 4,
+        attach: bool = False,
+    ) -> Iterator[Album]:
+        """
+        Yield new-release albums across all pages, lazily.
+
+        The first page gives `total`; the remaining offsets are then fetched
+        on a thread pool with at most `max_concurrency` pages in flight, and
+        yielded in order. With max_concurrency=1, or when the API reports no
+        total, the `next` links are followed one page at a time instead.
+        Closing the generator early cancels the pages not yet started.
+
+        Args:
+            page_size: Items per request (1-50)
+            max_items: Stop after this many albums
+            max_concurrency: Upper bound on concurrent page requests
+            attach: Attach every page's exchange to Allure
+        """
+        _check_page_size(page_size)
+        check_concurrency(max_concurrency)
+        page = self._new_releases_page(0, page_size, attach)
+        remaining = sys.maxsize if max_items is None else max_items
+
+        if max_concurrency == 1 or not page.total:
+            while page.items and remaining > 0:
+                yield from page.items[:remaining]
+                remaining -= len(page.items)
+                if page.next is None or remaining <= 0:
+                    return
+                response = self.get_model(page.next, NewReleasesResponse, attach=attach)
+                page = response.albums
+            return
+
+        yield from page.items[:remaining]
+        remaining -= len(page.items)
+        offsets = iter(_remaining_offsets(page, max_items))
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+
+            def submit_next() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append(
+                        pool.submit(self._new_releases_page, offset, page.limit, attach)
+                    )
+
+            for _ in range(max_concurrency):
+                submit_next()
+            try:
+                while pending and remaining > 0:
+                    items = pending.popleft().result().items
+                    if not items:
+                        return  # the catalogue shrank while we were paging
+                    submit_next()
+                    yield from items[:remaining]
+                    remaining -= len(items)
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def get_artist_top_tracks(
         self, artist_id: str, market: str = "US", *, attach: bool = False
@@ -65,7 +267,228 @@ class SpotifyClient(APIClient):
         """
         Fetch the top tracks for a given artist in the specified market.
         """
-        raw = self.get(
-            f"/artists/{artist_id}/top-tracks?market={market}", attach=attach
+        return self.get_model(
+            f"/artists/{artist_id}/top-tracks?market={market}",
+            TopTracksResponse,
+            attach=attach,
+        )
+
+
+class AsyncSpotifyClient(AsyncAPIClient):
+    """
+    asyncio Spotify client. Like SpotifyClient, the token is fetched on first
+    use and renewed by a background task `refresh_ahead` seconds before expiry.
+
+    Without a `token_provider`, the client opens its own
+    AsyncSpotifyTokenProvider and closes it in aclose().
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        shared_pool: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        token_cache: Optional[SharedTokenCache] = None,
+        refresh_ahead: Optional[float] = 60.0,
+        token_provider: Optional[AsyncSpotifyTokenProvider] = None,
+    ):
+        cfg = get_settings()
+        actual_base = base_url or cfg.spotify_api_base_url
+
+        super().__init__(
+            base_url=actual_base,
+            token=token,
+            timeout=timeout,
+            transport=transport,
+            limits=limits,
+            http2=http2,
+            shared_pool=shared_pool,
+            cache=cache,
+            coalesce=coalesce,
+            retry=retry,
+            rate_limiter=rate_limiter,
+        )
+
+        self._token_expires_at = float("inf") if token else 0.0
+        self._token_lock = asyncio.Lock()
+        self._token_cache = token_cache
+        # An AsyncClient is tied to its event loop, so each client owns one
+        self._owns_token_provider = token_provider is None
+        self._token_provider = token_provider or AsyncSpotifyTokenProvider()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refresh_ahead = refresh_ahead
+        self._cfg = cfg
+
+    async def aclose(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self._owns_token_provider:
+            await self._token_provider.aclose()
+        await super().aclose()
+
+    def _min_token_ttl(self) -> float:
+        return TOKEN_EXPIRY_MARGIN + (self.refresh_ahead or 0.0)
+
+    async def _fetch_token(self) -> tuple[str, float]:
+        """
+        Async counterpart of SpotifyClient._fetch_token. The shared cache's
+        blocking get-or-fetch runs on a worker thread and keeps the file lock
+        across the fetch, which is still made on this loop, so cold workers
+        wait for one token instead of each fetching their own.
+        """
+        client_id = self._cfg.spotify_client_id
+        secret = self._cfg.spotify_client_secret
+        cache = self._token_cache
+        if cache is None:
+            token, expires_in = await self._token_provider.fetch(client_id, secret)
+            return token, time.time() + expires_in
+
+        loop = asyncio.get_running_loop()
+
+        def fetch() -> tuple[str, int]:
+            return asyncio.run_coroutine_threadsafe(
+                self._token_provider.fetch(client_id, secret), loop
+            ).result()
+
+        return await asyncio.to_thread(
+            cache.get_or_fetch, client_id, fetch, min_ttl=self._min_token_ttl()
+        )
+
+    def _apply_token(self, token: str, expires_at: float) -> None:
+        self._token = token
+        self._token_expires_at = expires_at - TOKEN_EXPIRY_MARGIN
+        self._client.headers["Authorization"] = f"Bearer {token}"
+
+        if self.refresh_ahead is None:
+            return
+        delay = expires_at - self.refresh_ahead - time.time()
+        if delay <= 0:
+            return
+        task = self._refresh_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_token_ahead(delay)
+        )
+
+    async def _refresh_token_ahead(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            async with self._token_lock:
+                self._apply_token(*await self._fetch_token())
+        except Exception:
+            logger.warning(
+                "Background Spotify token refresh failed; will retry inline",
+                exc_info=True,
+            )
+
+    async def _refresh_token_if_needed(self):
+        if time.time() < self._token_expires_at:
+            return
+        async with self._token_lock:
+            # Another task may have refreshed while we waited for the lock
+            if time.time() < self._token_expires_at:
+                return
+            self._apply_token(*await self._fetch_token())
+
+    async def get_new_releases(
+        self, limit: int = 20, *, attach: bool = False
+    ) -> NewReleasesResponse:
+        """
+        Fetch new album releases from Spotify and return a validated model.
+        """
+        return await self.get_model(
+            f"/browse/new-releases?limit={limit}", NewReleasesResponse, attach=attach
+        )
+
+    async def _new_releases_page(
+        self, offset: int, limit: int, attach: bool = False
+    ) -> PagingAlbums:
+        response = await self.get_model(
+            NEW_RELEASES_PATH,
+            NewReleasesResponse,
+            params={"limit": limit, "offset": offset},
+            attach=attach,
+        )
+        return response.albums
+
+    async def iter_new_releases(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        *,
+        max_items: Optional[int] = None,
+        max_concurrency: int = 4,
+        attach: bool = False,
+    ) -> AsyncIterator[Album]:
+        """
+        Async counterpart of SpotifyClient.iter_new_releases; remaining pages
+        are fetched as tasks, at most `max_concurrency` at a time.
+        """
+        _check_page_size(page_size)
+        check_concurrency(max_concurrency)
+        page = await self._new_releases_page(0, page_size, attach)
+        remaining = sys.maxsize if max_items is None else max_items
+
+        if max_concurrency == 1 or not page.total:
+            while page.items and remaining > 0:
+                for album in page.items[:remaining]:
+                    yield album
+                remaining -= len(page.items)
+                if page.next is None or remaining <= 0:
+                    return
+                response = await self.get_model(
+                    page.next, NewReleasesResponse, attach=attach
+                )
+                page = response.albums
+            return
+
+        for album in page.items[:remaining]:
+            yield album
+        remaining -= len(page.items)
+        offsets = iter(_remaining_offsets(page, max_items))
+        pending: Deque[asyncio.Task] = deque()
+
+        def submit_next() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._new_releases_page(offset, page.limit, attach)
+                    )
+                )
+
+        for _ in range(max_concurrency):
+            submit_next()
+        try:
+            while pending and remaining > 0:
+                items = (await pending.popleft()).items
+                if not items:
+                    return  # the catalogue shrank while we were paging
+                submit_next()
+                for album in items[:remaining]:
+                    yield album
+                remaining -= len(items)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_artist_top_tracks(
+        self, artist_id: str, market: str = "US", *, attach: bool = False
+    ) -> TopTracksResponse:
+        """
+        Fetch the top tracks for a given artist in the specified market.
+        """
+        return await self.get_model(
+            f"/artists/{artist_id}/top-tracks?market={market}",
+            TopTracksResponse,
+            attach=attach,
         )
-        return TopTracksResponse.model_validate(raw)
@@ -0,0 +1,298 @@
+"""
+In-process stand-in for the Spotify endpoints SpotifyClient uses, for
+offline tests, benchmarks and load runs:
+
+    stub = SpotifyStub(
+        Behavior(latency=lognormal(0.05, 0.5), error_rate=0.01),
+        endpoints={TOP_TRACKS: Behavior(throttle_every=20, throttle_burst=3)},
+    )
+    client = SpotifyClient(
+        transport=stub, token_provider=SpotifyTokenProvider(transport=stub)
+    )
+
+Each endpoint's Behavior sets how long a response takes and how often it
+fails. Faults are drawn from a seeded generator, so a run can be repeated.
+"""
+
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from random import Random
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from api_testing_framework.codec import JSON_CONTENT_TYPE, get_codec
+
+# Endpoint names for per-endpoint behaviours and request counts
+TOKEN = "token"
+NEW_RELEASES = "new_releases"
+TOP_TRACKS = "top_tracks"
+
+LatencyModel = Callable[[Random], float]
+
+_TOP_TRACKS_RE = re.compile(r"/artists/([^/]+)/top-tracks$")
+MAX_PAGE_SIZE = 50
+
+
+def no_latency(rng: Random) -> float:
+    return 0.0
+
+
+def fixed(seconds: float) -> LatencyModel:
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> LatencyModel:
+    return lambda rng: rng.uniform(low, high)
+
+
+def exponential(mean: float) -> LatencyModel:
+    return lambda rng: rng.expovariate(1 / mean) if mean > 0 else 0.0
+
+
+def lognormal(median: float, sigma: float) -> LatencyModel:
+    """Long-tailed latency, the usual shape of real service response times."""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+@dataclass(frozen=True)
+class Behavior:
+    """
+    How one endpoint responds.
+
+    Args:
+        latency: Seconds to wait before each response, drawn per request
+        error_rate: Fraction of requests answered with `error_status`
+        error_status: Status of injected errors
+        throttle_every: Out of every this many requests, the first
+                        `throttle_burst` get 429 (0 disables throttling)
+        throttle_burst: Length of each 429 burst
+        retry_after: Retry-After seconds sent with a 429
+    """
+
+    latency: LatencyModel = no_latency
+    error_rate: float = 0.0
+    error_status: int = 500
+    throttle_every: int = 0
+    throttle_burst: int = 1
+    retry_after: int = 1
+
+
+def _album(index: int, padding: int) -> dict:
+    return {
+        "album_type": "album",
+        "artists": [{"id": f"artist{index % 97:06d}", "name": f"Artist {index % 97}"}],
+        "id": f"album{index:017d}",
+        "name": f"Album {index}" + " " * padding,
+        "release_date": "2025-05-01",
+        "total_tracks": 10,
+        "images": [
+            {
+                "url": f"https://i.scdn.co/image/{index:040d}",
+                "height": 640,
+                "width": 640,
+            }
+        ],
+    }
+
+
+class SpotifyStub(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport (sync and async) serving the token endpoint, paged
+    /browse/new-releases and /artists/{id}/top-tracks from generated data.
+    API calls without a bearer token get 401 and other paths 404, in
+    Spotify's error format.
+
+    Args:
+        default: Behavior of endpoints not listed in `endpoints`
+        endpoints: Per-endpoint Behavior, keyed by TOKEN, NEW_RELEASES or
+                   TOP_TRACKS
+        albums: Size of the new-releases catalogue (its paging `total`)
+        padding: Extra characters per album name, to grow payloads
+        token_ttl: expires_in of issued tokens
+        seed: Seed for latency and fault draws
+        sleep: Sleep function for sync requests (async ones use asyncio)
+    """
+
+    def __init__(
+        self,
+        default: Behavior = Behavior(),
+        endpoints: Optional[Dict[str, Behavior]] = None,
+        *,
+        albums: int = 100,
+        padding: int = 0,
+        token_ttl: int = 3600,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.default = default
+        self.endpoints = dict(endpoints or {})
+        self.albums = [_album(i, padding) for i in range(albums)]
+        self.token_ttl = token_ttl
+        self.sleep = sleep
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self._rng = Random(seed)
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    def behavior(self, endpoint: str) -> Behavior:
+        return self.endpoints.get(endpoint, self.default)
+
+    @staticmethod
+    def _error(status: int, message: str, **headers: str) -> httpx.Response:
+        return httpx.Response(
+            status,
+            json={"error": {"status": status, "message": message}},
+            headers=headers,
+        )
+
+    def _json(self, data: dict) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=get_codec().dumps(data),
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+        )
+
+    def _route(self, request: httpx.Request) -> Tuple[Optional[str], Optional[str]]:
+        path = request.url.path
+        if request.method == "POST" and path.endswith("/api/token"):
+            return TOKEN, None
+        if request.method != "GET":
+            return None, None
+        if path.endswith("/browse/new-releases"):
+            return NEW_RELEASES, None
+        match = _TOP_TRACKS_RE.search(path)
+        if match:
+            return TOP_TRACKS, match.group(1)
+        return None, None
+
+    def _decide(self, endpoint: str) -> Tuple[float, Optional[httpx.Response]]:
+        """Draw this request's delay and injected fault, if any."""
+        behavior = self.behavior(endpoint)
+        with self._lock:
+            count = self.requests[endpoint]
+            self.requests[endpoint] += 1
+            delay = max(0.0, behavior.latency(self._rng))
+            failed = behavior.error_rate and self._rng.random() < behavior.error_rate
+        every = behavior.throttle_every
+        if every and count % every < behavior.throttle_burst:
+            return delay, self._error(
+                429,
+                "API rate limit exceeded",
+                **{"Retry-After": str(behavior.retry_after)},
+            )
+        if failed:
+            return delay, self._error(behavior.error_status, "Injected failure")
+        return delay, None
+
+    def _token(self, request: httpx.Request) -> httpx.Response:
+        if not request.headers.get("Authorization", "").startswith("Basic "):
+            return httpx.Response(
+                400,
+                json={
+                    "error": "invalid_client",
+                    "error_description": "Invalid client",
+                },
+            )
+        with self._lock:
+            self._tokens += 1
+            token = f"stub-token-{self._tokens}"
+        return self._json(
+            {
+                "access_token": token,
+                "token_type": "Bearer",
+                "expires_in": self.token_ttl,
+            }
+        )
+
+    def _new_releases(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        try:
+            limit = int(params.get("limit", 20))
+            offset = int(params.get("offset", 0))
+        except ValueError:
+            return self._error(400, "Invalid limit or offset")
+        if not 1 <= limit <= MAX_PAGE_SIZE or offset < 0:
+            return self._error(400, "Invalid limit or offset")
+        total = len(self.albums)
+
+        def page_url(start: int) -> Optional[str]:
+            if start < 0 or start >= total:
+                return None
+            return str(request.url.copy_merge_params({"offset": start, "limit": limit}))
+
+        previous = max(0, offset - limit) if offset else -1
+        return self._json(
+            {
+                "albums": {
+                    "href": str(request.url),
+                    "items": self.albums[offset : offset + limit],
+                    "limit": limit,
+                    "next": page_url(offset + limit),
+                    "offset": offset,
+                    "previous": page_url(previous),
+                    "total": total,
+                }
+            }
+        )
+
+    def _top_tracks(self, artist_id: str) -> httpx.Response:
+        artist = {"id": artist_id, "name": f"Artist {artist_id}"}
+        tracks = [
+            {
+                "id": f"{artist_id}-{i}",
+                "name": f"Track {i}",
+                "album": self.albums[i % len(self.albums)] if self.albums else None,
+                "artists": [artist],
+                "popularity": 100 - i,
+                "preview_url": None,
+            }
+            for i in range(10)
+        ]
+        return self._json({"tracks": tracks})
+
+    def _respond(
+        self, request: httpx.Request, endpoint: Optional[str], arg: Optional[str]
+    ) -> httpx.Response:
+        if endpoint is None:
+            return self._error(404, "Service not found")
+        if endpoint == TOKEN:
+            return self._token(request)
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return self._error(401, "No token provided")
+        if endpoint == NEW_RELEASES:
+            return self._new_releases(request)
+        return self._top_tracks(arg)
+
+    def _prepare(
+        self, request: httpx.Request
+    ) -> Tuple[float, Optional[str], Optional[str], Optional[httpx.Response]]:
+        endpoint, arg = self._route(request)
+        delay, fault = self._decide(endpoint) if endpoint else (0.0, None)
+        return delay, endpoint, arg, fault
+
+    def _finish(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> httpx.Response:
+        with self._lock:
+            self.statuses[response.status_code] += 1
+        response.request = request
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay, endpoint, arg, fault = self._prepare(request)
+        if delay:
+            self.sleep(delay)
+        return self._finish(request, fault or self._respond(request, endpoint, arg))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay, endpoint, arg, fault = self._prepare(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._finish(request, fault or self._respond(request, endpoint, arg))
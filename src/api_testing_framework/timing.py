@@ -0,0 +1,200 @@
+"""
+Per-request phase timings.
+
+Timings come from httpcore's "trace" request extension, which reports when
+the connection is opened, TLS negotiated, the request written and the
+response headers and body read. A request is only traced while someone is
+listening: a timing subscriber is registered, or the exchange is being
+recorded for Allure. Otherwise the cost is one list check per request.
+
+httpcore resolves DNS inside connect_tcp, so `connect` includes DNS. Custom
+transports (MockTransport, replays) emit no trace events, so only `total`
+and `rate_limit_wait` are set for them.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from api_testing_framework.logger import logger
+
+# Request flag asking for timing, and where the result goes on the response
+TIMING_EXTENSION = "api_testing_framework.timing"
+
+TimingSubscriber = Callable[["RequestTiming"], None]
+
+
+@dataclass
+class RequestTiming:
+    """
+    Seconds spent in each phase of one exchange; None when the phase did not
+    happen (e.g. `connect` on a reused connection) or was not observable.
+
+    Attributes:
+        rate_limit_wait: Time the client-side RateLimiter held the request
+        queue: From send() until the pool had a connection for the request
+        connect: TCP connect, including DNS resolution
+        tls: TLS handshake
+        send: Writing the request headers and body
+        server: From the last byte sent to the response headers (think time)
+        ttfb: From send() until the response headers were read
+        download: Reading the response body
+        total: From send() until it returned (excludes rate_limit_wait)
+        error: Exception type when send() raised instead of returning a
+               response; status_code is None then
+    """
+
+    method: str
+    url: str
+    status_code: Optional[int] = None
+    rate_limit_wait: float = 0.0
+    queue: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    send: Optional[float] = None
+    server: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    total: float = 0.0
+    error: Optional[str] = None
+
+    PHASES = (
+        "rate_limit_wait",
+        "queue",
+        "connect",
+        "tls",
+        "send",
+        "server",
+        "ttfb",
+        "download",
+        "total",
+    )
+
+    @property
+    def reused_connection(self) -> bool:
+        return self.connect is None and self.send is not None
+
+    def phases(self) -> Dict[str, float]:
+        """Observed phases, in order."""
+        values = {name: getattr(self, name) for name in self.PHASES}
+        return {name: v for name, v in values.items() if v is not None}
+
+    def as_text(self) -> str:
+        outcome = self.status_code if self.error is None else self.error
+        lines = [f"{self.method} {self.url} -> {outcome}"]
+        lines += [f"{name:<16}{v * 1000:10.2f} ms" for name, v in self.phases().items()]
+        return "\n".join(lines)
+
+
+class TimingProbe:
+    """Collects the trace events of one request."""
+
+    __slots__ = ("start", "events", "_clock")
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.start = clock()
+        self.events: Dict[str, float] = {}
+
+    def trace(self, name: str, info: dict) -> None:
+        # "http11.send_request_headers.started" -> "send_request_headers.started"
+        self.events[name.partition(".")[2]] = self._clock()
+
+    async def atrace(self, name: str, info: dict) -> None:
+        self.trace(name, info)
+
+    def _span(self, begin: str, end: str) -> Optional[float]:
+        if begin in self.events and end in self.events:
+            return self.events[end] - self.events[begin]
+        return None
+
+    def finish(
+        self,
+        request: httpx.Request,
+        response: Optional[httpx.Response],
+        rate_limit_wait: float = 0.0,
+        error: Optional[BaseException] = None,
+    ) -> "RequestTiming":
+        """
+        Build the RequestTiming, store it on the response and publish it.
+        Pass response=None and the exception when send() failed, so transport
+        errors still reach subscribers (with the time spent until the failure).
+        """
+        end = self._clock()
+        ev = self.events
+        headers_done = ev.get("receive_response_headers.complete")
+        timing = RequestTiming(
+            method=request.method,
+            url=str(request.url),
+            status_code=response.status_code if response is not None else None,
+            rate_limit_wait=rate_limit_wait,
+            queue=min(ev.values()) - self.start if ev else None,
+            connect=self._span("connect_tcp.started", "connect_tcp.complete"),
+            tls=self._span("start_tls.started", "start_tls.complete"),
+            send=self._span(
+                "send_request_headers.started", "send_request_body.complete"
+            ),
+            server=self._span(
+                "send_request_body.complete", "receive_response_headers.complete"
+            ),
+            ttfb=headers_done - self.start if headers_done is not None else None,
+            download=self._span(
+                "receive_response_headers.complete", "receive_response_body.complete"
+            ),
+            total=end - self.start,
+            error=type(error).__name__ if error is not None else None,
+        )
+        if response is not None:
+            response.extensions[TIMING_EXTENSION] = timing
+        publish(timing)
+        return timing
+
+
+_subscribers: List[TimingSubscriber] = []
+_lock = threading.Lock()
+
+
+def subscribe(callback: TimingSubscriber) -> Callable[[], None]:
+    """
+    Call `callback(timing)` for every exchange sent by any client in this
+    process. Returns a function that unsubscribes again.
+    """
+    with _lock:
+        _subscribers.append(callback)
+
+    def unsubscribe() -> None:
+        with _lock:
+            if callback in _subscribers:
+                _subscribers.remove(callback)
+
+    return unsubscribe
+
+
+def publish(timing: RequestTiming) -> None:
+    for callback in tuple(_subscribers):
+        try:
+            callback(timing)
+        except Exception:
+            logger.warning("Timing subscriber %r failed", callback, exc_info=True)
+
+
+def start_timing(
+    request: httpx.Request, asynchronous: bool = False
+) -> Optional[TimingProbe]:
+    """
+    Start timing `request` if anyone is listening; returns None otherwise.
+    The probe is installed as the request's trace extension.
+    """
+    if not _subscribers and not request.extensions.get(TIMING_EXTENSION):
+        return None
+    probe = TimingProbe()
+    request.extensions["trace"] = probe.atrace if asynchronous else probe.trace
+    return probe
+
+
+def get_timing(response: httpx.Response) -> Optional[RequestTiming]:
+    """The RequestTiming recorded for `response`, if it was timed."""
+    return response.extensions.get(TIMING_EXTENSION)
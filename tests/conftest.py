@@ -1,13 +1,21 @@
 import os
+import shutil
+import tempfile
+import threading
+import time
 import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import allure
 import pytest
 
-from api_testing_framework.client import APIClient
+from api_testing_framework.client import APIClient, BaseAPIClient
+from api_testing_framework.pool import get_registry
 
 # from tests.utils_allure import find_attachment_path, wait_for_result_with_label
 
+pytest_plugins = ["pytester"]
+
 
 @pytest.fixture
 def api_client(request):
@@ -17,26 +25,92 @@ def api_client(request):
     a pytest hook can retrieve and attach exchanges only on failure.
     """
 
-    client = APIClient(base_url="https://api.example.com", token=None)
+    client = APIClient(base_url="https://api.example.com", token=None, shared_pool=True)
 
     request.node._api_client = client
-    return client
+    yield client
+    client.close()
+
+
+def pytest_configure(config):
+    """
+    Give this run (and its xdist workers, which inherit the environment) a
+    shared-state directory of its own, so cached tokens are deleted at the end.
+    """
+    if hasattr(config, "workerinput") or os.getenv("API_TESTING_SHARED_DIR"):
+        return
+    path = tempfile.mkdtemp(prefix="api-testing-framework-")
+    os.environ["API_TESTING_SHARED_DIR"] = path
+    config.add_cleanup(lambda: shutil.rmtree(path, ignore_errors=True))
+    config.add_cleanup(lambda: os.environ.pop("API_TESTING_SHARED_DIR", None))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the shared connection pools once the whole run is done."""
+    get_registry().close_all()
 
 
 def pytest_runtest_makereport(item, call):
     """
-    After each test's 'call' phase, if the test failed and the client recorded an exchange,
-    attach it to Allure.
+    After each test's 'call' phase, if the test failed and the client recorded
+    exchanges, attach them to Allure. The history is cleared either way so a
+    long-lived client only reports the exchanges of the failing test.
     """
     if call.when != "call":
         return
 
-    if call.excinfo is None:
+    api_client = getattr(item, "_api_client", None)
+    if not isinstance(api_client, BaseAPIClient):
         return
 
-    api_client = getattr(item, "_api_client", None)
-    if isinstance(api_client, APIClient):
-        api_client._attach_last_exchange_to_allure()
+    if call.excinfo is not None:
+        api_client._attach_recorded_exchanges_to_allure()
+    api_client.clear_exchanges()
+
+
+def wait_for(predicate, timeout=5.0):
+    """Poll until `predicate()` is true, failing the test after `timeout`."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def setup(self):
+        super().setup()
+        KeepAliveHandler.connections.add(self.client_address)
+
+    def do_HEAD(self):
+        # Hold the request long enough that concurrent warm-ups overlap
+        time.sleep(0.05)
+        self.send_response(204)
+        self.end_headers()
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    KeepAliveHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.fixture
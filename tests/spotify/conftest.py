@@ -1,22 +1,66 @@
+import os
+
 import pytest
 
+from api_testing_framework.auth import SpotifyTokenProvider
 from api_testing_framework.config import get_settings
+from api_testing_framework.replay import ReplayTransport
+from api_testing_framework.shared import get_shared_token_cache, shared_rate_limiter
 from api_testing_framework.spotify.client import SpotifyClient
 
 CFG = get_settings()
 
 
+def shared_client_args() -> dict:
+    """
+    Share one token, and optionally one request budget (SPOTIFY_MAX_RPS),
+    between all xdist workers on this machine.
+    """
+    args = {"shared_pool": True, "token_cache": get_shared_token_cache()}
+    max_rps = os.getenv("SPOTIFY_MAX_RPS")
+    if max_rps:
+        args["rate_limiter"] = shared_rate_limiter(per_host=float(max_rps))
+    return args
+
+
+@pytest.fixture(scope="session")
+def spotify_cassette():
+    """
+    ReplayTransport over the SPOTIFY_CASSETTE file (recorded on first use, see
+    REPLAY_MODE), or None to talk to the live API.
+    """
+    path = os.getenv("SPOTIFY_CASSETTE")
+    if not path:
+        yield None
+        return
+    transport = ReplayTransport(path)
+    yield transport
+    transport.close()
+
+
 @pytest.fixture(scope="session")
-def spotify_client():
+def spotify_client(spotify_cassette):
     """
     Fixture for real SpotifyClient integration tests.
-    Skips if SPOTIFY_CLIENT_ID/SECRET are not set.
+    Skips if SPOTIFY_CLIENT_ID/SECRET are not set, unless replaying a cassette.
     """
-    if not CFG.spotify_client_id or not CFG.spotify_client_secret:
+    replaying = spotify_cassette is not None and not spotify_cassette.recording
+    if not replaying and not (CFG.spotify_client_id and CFG.spotify_client_secret):
         pytest.skip("Spotify credentials not set; skipping integration tests")
-    return SpotifyClient(
-        base_url=CFG.spotify_api_base_url,
-    )
+    if spotify_cassette is None:
+        client = SpotifyClient(
+            base_url=CFG.spotify_api_base_url, **shared_client_args()
+        )
+    else:
+        # The token fetch goes through the cassette too; the shared token
+        # cache is left out so a redacted token never reaches it
+        client = SpotifyClient(
+            base_url=CFG.spotify_api_base_url,
+            transport=spotify_cassette,
+            token_provider=SpotifyTokenProvider(transport=spotify_cassette),
+        )
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -28,7 +72,10 @@ def api_client(request):
     """
 
     # cfg = get_settings()
-    client = SpotifyClient(base_url=CFG.spotify_api_base_url, token=None)
+    client = SpotifyClient(
+        base_url=CFG.spotify_api_base_url, token=None, **shared_client_args()
+    )
 
     request.node._api_client = client
-    return client
+    yield client
+    client.close()
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+
+from api_testing_framework.auth import AsyncSpotifyTokenProvider
+from api_testing_framework.spotify.client import AsyncSpotifyClient
+from api_testing_framework.spotify.models import TopTracksResponse
+
+TOP_TRACKS = {
+    "tracks": [
+        {
+            "id": "trk1",
+            "name": "Track One",
+            "album": {
+                "id": "alb1",
+                "name": "Album One",
+                "album_type": "single",
+                "release_date": "2025-05-01",
+                "total_tracks": 1,
+                "images": [{"url": "https://img", "height": 300, "width": 300}],
+                "artists": [{"id": "art1", "name": "Artist One"}],
+            },
+            "artists": [{"id": "art1", "name": "Artist One"}],
+            "popularity": 50,
+            "preview_url": None,
+        }
+    ]
+}
+
+
+def test_async_get_artist_top_tracks():
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=TOP_TRACKS)
+    )
+
+    async def run():
+        async with AsyncSpotifyClient(
+            base_url="https://api.example.com",
+            token="dummy-token",
+            transport=transport,
+        ) as client:
+            return await client.get_artist_top_tracks("artist123")
+
+    resp = asyncio.run(run())
+    assert isinstance(resp, TopTracksResponse)
+    assert resp.tracks[0].id == "trk1"
+
+
+def test_concurrent_requests_fetch_token_once():
+    calls = []
+    seen_auth = set()
+
+    async def token_endpoint(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200, json={"access_token": "fresh-token", "expires_in": 3600}
+        )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_auth.add(request.headers["Authorization"])
+        return httpx.Response(200, json=TOP_TRACKS)
+
+    async def run():
+        async with (
+            AsyncSpotifyTokenProvider(
+                transport=httpx.MockTransport(token_endpoint)
+            ) as provider,
+            AsyncSpotifyClient(
+                base_url="https://api.example.com",
+                transport=httpx.MockTransport(handler),
+                token_provider=provider,
+            ) as client,
+        ):
+            await asyncio.gather(
+                *(client.get_artist_top_tracks(f"artist{i}") for i in range(10))
+            )
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert seen_auth == {"Bearer fresh-token"}
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+
+from api_testing_framework.auth import AsyncSpotifyTokenProvider, SpotifyTokenProvider
+from api_testing_framework.spotify.client import AsyncSpotifyClient, SpotifyClient
+from api_testing_framework.spotify.stub import (
+    NEW_RELEASES,
+    TOKEN,
+    Behavior,
+    SpotifyStub,
+    fixed,
+)
+
+BASE_URL = "https://api.spotify.com/v1"
+
+
+def make_stub(albums: int = 1000, latency: float = 0.0) -> SpotifyStub:
+    return SpotifyStub(
+        endpoints={NEW_RELEASES: Behavior(latency=fixed(latency))}, albums=albums
+    )
+
+
+def make_client(stub: SpotifyStub) -> SpotifyClient:
+    return SpotifyClient(
+        base_url=BASE_URL,
+        transport=stub,
+        token_provider=SpotifyTokenProvider(transport=stub),
+    )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_yields_every_album_once_in_order(max_concurrency):
+    stub = make_stub(albums=230)
+    with make_client(stub) as client:
+        ids = [
+            album.id
+            for album in client.iter_new_releases(max_concurrency=max_concurrency)
+        ]
+
+    assert ids == [album["id"] for album in stub.albums]
+    assert stub.requests[NEW_RELEASES] == 5
+
+
+def test_max_items_limits_requests():
+    stub = make_stub()
+    with make_client(stub) as client:
+        albums = list(client.iter_new_releases(page_size=20, max_items=50))
+
+    assert len(albums) == 50
+    assert stub.requests[NEW_RELEASES] == 3
+
+
+def test_pages_are_fetched_concurrently():
+    stub = make_stub(latency=0.05)
+    with make_client(stub) as client:
+        client.get_new_releases()  # fetch the token up front
+        start = time.perf_counter()
+        albums = list(client.iter_new_releases(max_concurrency=10))
+        elapsed = time.perf_counter() - start
+
+    # 20 pages of ~50 ms: the first, then two waves of 10 in parallel
+    assert len(albums) == 1000
+    assert elapsed < 0.5
+
+
+def test_stopping_early_skips_the_rest():
+    stub = make_stub(latency=0.01)
+    with make_client(stub) as client:
+        albums = client.iter_new_releases(max_concurrency=2)
+        first = [next(albums) for _ in range(60)]
+        albums.close()
+
+    assert len(first) == 60
+    # The first page, then at most a window of two pages ahead
+    assert stub.requests[NEW_RELEASES] <= 4
+
+
+def test_page_size_and_concurrency_are_validated():
+    with make_client(make_stub()) as client:
+        with pytest.raises(ValueError):
+            next(client.iter_new_releases(page_size=51))
+        with pytest.raises(ValueError):
+            next(client.iter_new_releases(max_concurrency=0))
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 8])
+def test_async_iteration_matches_sync(max_concurrency):
+    stub = SpotifyStub(
+        Behavior(latency=fixed(0.02)), endpoints={TOKEN: Behavior()}, albums=170
+    )
+
+    async def main():
+        client = AsyncSpotifyClient(
+            base_url=BASE_URL,
+            transport=stub,
+            token_provider=AsyncSpotifyTokenProvider(transport=stub),
+        )
+        async with client:
+            return [
+                album.id
+                async for album in client.iter_new_releases(
+                    page_size=20, max_items=150, max_concurrency=max_concurrency
+                )
+            ]
+
+    ids = asyncio.run(main())
+    assert ids == [album["id"] for album in stub.albums[:150]]
+    assert stub.requests[NEW_RELEASES] == 8
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from api_testing_framework.auth import AsyncSpotifyTokenProvider, SpotifyTokenProvider
+from api_testing_framework.exceptions import APIError
+from api_testing_framework.retry import RetryBudget, RetryPolicy
+from api_testing_framework.spotify.client import AsyncSpotifyClient, SpotifyClient
+from api_testing_framework.spotify.stub import (
+    NEW_RELEASES,
+    TOKEN,
+    TOP_TRACKS,
+    Behavior,
+    SpotifyStub,
+    fixed,
+    lognormal,
+)
+
+BASE_URL = "https://api.spotify.com/v1"
+
+
+def make_client(stub: SpotifyStub, **kwargs) -> SpotifyClient:
+    return SpotifyClient(
+        base_url=BASE_URL,
+        transport=stub,
+        token_provider=SpotifyTokenProvider(transport=stub),
+        **kwargs,
+    )
+
+
+def no_wait_retries(max_attempts: int = 3) -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=max_attempts, budget=RetryBudget(), sleep=lambda s: None
+    )
+
+
+def test_serves_token_and_typed_endpoints():
+    stub = SpotifyStub(albums=30)
+    with make_client(stub) as client:
+        releases = client.get_new_releases(limit=20)
+        tracks = client.get_artist_top_tracks("3TVXtAsR1Inumwj472S9r4")
+
+    page = releases.albums
+    assert (page.total, page.limit, len(page.items)) == (30, 20, 20)
+    assert "offset=20" in page.next and page.previous is None
+    assert len(tracks.tracks) == 10
+    assert stub.requests == {TOKEN: 1, NEW_RELEASES: 1, TOP_TRACKS: 1}
+
+
+def test_last_page_and_unknown_paths():
+    stub = SpotifyStub(albums=30)
+    with make_client(stub) as client:
+        last = client.get("/browse/new-releases", params={"offset": 20, "limit": 20})
+        with pytest.raises(APIError) as missing:
+            client.get("/me/playlists")
+
+    assert len(last["albums"]["items"]) == 10 and last["albums"]["next"] is None
+    assert missing.value.status_code == 404
+
+
+def test_api_calls_need_a_bearer_token():
+    stub = SpotifyStub()
+    with httpx.Client(base_url=BASE_URL, transport=stub) as raw:
+        assert raw.get("/browse/new-releases").status_code == 401
+        assert raw.post("https://accounts.spotify.com/api/token").status_code == 400
+
+
+def test_throttle_bursts_send_retry_after_and_are_retried():
+    slept = []
+    stub = SpotifyStub(
+        endpoints={NEW_RELEASES: Behavior(throttle_every=5, throttle_burst=2)}
+    )
+    policy = RetryPolicy(budget=RetryBudget(), backoff=0.0, sleep=slept.append)
+
+    with make_client(stub, retry=policy) as client:
+        for _ in range(3):
+            client.get_new_releases()
+
+    # The first 2 of every 5 requests are throttled: the first call retries twice
+    assert stub.statuses[429] == 2
+    assert slept == [1.0, 1.0]
+    assert policy.stats.by_reason == {"429": 2}
+
+
+def test_error_rate_is_seeded_and_repeatable():
+    def failures(seed):
+        stub = SpotifyStub(Behavior(error_rate=0.3, error_status=503), seed=seed)
+        with make_client(stub, retry=no_wait_retries(max_attempts=1)) as client:
+            outcomes = []
+            for _ in range(50):
+                try:
+                    client.get_artist_top_tracks("abc")
+                    outcomes.append(200)
+                except APIError as exc:
+                    outcomes.append(exc.status_code)
+        return outcomes
+
+    first = failures(seed=7)
+    assert first == failures(seed=7)
+    assert 5 < first.count(503) < 25
+
+
+def test_latency_is_applied_per_request():
+    stub = SpotifyStub(
+        Behavior(latency=fixed(0.05)),
+        endpoints={TOKEN: Behavior()},
+    )
+    with make_client(stub) as client:
+        client.get_new_releases()  # fetches the token first
+        start = time.perf_counter()
+        client.get_new_releases()
+        elapsed = time.perf_counter() - start
+    assert 0.05 <= elapsed < 0.5
+
+
+def test_async_requests_overlap_their_latency():
+    stub = SpotifyStub(Behavior(latency=lognormal(0.05, 0.1)), padding=500)
+
+    async def main():
+        client = AsyncSpotifyClient(
+            base_url=BASE_URL,
+            transport=stub,
+            token_provider=AsyncSpotifyTokenProvider(transport=stub),
+        )
+        async with client:
+            await client.get_new_releases()
+            start = time.perf_counter()
+            pages = await asyncio.gather(
+                *(client.get_new_releases(limit=50) for _ in range(10))
+            )
+            return pages, time.perf_counter() - start
+
+    pages, elapsed = asyncio.run(main())
+    assert all(len(p.albums.items) == 50 for p in pages)
+    assert len(pages[0].albums.items[0].name) > 500
+    assert elapsed < 0.4  # ten ~50 ms responses in parallel, not in series
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from api_testing_framework.spotify.client import AsyncSpotifyClient, SpotifyClient
+from tests.conftest import wait_for
+
+
+class FakeTokenProvider:
+    """Hands out token-1, token-2, ... with the given lifetime."""
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, client_id, client_secret):
+        with self._lock:
+            self.calls += 1
+            token = f"token-{self.calls}"
+        time.sleep(self.delay)
+        return token, self.expires_in
+
+
+class AsyncFakeTokenProvider(FakeTokenProvider):
+    async def fetch(self, client_id, client_secret):
+        self.calls += 1
+        token = f"token-{self.calls}"
+        await asyncio.sleep(self.delay)
+        return token, self.expires_in
+
+
+@pytest.fixture
+def seen_auth():
+    return []
+
+
+@pytest.fixture
+def transport(seen_auth):
+    def handler(request):
+        seen_auth.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handler)
+
+
+def test_token_is_fetched_lazily(transport, seen_auth):
+    provider = FakeTokenProvider()
+
+    client = SpotifyClient(
+        base_url="https://api.example.com", transport=transport, token_provider=provider
+    )
+    assert provider.calls == 0
+
+    client.get("/me")
+    client.get("/me")
+    client.close()
+
+    assert provider.calls == 1
+    assert seen_auth == ["Bearer token-1"] * 2
+
+
+def test_concurrent_first_use_fetches_once(transport):
+    provider = FakeTokenProvider(delay=0.05)
+    client = SpotifyClient(
+        base_url="https://api.example.com", transport=transport, token_provider=provider
+    )
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: client.get("/me"), range(8)))
+    client.close()
+
+    assert provider.calls == 1
+
+
+def test_token_is_refreshed_in_the_background(transport, seen_auth):
+    # Refreshed 19.9s before expiry: the timer fires after ~0.1s
+    provider = FakeTokenProvider(expires_in=20.0)
+    client = SpotifyClient(
+        base_url="https://api.example.com",
+        transport=transport,
+        refresh_ahead=19.9,
+        token_provider=provider,
+    )
+
+    client.get("/me")
+    wait_for(lambda: client._token != "token-1")
+    client.get("/me")
+    client.close()
+
+    # The second request used a renewed token without fetching one inline
+    assert seen_auth[0] == "Bearer token-1"
+    assert seen_auth[1] != "Bearer token-1"
+
+
+def test_close_stops_background_refresh(transport):
+    provider = FakeTokenProvider(expires_in=20.0)
+    client = SpotifyClient(
+        base_url="https://api.example.com",
+        transport=transport,
+        refresh_ahead=19.9,
+        token_provider=provider,
+    )
+
+    client.get("/me")
+    client.close()
+    time.sleep(0.2)
+
+    assert provider.calls == 1
+
+
+def test_failed_background_refresh_keeps_current_token(monkeypatch, transport):
+    provider = FakeTokenProvider(expires_in=20.0)
+    client = SpotifyClient(
+        base_url="https://api.example.com",
+        transport=transport,
+        refresh_ahead=19.9,
+        token_provider=provider,
+    )
+    client.get("/me")
+
+    def broken(client_id, client_secret):
+        provider.calls += 1
+        raise RuntimeError("token endpoint down")
+
+    monkeypatch.setattr(provider, "fetch", broken)
+    wait_for(lambda: provider.calls >= 2)
+    assert client._token == "token-1"
+    client.close()
+
+
+def test_async_token_is_refreshed_in_the_background():
+    provider = AsyncFakeTokenProvider(expires_in=20.0)
+    seen_auth = []
+
+    async def handler(request):
+        seen_auth.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with AsyncSpotifyClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            refresh_ahead=19.9,
+            token_provider=provider,
+        ) as client:
+            await client.get("/me")
+            for _ in range(100):
+                if client._token != "token-1":
+                    break
+                await asyncio.sleep(0.01)
+            await client.get("/me")
+
+    asyncio.run(run())
+    assert seen_auth[0] == "Bearer token-1"
+    assert seen_auth[1] != "Bearer token-1"
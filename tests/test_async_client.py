@@ -0,0 +1,89 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.exceptions import APIError
+
+
+def ok_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+def error_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(500, json={"error": "internal_server_error"})
+
+
+def make_client(handler) -> AsyncAPIClient:
+    return AsyncAPIClient(
+        base_url="https://api.example.com",
+        token="dummy-token",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_async_get_returns_response():
+    async def run():
+        async with make_client(ok_handler) as client:
+            return await client.get("/foo")
+
+    assert asyncio.run(run()) == {"path": "/foo"}
+
+
+def test_async_requests_run_concurrently():
+    in_flight = 0
+    peak = 0
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run():
+        async with make_client(slow_handler) as client:
+            return await asyncio.gather(*(client.get(f"/item/{i}") for i in range(50)))
+
+    results = asyncio.run(run())
+    assert [r["path"] for r in results] == [f"/item/{i}" for i in range(50)]
+    assert peak > 1
+
+
+def test_async_attach_on_error(monkeypatch):
+    attached = []
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda content, name=None, attachment_type=None: attached.append(name),
+    )
+
+    async def run():
+        async with make_client(error_handler) as client:
+            await client.get("/endpoint-that-errors", attach=True)
+
+    with pytest.raises(APIError):
+        asyncio.run(run())
+
+    expected = {
+        "HTTP Request",
+        "Request Headers",
+        "HTTP Response Status",
+        "Response Headers",
+        "Response Body",
+    }
+    missing = expected - set(attached)
+    assert not missing, f"Missing attachments: {missing}"
+
+
+def test_async_records_exchange_with_attach_on_failure(monkeypatch):
+    monkeypatch.setenv("ATTACH_ON_FAILURE", "true")
+    client = make_client(ok_handler)
+
+    asyncio.run(client.post("/items", json={"name": "x"}))
+
+    assert client._last_request.method == "POST"
+    assert client._last_response.status_code == 200
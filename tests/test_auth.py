@@ -0,0 +1,75 @@
+import asyncio
+import base64
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from api_testing_framework.auth import (
+    TOKEN_URL,
+    AsyncSpotifyTokenProvider,
+    SpotifyTokenProvider,
+)
+
+
+class TokenEndpoint:
+    """Local stand-in for the accounts service."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"error": "invalid_client"})
+        return httpx.Response(
+            200, json={"access_token": f"tok-{len(self.requests)}", "expires_in": 3600}
+        )
+
+
+def test_provider_posts_client_credentials():
+    endpoint = TokenEndpoint()
+    with SpotifyTokenProvider(transport=httpx.MockTransport(endpoint)) as provider:
+        assert provider.fetch(" id ", "secret\n") == ("tok-1", 3600)
+
+    request = endpoint.requests[0]
+    assert str(request.url) == TOKEN_URL
+    assert parse_qs(request.content.decode()) == {"grant_type": ["client_credentials"]}
+    expected = base64.b64encode(b"id:secret").decode()
+    assert request.headers["Authorization"] == f"Basic {expected}"
+
+
+def test_provider_reuses_its_client():
+    endpoint = TokenEndpoint()
+    provider = SpotifyTokenProvider(transport=httpx.MockTransport(endpoint))
+    client = provider._client
+
+    tokens = [provider.fetch("id", "secret")[0] for _ in range(3)]
+    provider.close()
+
+    assert tokens == ["tok-1", "tok-2", "tok-3"]
+    assert provider._client is client and client.is_closed
+
+
+def test_provider_raises_on_error_response():
+    endpoint = TokenEndpoint(status=401)
+    with SpotifyTokenProvider(transport=httpx.MockTransport(endpoint)) as provider:
+        with pytest.raises(RuntimeError, match="401"):
+            provider.fetch("id", "wrong")
+
+
+def test_async_provider():
+    endpoint = TokenEndpoint()
+
+    async def run():
+        async with AsyncSpotifyTokenProvider(
+            transport=httpx.MockTransport(endpoint)
+        ) as provider:
+            return await asyncio.gather(
+                *(provider.fetch("id", "secret") for _ in range(3))
+            )
+
+    results = asyncio.run(run())
+    assert sorted(token for token, _ in results) == ["tok-1", "tok-2", "tok-3"]
+    assert len(endpoint.requests) == 3
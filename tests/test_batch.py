@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.batch import RequestSpec
+from api_testing_framework.client import APIClient
+from api_testing_framework.exceptions import APIError
+
+
+class SlowTransport(httpx.BaseTransport):
+    """Sleeps per request and tracks how many requests overlap."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404, json={"error": "not_found"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+
+def test_batch_returns_results_in_input_order():
+    transport = SlowTransport()
+    client = APIClient(
+        base_url="https://api.example.com", token="dummy", transport=transport
+    )
+    specs = [RequestSpec("GET", f"/artists/{i}") for i in range(20)]
+
+    results = client.batch(specs, max_concurrency=10)
+
+    assert [r.data["path"] for r in results] == [f"/artists/{i}" for i in range(20)]
+    # Requests overlapped (not run serially) without exceeding the bound
+    assert 1 < transport.peak <= 10
+
+
+def test_batch_records_per_item_errors_without_aborting():
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=SlowTransport(delay=0),
+    )
+    results = client.batch(
+        [
+            {"method": "GET", "path": "/ok"},
+            {"method": "GET", "path": "/missing"},
+            {"method": "POST", "path": "/ok", "json": {"a": 1}},
+        ],
+        max_concurrency=3,
+    )
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, APIError)
+    assert results[1].error.status_code == 404
+
+
+def test_iter_batch_yields_as_completed():
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=SlowTransport(delay=0),
+    )
+    results = list(client.iter_batch([RequestSpec("GET", "/a")] * 5, 2))
+    assert sorted(r.index for r in results) == list(range(5))
+
+
+def test_closing_iter_batch_early_does_not_wait_for_the_rest():
+    release = threading.Event()
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path != "/fast":
+            release.wait(timeout=10)
+        return httpx.Response(200, json={})
+
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=httpx.MockTransport(handler),
+    )
+    specs = [RequestSpec("GET", "/fast")] + [RequestSpec("GET", "/slow")] * 20
+    results = client.iter_batch(specs, max_concurrency=2)
+    assert next(results).index == 0
+
+    closer = threading.Thread(target=results.close)
+    closer.start()
+    closer.join(timeout=2)
+    try:
+        assert not closer.is_alive()
+    finally:
+        release.set()
+    # The in-flight request finished; the queued ones never started
+    assert len(calls) <= 3
+
+
+def test_batch_rejects_invalid_concurrency():
+    client = APIClient(base_url="https://api.example.com", token="dummy")
+    with pytest.raises(ValueError):
+        client.batch([RequestSpec("GET", "/a")], max_concurrency=0)
+
+
+def test_async_batch_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            token="dummy",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            specs = [RequestSpec("GET", f"/artists/{i}") for i in range(30)]
+            return await client.batch(specs, max_concurrency=5)
+
+    results = asyncio.run(run())
+    assert [r.data["path"] for r in results] == [f"/artists/{i}" for i in range(30)]
+    assert 1 < peak <= 5
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_concurrent_attach_pairs_each_request_with_its_response(asynchronous):
+    attached = []
+
+    def record(client):
+        original = client._attach_exchange_to_allure
+
+        def attach(request, response):
+            attached.append((request.url.path, response.json()["path"]))
+            original(request, response)
+
+        client._attach_exchange_to_allure = attach
+
+    specs = [RequestSpec("GET", f"/a/{i}", attach=True) for i in range(40)]
+    if asynchronous:
+
+        async def handler(request):
+            await asyncio.sleep(0.001)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        async def run():
+            async with AsyncAPIClient(
+                base_url="https://api.example.com",
+                token="dummy",
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                record(client)
+                return await client.batch(specs, max_concurrency=10)
+
+        results = asyncio.run(run())
+    else:
+        client = APIClient(
+            base_url="https://api.example.com",
+            token="dummy",
+            transport=SlowTransport(delay=0.001),
+        )
+        record(client)
+        results = client.batch(specs, max_concurrency=10)
+
+    assert all(r.ok for r in results)
+    assert len(attached) == 40
+    assert all(request == response for request, response in attached)
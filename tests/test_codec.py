@@ -0,0 +1,141 @@
+import datetime
+import json
+import math
+
+import httpx
+import pytest
+
+from api_testing_framework.client import APIClient
+from api_testing_framework.codec import (
+    JSONCodec,
+    available_codecs,
+    get_codec,
+    load_codec,
+)
+from api_testing_framework.redaction import get_redactor, redact_json_prefix
+
+PAYLOAD = {"name": "Café", "items": [1, 2.5, None, True], "nested": {"a": []}}
+
+
+@pytest.fixture(params=available_codecs())
+def codec_name(request, monkeypatch):
+    monkeypatch.setenv("JSON_CODEC", request.param)
+    return request.param
+
+
+def test_codecs_round_trip(codec_name):
+    codec = get_codec()
+    assert codec.name == codec_name
+    body = codec.dumps(PAYLOAD)
+    assert isinstance(body, bytes)
+    assert json.loads(body) == PAYLOAD
+    assert codec.loads(body) == PAYLOAD
+    assert codec.loads(body.decode()) == PAYLOAD
+    assert json.loads(codec.dumps_pretty(PAYLOAD)) == PAYLOAD
+
+
+def test_invalid_json_raises_value_error(codec_name):
+    with pytest.raises(ValueError):
+        get_codec().loads(b"<html>")
+
+
+def test_auto_prefers_orjson_when_installed(monkeypatch):
+    monkeypatch.delenv("JSON_CODEC", raising=False)
+    assert get_codec().name == available_codecs()[-1]
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        load_codec("yaml")
+
+
+def test_client_uses_codec_for_bodies(codec_name):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=request.content)
+
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+    )
+
+    assert client.post("/echo", json=PAYLOAD) == PAYLOAD
+    assert seen[0].headers["Content-Type"] == "application/json"
+    assert seen[0].content == get_codec().dumps(PAYLOAD)
+    client.close()
+
+
+def test_attachments_are_pretty_printed(codec_name):
+    client = APIClient(base_url="https://api.example.com", token="dummy")
+    text, _ = client._sanitize_payload(json.dumps({"a": 1, "password": "x"}))
+
+    assert json.loads(text) == {"a": 1, "password": "***REDACTED***"}
+    assert '\n  "a": 1' in text
+    client.close()
+
+
+needs_orjson = pytest.mark.skipif(
+    "orjson" not in available_codecs(), reason="orjson is not installed"
+)
+
+
+def outcome(fn, arg):
+    """fn(arg), or the exception type it raised; NaN compares by repr."""
+    try:
+        result = fn(arg)
+    except Exception as exc:
+        return type(exc)
+    return repr(result) if isinstance(result, float) and math.isnan(result) else result
+
+
+@needs_orjson
+@pytest.mark.parametrize(
+    "obj",
+    [
+        PAYLOAD,
+        {1: "a"},
+        {1e16: "float key"},
+        {(1, 2): "tuple key"},
+        2**70,
+        [-(2**70), 2**63],
+        float("nan"),
+        {"a": [float("inf")]},
+        datetime.date(2025, 5, 1),
+        {"a": None},
+    ],
+)
+def test_orjson_dumps_like_json(obj):
+    orjson_codec, json_codec = load_codec("orjson"), JSONCodec()
+    assert outcome(orjson_codec.dumps, obj) == outcome(json_codec.dumps, obj)
+
+
+@needs_orjson
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"name": "Caf\xc3\xa9", "n": [1, 2.5, null]}',
+        str(2**70),
+        b"[1, -1180591620717411303424]",
+        b'{"id": "12345678901234567890123", "n": 18446744073709551615}',
+        "NaN",
+        b'{"a": -Infinity}',
+        b"1e400",
+        b"<html>",
+    ],
+)
+def test_orjson_loads_like_json(document):
+    orjson_codec, json_codec = load_codec("orjson"), JSONCodec()
+    assert outcome(orjson_codec.loads, document) == outcome(
+        json_codec.loads, document
+    )
+
+
+def test_attachment_paths_format_non_ascii_alike(codec_name):
+    data = {"name": "Café", "tags": ["ü"]}
+    pretty = get_codec().dumps_pretty(data)
+    streamed = redact_json_prefix(json.dumps(data), 10_000, get_redactor())
+
+    assert pretty == streamed
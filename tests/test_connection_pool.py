@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import DEFAULT_LIMITS, APIClient
+from tests.conftest import KeepAliveHandler
+
+
+def test_warmup_opens_pooled_connections(local_server):
+    client = APIClient(
+        base_url=local_server,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    )
+
+    assert client.warmup(4) == 4
+    assert len(KeepAliveHandler.connections) == 4
+
+    # Subsequent calls reuse the warmed connections instead of opening new ones
+    for _ in range(4):
+        assert client.get("/ok") == {"ok": True}
+    assert len(KeepAliveHandler.connections) == 4
+
+
+def test_async_warmup_opens_pooled_connections(local_server):
+    async def run():
+        async with AsyncAPIClient(base_url=local_server) as client:
+            return await client.warmup(3)
+
+    assert asyncio.run(run()) == 3
+    assert len(KeepAliveHandler.connections) == 3
+
+
+def test_warmup_defaults_to_keepalive_limit():
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+    )
+    assert client.warmup() == DEFAULT_LIMITS.max_keepalive_connections
+
+
+def test_warmup_counts_unreachable_connections():
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    client = APIClient(
+        base_url="https://api.example.com", transport=httpx.MockTransport(refuse)
+    )
+    assert client.warmup(2) == 0
+    with pytest.raises(ValueError):
+        client.warmup(0)
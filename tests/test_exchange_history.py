@@ -0,0 +1,133 @@
+import allure
+import httpx
+import pytest
+
+from api_testing_framework.client import APIClient
+from api_testing_framework.recorder import ExchangeRecorder
+
+
+def make_client(handler):
+    return APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+    )
+
+
+def ok_handler(request):
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.fixture(autouse=True)
+def enable_global_recording(monkeypatch):
+    monkeypatch.setenv("ATTACH_ON_FAILURE", "true")
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    """Capture (step, attachment name) pairs instead of writing to Allure."""
+    calls = []
+    steps = []
+
+    class FakeStep:
+        def __init__(self, title):
+            self.title = title
+
+        def __enter__(self):
+            steps.append(self.title)
+
+        def __exit__(self, *exc_info):
+            steps.pop()
+
+    monkeypatch.setattr(allure, "step", FakeStep)
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda content, name=None, attachment_type=None: calls.append(
+            (steps[-1] if steps else None, name, content)
+        ),
+    )
+    return calls
+
+
+def test_all_recent_exchanges_are_attached(attached):
+    client = make_client(ok_handler)
+    for i in range(5):
+        client.get(f"/call/{i}")
+
+    client._attach_recorded_exchanges_to_allure()
+
+    requests = [
+        (step, content) for step, name, content in attached if name == "HTTP Request"
+    ]
+    assert [content for _, content in requests] == [
+        f"GET https://api.example.com/call/{i}" for i in range(5)
+    ]
+    assert requests[0][0] == "HTTP exchange 1/5: GET /call/0 -> 200"
+    assert requests[-1][0] == "HTTP exchange 5/5: GET /call/4 -> 200"
+
+
+def test_single_exchange_is_attached_without_steps(attached):
+    client = make_client(ok_handler)
+    client.get("/only")
+
+    client._attach_recorded_exchanges_to_allure()
+
+    assert {step for step, _, _ in attached} == {None}
+    assert "HTTP Request" in {name for _, name, _ in attached}
+
+
+def test_buffer_keeps_only_the_latest_exchanges(monkeypatch):
+    monkeypatch.setenv("ATTACH_HISTORY_SIZE", "3")
+    client = make_client(ok_handler)
+    for i in range(5):
+        client.get(f"/call/{i}")
+
+    paths = [req.url.path for req, _ in client._exchanges.exchanges()]
+    assert paths == ["/call/2", "/call/3", "/call/4"]
+
+
+def test_buffer_respects_byte_budget():
+    recorder = ExchangeRecorder(max_exchanges=100, max_bytes=250)
+    request = httpx.Request("GET", "https://api.example.com/")
+    for i in range(5):
+        recorder.record(request, httpx.Response(200, content=b"x" * 100))
+
+    assert len(recorder) == 2
+    assert recorder.nbytes == 200
+
+    # The newest exchange is kept even if it alone is over budget
+    recorder.record(request, httpx.Response(200, content=b"x" * 1000))
+    assert len(recorder) == 1
+
+
+def test_success_path_does_not_serialize(monkeypatch):
+    client = make_client(ok_handler)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("payload serialized on the success path")
+
+    monkeypatch.setattr(client, "_sanitize_payload", fail)
+    monkeypatch.setattr(client, "_format_headers", fail)
+
+    for i in range(3):
+        client.get(f"/call/{i}")
+    assert len(client._exchanges) == 3
+
+
+def test_clear_exchanges():
+    client = make_client(ok_handler)
+    client.get("/call")
+    client.clear_exchanges()
+    assert len(client._exchanges) == 0
+    assert client._last_request is None and client._last_response is None
+
+
+def test_cleared_exchanges_are_not_attached_later(attached):
+    client = make_client(ok_handler)
+    client.get("/previous-test")
+    client.clear_exchanges()
+
+    client._attach_recorded_exchanges_to_allure()
+
+    assert attached == []
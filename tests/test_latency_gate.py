@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from api_testing_framework.metrics import check_slo, compare_to_baseline
+
+CONFTEST = 'pytest_plugins = ["api_testing_framework.pytest_plugin"]'
+
+# The plugin only sees published timings, so the tests publish synthetic
+# ones with a fixed duration instead of sending (and sleeping through) requests
+TEST_FILE = """
+import os
+
+import pytest
+
+from api_testing_framework.timing import RequestTiming, publish
+
+
+def call(path, status=200):
+    publish(
+        RequestTiming(
+            method="GET",
+            url="https://api.example.com" + path,
+            status_code=status,
+            total=float(os.environ.get("FAKE_LATENCY_MS", "1")) / 1000,
+        )
+    )
+
+
+{body}
+"""
+
+
+def summary(count=20, p95=100.0, error_rate=0.0):
+    return {"count": count, "p95_ms": p95, "error_rate": error_rate}
+
+
+def test_compare_applies_relative_and_absolute_tolerance():
+    baseline = {"GET /a": summary(p95=100.0), "GET /b": summary(p95=1.0)}
+    current = {"GET /a": summary(p95=124.0), "GET /b": summary(p95=5.0)}
+
+    # 100ms may grow to 125ms; 1ms to 6.2ms thanks to the 5ms slack
+    assert compare_to_baseline(current, baseline) == []
+
+    current["GET /a"] = summary(p95=130.0)
+    (regression,) = compare_to_baseline(current, baseline)
+    assert regression.endpoint == "GET /a" and regression.metric == "p95_ms"
+    assert regression.baseline == 100.0
+
+
+def test_compare_flags_error_rate_and_skips_thin_or_new_endpoints():
+    baseline = {"GET /a": summary(), "GET /thin": summary(count=2)}
+    current = {
+        "GET /a": summary(error_rate=0.2),
+        "GET /thin": summary(count=2, p95=1000.0),
+        "GET /new": summary(p95=1000.0),
+    }
+
+    regressions = compare_to_baseline(current, baseline)
+
+    assert [(r.endpoint, r.metric) for r in regressions] == [("GET /a", "error_rate")]
+
+
+def test_check_slo_rejects_unknown_limits():
+    assert check_slo("t", summary(p95=200.0), p95_ms=300) == []
+    assert len(check_slo("t", summary(p95=400.0), p95_ms=300)) == 1
+    with pytest.raises(ValueError, match="p42_ms"):
+        check_slo("t", summary(), p42_ms=1)
+
+
+def test_baseline_round_trip_fails_on_regression(pytester, monkeypatch):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(TEST_FILE.format(body="""
+def test_calls():
+    for _ in range(10):
+        call("/items")
+"""))
+
+    saved = pytester.runpytest("--latency-save-baseline=baseline.json")
+    saved.assert_outcomes(passed=1)
+    baseline = json.loads((pytester.path / "baseline.json").read_text())
+    assert baseline["endpoints"]["GET /items"]["count"] == 10
+
+    gate = ["--latency-baseline=baseline.json"]
+    same = pytester.runpytest(*gate)
+    assert same.ret == pytest.ExitCode.OK
+
+    # 1 ms -> 5 ms stays within the default 5 ms slack; 1 ms -> 20 ms does not
+    monkeypatch.setenv("FAKE_LATENCY_MS", "5")
+    assert pytester.runpytest(*gate).ret == pytest.ExitCode.OK
+
+    monkeypatch.setenv("FAKE_LATENCY_MS", "20")
+    slower = pytester.runpytest(*gate)
+    slower.assert_outcomes(passed=1)
+    assert slower.ret == pytest.ExitCode.TESTS_FAILED
+    slower.stdout.fnmatch_lines(["*latency regressions*", "GET /items: p95_ms*"])
+
+
+def test_latency_marker(pytester, monkeypatch):
+    monkeypatch.setenv("FAKE_LATENCY_MS", "20")
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(TEST_FILE.format(body="""
+@pytest.mark.latency(p95_ms=1000)
+def test_within_slo():
+    call("/items")
+
+
+@pytest.mark.latency(p95_ms=5)
+def test_too_slow():
+    call("/items")
+
+
+@pytest.mark.latency(error_rate=0.1, endpoint="GET /broken")
+def test_errors():
+    call("/items")
+    call("/broken", status=500)
+
+
+@pytest.mark.latency(p95_ms=1000)
+def test_no_requests():
+    pass
+"""))
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=1, failed=3)
+    result.stdout.fnmatch_lines(
+        [
+            "*Latency SLO exceeded*",
+            "*test_too_slow: p95_ms*",
+            "*GET /broken: error_rate*",
+            "*latency marker: the test made no requests*",
+        ]
+    )
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.load import (
+    LoadProfile,
+    LoadSuite,
+    Scenario,
+    run_async,
+    run_load,
+)
+from api_testing_framework.load.cli import main
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/broken":
+        return httpx.Response(404, json={"error": "missing"})
+    return httpx.Response(200, json={"ok": True})
+
+
+def make_client() -> APIClient:
+    return APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+# Used by the CLI and multi-process tests, which import it by name
+SUITE = LoadSuite(
+    scenarios=[
+        Scenario("artist", lambda c: c.get("/artists/0TnOYISbd1XYRBk9myaseg"), 3),
+        Scenario("broken", lambda c: c.get("/broken"), 1),
+    ],
+    client_factory=make_client,
+)
+
+
+def test_schedule_ramps_up_then_holds_the_rate():
+    profile = LoadProfile(rate=100, duration=2, ramp_up=1)
+    arrivals = list(profile.arrivals())
+
+    ramp = [t for phase, t in arrivals if phase == "ramp-up"]
+    steady = [t for phase, t in arrivals if phase == "steady"]
+    assert len(ramp) == 50  # half the steady rate on average
+    assert ramp == sorted(ramp) and ramp[-1] < 1
+    assert len(steady) == 200
+    assert steady[0] == 1 and steady[1] - steady[0] == pytest.approx(0.01)
+
+
+def test_slow_responses_do_not_slow_the_send_rate():
+    def slow(client):
+        time.sleep(0.2)
+
+    suite = LoadSuite([Scenario("slow", slow)], client_factory=make_client)
+    profile = LoadProfile(rate=50, duration=0.4)
+
+    start = time.monotonic()
+    report = run_load(suite, profile)
+    elapsed = time.monotonic() - start
+
+    stats = report.phases["steady"]["slow"]
+    assert stats.histogram.count == 20
+    # Open loop: all 20 started on schedule and overlapped
+    assert elapsed < 0.8
+    assert stats.histogram.percentile(50) >= 0.2
+
+
+def test_weights_errors_and_endpoints_are_reported():
+    report = run_load(SUITE, LoadProfile(rate=200, duration=0.5, seed=1))
+
+    steady = report.summary()["steady"]
+    assert steady["artist"]["count"] + steady["broken"]["count"] == 100
+    assert steady["artist"]["count"] > 2 * steady["broken"]["count"]
+    assert steady["broken"]["error_rate"] == 1.0
+    assert steady["artist"]["errors"] == 0
+    assert "GET /artists/{id}" in report.endpoints
+    assert any("steady" in line for line in report.format())
+
+
+def test_max_in_flight_drops_instead_of_queueing():
+    def slow(client):
+        time.sleep(0.3)
+
+    suite = LoadSuite([Scenario("slow", slow)], client_factory=make_client)
+    report = run_load(suite, LoadProfile(rate=50, duration=0.2, max_in_flight=4))
+
+    assert report.phases["steady"]["slow"].histogram.count == 4
+    assert report.dropped == 6
+
+
+def test_async_scenarios_share_an_async_client():
+    async def call(client):
+        await client.get("/items")
+
+    async def handler_async(request):
+        return httpx.Response(200, json={})
+
+    suite = LoadSuite(
+        [Scenario("items", call)],
+        client_factory=lambda: AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler_async),
+        ),
+    )
+
+    report = asyncio.run(run_async(suite, LoadProfile(rate=100, duration=0.2)))
+    assert report.phases["steady"]["items"].histogram.count == 20
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="slow process start-up")
+def test_processes_split_the_schedule():
+    report = run_load(
+        "tests.test_load:SUITE", LoadProfile(rate=100, duration=0.3), processes=2
+    )
+
+    steady = report.summary()["steady"]
+    assert sum(s["count"] for s in steady.values()) == 30
+
+
+def test_cli_prints_report_and_gates_on_errors(tmp_path, capsys):
+    out = tmp_path / "load.json"
+    args = ["tests.test_load", "--rps", "100", "--duration", "0.2", "--json", str(out)]
+
+    assert main(args) == 0
+    assert main(args + ["--max-error-rate", "0.05"]) == 1
+
+    assert "steady" in capsys.readouterr().out
+    data = json.loads(out.read_text())
+    assert set(data["phases"]["steady"]) == {"artist", "broken"}
@@ -0,0 +1,155 @@
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from api_testing_framework.metrics import (
+    LatencyHistogram,
+    LatencyRecorder,
+    normalize_route,
+)
+from api_testing_framework.pytest_plugin import (
+    WORKER_OUTPUT_KEY,
+    get_recorder,
+    pytest_testnodedown,
+    recorder_key,
+)
+from api_testing_framework.timing import RequestTiming
+
+
+def timing(url, seconds, status=200, method="GET"):
+    return RequestTiming(method=method, url=url, status_code=status, total=seconds)
+
+
+@pytest.mark.parametrize(
+    "path, route",
+    [
+        (
+            "/v1/artists/0TnOYISbd1XYRBk9myaseg/top-tracks",
+            "/v1/artists/{id}/top-tracks",
+        ),
+        ("/v1/browse/new-releases?limit=5", "/v1/browse/new-releases"),
+        ("/users/42/playlists", "/users/{id}/playlists"),
+        ("/items/550e8400-e29b-41d4-a716-446655440000", "/items/{id}"),
+        ("/v1/me", "/v1/me"),
+        ("/v1/albums/abcdefghijKLMNOPQRSTuv/tracks", "/v1/albums/{id}/tracks"),
+        ("/v1/recommendations", "/v1/recommendations"),
+    ],
+)
+def test_routes_are_normalized(path, route):
+    assert normalize_route(path) == route
+
+
+def test_percentiles_stay_within_precision():
+    rng = random.Random(1)
+    values = sorted(rng.expovariate(1 / 0.05) for _ in range(20_000))
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+
+    for p in (50, 90, 99):
+        exact = values[int(len(values) * p / 100) - 1]
+        assert hist.percentile(p) == pytest.approx(exact, rel=0.02)
+    assert hist.percentile(100) == pytest.approx(values[-1], abs=1e-6)
+
+
+def test_memory_does_not_grow_with_samples():
+    hist = LatencyHistogram()
+    size = len(hist.counts)
+    for i in range(10_000):
+        hist.record(i / 1000)
+    hist.record(10**6)  # beyond max_seconds: clamped into the top bucket
+
+    assert len(hist.counts) == size
+    assert hist.count == 10_001
+
+
+def test_merged_histograms_equal_one_histogram():
+    rng = random.Random(2)
+    values = [rng.uniform(0.001, 2.0) for _ in range(5000)]
+    whole, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i, v in enumerate(values):
+        whole.record(v)
+        (left if i % 2 else right).record(v)
+
+    merged = LatencyHistogram.from_dict(json.loads(json.dumps(left.to_dict())))
+    merged.merge(right)
+
+    assert merged.to_dict() == whole.to_dict()
+
+
+def test_recorder_groups_by_route_and_counts_errors():
+    recorder = LatencyRecorder()
+    recorder(timing("https://api.spotify.com/v1/artists/0TnOYISbd1XYRBk9myaseg", 0.1))
+    recorder(timing("https://api.spotify.com/v1/artists/3TVXtAsR1Inumwj472S9r4", 0.3))
+    recorder(
+        timing("https://api.spotify.com/v1/artists/3TVXtAsR1Inumwj472S9r4", 1, 500)
+    )
+
+    summary = recorder.summary()
+    assert list(summary) == ["GET /v1/artists/{id}"]
+    assert summary["GET /v1/artists/{id}"]["count"] == 3
+    assert summary["GET /v1/artists/{id}"]["errors"] == 1
+
+
+def test_controller_merges_worker_output(pytestconfig, monkeypatch):
+    controller = LatencyRecorder()
+    monkeypatch.setitem(pytestconfig.stash, recorder_key, controller)
+    worker = LatencyRecorder()
+    worker(timing("https://api.example.com/merge-check", 0.2))
+    node = SimpleNamespace(
+        config=pytestconfig, workeroutput={WORKER_OUTPUT_KEY: worker.to_dict()}
+    )
+
+    pytest_testnodedown(node, None)
+    pytest_testnodedown(node, None)
+
+    assert get_recorder(pytestconfig) is controller
+    assert controller.summary()["GET /merge-check"]["count"] == 2
+
+
+def test_session_summary_is_reported(pytester):
+    pytester.makeconftest('pytest_plugins = ["api_testing_framework.pytest_plugin"]')
+    pytester.makepyfile("""
+        import httpx
+        from api_testing_framework.client import APIClient
+
+        def test_calls():
+            client = APIClient(
+                base_url="https://api.example.com",
+                token="dummy",
+                transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+            )
+            for artist in ("0TnOYISbd1XYRBk9myaseg", "3TVXtAsR1Inumwj472S9r4"):
+                client.get(f"/artists/{artist}/top-tracks")
+        """)
+
+    result = pytester.runpytest("--latency-summary=latency.json")
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*request latency*", "GET /artists/{id}/top-tracks*"])
+    report = json.loads((pytester.path / "latency.json").read_text())
+    assert report["endpoints"]["GET /artists/{id}/top-tracks"]["count"] == 2
+
+
+def test_summary_file_is_opt_in(pytester):
+    pytester.makeconftest('pytest_plugins = ["api_testing_framework.pytest_plugin"]')
+    pytester.makepyfile("""
+        import httpx
+        from api_testing_framework.client import APIClient
+
+        def test_call():
+            client = APIClient(
+                base_url="https://api.example.com",
+                token="dummy",
+                transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+            )
+            client.get("/items")
+        """)
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*request latency*"])
+    assert list(pytester.path.glob("*.json")) == []
@@ -1,3 +1,4 @@
+import json
 import os
 
 import allure
@@ -53,5 +54,55 @@ def test_payload_truncation(monkeypatch):
     assert len(attached) == 1
     body_attachment = attached[0]
 
-    assert body_attachment.endswith("<truncated>"), "Payload was not truncated"
+    assert "<truncated>" in body_attachment, "Payload was not truncated"
     assert len(body_attachment) <= 550, "Truncated payload too large"
+    # The truncated attachment is still a valid JSON document
+    truncated = json.loads(body_attachment)
+    assert truncated["data"][-1] == "<truncated>"
+
+
+class LargeSensitiveTransport(httpx.BaseTransport):
+    """Large payload whose secrets sit beyond and before the truncation point"""
+
+    def handle_request(self, request):
+        items = [{"id": i, "password": f"secret-{i}"} for i in range(200)]
+        return httpx.Response(200, json={"access_token": "top-secret", "items": items})
+
+
+def test_truncated_payload_is_still_redacted(monkeypatch):
+    """
+    Truncation must not fall back to raw text, which would leak redacted fields.
+    """
+    monkeypatch.setenv("REDACT_FIELDS", "access_token,password")
+    attached = []
+
+    def fake_attach(content, name=None, attachment_type=None):
+        if name == "Response Body":
+            attached.append((content, attachment_type))
+
+    monkeypatch.setattr(allure, "attach", fake_attach)
+
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=LargeSensitiveTransport(),
+        token="dummy",
+    )
+    client.get("/large-sensitive", attach=True)
+
+    body, attachment_type = attached[0]
+    assert attachment_type == allure.attachment_type.JSON
+    assert "top-secret" not in body and "secret-" not in body
+    parsed = json.loads(body)
+    assert parsed["access_token"] == "***REDACTED***"
+    assert parsed["items"][0] == {"id": 0, "password": "***REDACTED***"}
+    assert "<truncated>" in body
+
+
+def test_non_json_payload_falls_back_to_text(monkeypatch):
+    monkeypatch.setenv("MAX_PAYLOAD_CHARS", "20")
+    client = APIClient(base_url="https://api.example.com", token="dummy")
+
+    text, attachment_type = client._sanitize_payload("<html>" + "x" * 100)
+
+    assert attachment_type == allure.attachment_type.TEXT
+    assert text == "<html>" + "x" * 14 + "\n\n<truncated>"
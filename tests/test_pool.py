@@ -0,0 +1,147 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api_testing_framework import pool as pool_module
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.pool import (
+    AsyncSharedTransport,
+    SharedTransport,
+    TransportRegistry,
+    get_registry,
+)
+from tests.conftest import KeepAliveHandler
+
+
+def test_registry_shares_one_transport_per_origin():
+    registry = TransportRegistry()
+    first = registry.acquire("https://api.example.com/v1")
+    second = registry.acquire("https://api.example.com/v2")
+    other_host = registry.acquire("https://accounts.example.com")
+    insecure = registry.acquire("https://api.example.com", verify=False)
+
+    assert isinstance(first, SharedTransport)
+    assert first._inner is second._inner
+    assert first._inner is not other_host._inner
+    assert first._inner is not insecure._inner
+    assert len(registry) == 3
+
+    key = registry.make_key("https://api.example.com")
+    assert registry.refcount(key) == 2
+
+    first.close()
+    first.close()  # releasing twice must not drop another client's lease
+    assert registry.refcount(key) == 1
+
+    registry.close_all()
+    assert len(registry) == 0
+
+
+def test_short_lived_clients_reuse_sockets(local_server):
+    registry = get_registry()
+    try:
+        for _ in range(5):
+            with APIClient(base_url=local_server, shared_pool=True) as client:
+                assert client.get("/ok") == {"ok": True}
+
+        # Every client closed, yet the pool (and its socket) survived
+        assert len(KeepAliveHandler.connections) == 1
+        assert registry.refcount(registry.make_key(local_server)) == 0
+    finally:
+        registry.close_all()
+
+
+def test_async_short_lived_clients_reuse_sockets(local_server):
+    async def main():
+        for _ in range(5):
+            client = AsyncAPIClient(base_url=local_server, shared_pool=True)
+            async with client:
+                assert isinstance(client._client._transport, AsyncSharedTransport)
+                assert await client.get("/ok") == {"ok": True}
+        assert get_registry().refcount(get_registry().make_key(local_server)) == 0
+
+    asyncio.run(main())
+    assert len(KeepAliveHandler.connections) == 1
+
+
+def test_async_pools_are_kept_per_event_loop():
+    registry = TransportRegistry()
+    key = registry.make_key("https://api.example.com")
+
+    async def pool():
+        return registry._acquire_on_loop(key, asyncio.get_running_loop())
+
+    async def same_loop():
+        return await pool() is await pool()
+
+    assert asyncio.run(same_loop())
+    assert asyncio.run(pool()) is not asyncio.run(pool())
+
+
+@pytest.fixture
+def closing_registry(monkeypatch):
+    """Process registry that closes a pool as soon as its last lease goes."""
+    registry = TransportRegistry(idle_timeout=0)
+    monkeypatch.setattr(pool_module, "_registry", registry)
+    yield registry
+    registry.close_all()
+
+
+def test_pool_is_closed_after_the_last_client(local_server, closing_registry):
+    first = APIClient(base_url=local_server, shared_pool=True)
+    second = APIClient(base_url=local_server, shared_pool=True)
+    first.get("/ok")
+    pool = first._client._transport._inner._pool
+    assert len(pool.connections) == 1
+
+    first.close()
+    assert len(pool.connections) == 1 and len(closing_registry) == 1
+    second.close()
+    assert pool.connections == [] and len(closing_registry) == 0
+
+
+def test_idle_pool_is_kept_for_the_next_client():
+    registry = TransportRegistry(idle_timeout=60)
+    first = registry.acquire("https://api.example.com")
+    first.close()
+    second = registry.acquire("https://api.example.com")
+
+    assert second._inner is first._inner
+    registry.close_all()
+
+
+def test_async_pool_is_closed_after_the_last_client(local_server, closing_registry):
+    async def main():
+        async with AsyncAPIClient(base_url=local_server, shared_pool=True) as client:
+            await client.get("/ok")
+            pool = client._client._transport._entry.transport._pool
+            assert len(pool.connections) == 1
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool.connections == [] and len(closing_registry) == 0
+
+
+def test_idle_async_pool_is_closed_when_the_loop_ends(local_server):
+    async def main():
+        async with AsyncAPIClient(base_url=local_server, shared_pool=True) as client:
+            await client.get("/ok")
+            return client._client._transport._entry.transport._pool
+
+    # The default idle timeout outlives the loop; asyncio.run still closes it
+    pool = asyncio.run(main())
+    assert pool.connections == []
+
+
+def test_explicit_transport_bypasses_registry():
+    registry = get_registry()
+    before = len(registry)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    client = APIClient(
+        base_url="https://unshared.example.com", transport=transport, shared_pool=True
+    )
+
+    assert client.get("/x") == {}
+    assert len(registry) == before
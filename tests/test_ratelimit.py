@@ -0,0 +1,156 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.ratelimit import RateLimiter, RateRule, TokenBucket
+from api_testing_framework.retry import RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def request(url="https://api.spotify.com/v1/artists/1"):
+    return httpx.Request("GET", url)
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 1.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_slows_down_on_429_and_recovers():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10.0, recovery=1.0, clock=clock)
+
+    bucket.throttled()
+    assert bucket.rate == 5.0
+    bucket.throttled()
+    assert bucket.rate == 2.5
+
+    for _ in range(20):
+        bucket.succeeded()
+    assert bucket.rate == 10.0
+
+
+def test_retry_after_pauses_the_bucket():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4.0, burst=4, clock=clock)
+
+    bucket.throttled(retry_after=3.0)
+    # Rate halved to 2/s, first token only after the 3s pause
+    assert bucket.reserve() == pytest.approx(3.5)
+    assert bucket.reserve() == pytest.approx(4.0)
+
+
+def test_rules_match_host_and_path():
+    limiter = RateLimiter(
+        per_host=10.0,
+        rules=[RateRule("api.spotify.com/v1/search*", rate=1.0)],
+    )
+
+    assert len(limiter.buckets_for(request())) == 1
+    assert len(limiter.buckets_for(request("https://api.spotify.com/v1/search"))) == 2
+    other = limiter.buckets_for(request("https://accounts.spotify.com/api/token"))
+    assert other[0] is not limiter.buckets_for(request())[0]
+
+
+def test_client_is_paced_by_limiter():
+    clock = FakeClock()
+    limiter = RateLimiter(per_host=5.0, burst=1, sleep=clock.sleep, clock=clock)
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+        token="dummy",
+        rate_limiter=limiter,
+    )
+
+    for _ in range(6):
+        client.get("/items")
+
+    assert clock.now == pytest.approx(1.0)
+    assert limiter.stats.requests == 6
+    assert limiter.stats.delayed == 5
+
+
+def test_429_responses_lower_the_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(per_host=10.0, sleep=clock.sleep, clock=clock)
+    responses = [
+        httpx.Response(
+            429, json={"error": "rate limited"}, headers={"Retry-After": "1"}
+        ),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(lambda r: responses.pop(0)),
+        token="dummy",
+        rate_limiter=limiter,
+        retry=RetryPolicy(sleep=lambda _: None, budget=RetryBudget()),
+    )
+
+    assert client.get("/items") == {"ok": True}
+    assert limiter.stats.throttled == 1
+    # The retry waited out the Retry-After pause inside the limiter
+    assert clock.now >= 1.0
+    bucket = limiter.buckets_for(request("https://api.example.com/items"))[0]
+    assert bucket.rate < 10.0
+
+
+def test_limiter_is_shared_across_threads():
+    clock = FakeClock()  # frozen, so waits only grow with reservations
+    limiter = RateLimiter(per_host=1000.0, burst=1, sleep=lambda _: None, clock=clock)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            wait = limiter.acquire(request())
+            with lock:
+                waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Every reservation got its own slot, 1ms apart
+    assert sorted(round(w * 1000) for w in waits) == list(range(40))
+
+
+def test_async_client_is_paced_by_limiter():
+    limiter = RateLimiter(per_host=50.0, burst=1)
+
+    async def handler(request):
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            rate_limiter=limiter,
+        ) as client:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(client.get("/items") for _ in range(5)))
+            return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.07
+    assert limiter.stats.delayed == 4
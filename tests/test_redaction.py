@@ -0,0 +1,108 @@
+import json
+
+import allure
+import httpx
+
+from api_testing_framework.client import APIClient
+from api_testing_framework.redaction import (
+    REDACTED,
+    Redactor,
+    get_redactor,
+    redact_json_prefix,
+)
+
+
+def test_exact_glob_and_path_rules():
+    redactor = Redactor(["password", "*token*", "user.profile.email"])
+    payload = {
+        "password": "p@ss",
+        "refresh_token": "r1",
+        "items": [{"tokenType": "bearer", "user": {"profile": {"email": "a@b.c"}}}],
+        "email": "public@example.com",
+    }
+
+    result = redactor.redact(payload)
+
+    assert result["password"] == REDACTED
+    assert result["refresh_token"] == REDACTED
+    assert result["items"][0]["tokenType"] == REDACTED
+    assert result["items"][0]["user"]["profile"]["email"] == REDACTED
+    # Path rules only match under the given parents
+    assert result["email"] == "public@example.com"
+    # The input is never mutated
+    assert payload["password"] == "p@ss"
+
+
+def test_untouched_subtrees_are_not_copied():
+    redactor = Redactor(["password"])
+    clean = {"a": [{"b": 1}], "c": {"d": 2}}
+    assert redactor.redact(clean) is clean
+
+    mixed = {"public": {"x": [1, 2]}, "secret": {"password": "p"}}
+    result = redactor.redact(mixed)
+    assert result is not mixed
+    assert result["public"] is mixed["public"]
+    assert result["secret"] == {"password": REDACTED}
+
+
+def test_redactor_is_cached_and_follows_env(monkeypatch):
+    monkeypatch.setenv("REDACT_FIELDS", "token")
+    first = get_redactor()
+    assert get_redactor() is first
+    assert first.is_sensitive("token")
+
+    monkeypatch.setenv("REDACT_FIELDS", "secret")
+    second = get_redactor()
+    assert second is not first
+    assert second.is_sensitive("secret") and not second.is_sensitive("token")
+
+
+def test_sensitive_headers_are_redacted_in_attachments(monkeypatch):
+    attached = []
+    monkeypatch.delenv("REDACT_HEADERS", raising=False)
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda content, name=None, attachment_type=None: attached.append(
+            (name, content)
+        ),
+    )
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, json={"ok": True}, headers={"Set-Cookie": "session=abc"}
+        )
+    )
+    client = APIClient(
+        base_url="https://api.example.com", token="secret-token", transport=transport
+    )
+
+    client.get("/me", attach=True)
+
+    attachments = dict(attached)
+    assert "secret-token" not in attachments["Request Headers"]
+    assert f"authorization: {REDACTED}" in attachments["Request Headers"]
+    assert "session=abc" not in attachments["Response Headers"]
+
+
+def test_streaming_redaction_matches_json_dumps_layout():
+    doc = {
+        "a": [1, 2.5, None, True, "é"],
+        "empty_obj": {},
+        "empty_list": [],
+        "nested": {"password": {"deep": [1]}, "x": "y"},
+    }
+    redactor = Redactor(["password"])
+
+    result = redact_json_prefix(json.dumps(doc), 10_000, redactor)
+
+    assert result == json.dumps(redactor.redact(doc), indent=2)
+
+
+def test_streaming_redaction_stops_at_budget():
+    doc = {"items": [{"id": i, "name": "x" * 20} for i in range(100_000)]}
+
+    result = redact_json_prefix(json.dumps(doc), 500, Redactor([]))
+
+    # Only the marker and closing brackets go past the budget
+    assert len(result) <= 550
+    assert "<truncated>" in json.loads(result)["items"][-1]
@@ -0,0 +1,181 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.auth import SpotifyTokenProvider
+from api_testing_framework.client import APIClient
+from api_testing_framework.redaction import REDACTED
+from api_testing_framework.replay import CassetteMiss, ReplayTransport
+from api_testing_framework.spotify.client import SpotifyClient
+
+BASE_URL = "https://api.example.com"
+
+
+class Upstream:
+    """MockTransport handler standing in for the live API; counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if request.url.path == "/token":
+            return httpx.Response(
+                200, json={"access_token": "live-token", "expires_in": 3600}
+            )
+        if request.method == "POST":
+            return httpx.Response(201, json={"echo": request.content.decode()})
+        return httpx.Response(
+            200,
+            json={"path": request.url.path, "call": self.calls},
+            headers={"Set-Cookie": "session=abc"},
+        )
+
+
+def record(path, upstream, calls):
+    transport = ReplayTransport(
+        path, mode="record", transport=httpx.MockTransport(upstream)
+    )
+    with APIClient(base_url=BASE_URL, token="dummy", transport=transport) as client:
+        for call in calls:
+            call(client)
+    return transport
+
+
+def test_once_records_then_replays_without_the_network(tmp_path):
+    path = tmp_path / "items.cassette"
+    upstream = Upstream()
+    transport = ReplayTransport(path, transport=httpx.MockTransport(upstream))
+    assert transport.recording
+
+    with APIClient(base_url=BASE_URL, token="dummy", transport=transport) as client:
+        first = client.get("/items", params={"a": 1, "b": 2})
+    assert path.exists() and upstream.calls == 1
+
+    replay = ReplayTransport(path, transport=httpx.MockTransport(upstream))
+    assert not replay.recording
+    with APIClient(base_url=BASE_URL, token="dummy", transport=replay) as client:
+        # Query order does not matter: keys use the normalized URL
+        assert client.get("/items", params={"b": 2, "a": 1}) == first
+    assert upstream.calls == 1
+
+
+def test_repeated_requests_replay_in_order_then_repeat_the_last(tmp_path):
+    path = tmp_path / "c.cassette"
+    record(path, Upstream(), [lambda c: c.get("/items")] * 2)
+
+    with APIClient(
+        base_url=BASE_URL, transport=ReplayTransport(path, mode="replay")
+    ) as client:
+        calls = [client.get("/items")["call"] for _ in range(3)]
+    assert calls == [1, 2, 2]
+
+
+def test_request_bodies_are_part_of_the_key(tmp_path):
+    path = tmp_path / "c.cassette"
+    record(
+        path,
+        Upstream(),
+        [lambda c: c.post("/items", json={"n": 1}), lambda c: c.post("/items")],
+    )
+
+    replay = ReplayTransport(path, mode="replay")
+    with APIClient(base_url=BASE_URL, transport=replay) as client:
+        assert client.post("/items", json={"n": 1}) == {"echo": '{"n":1}'}
+        assert client.post("/items") == {"echo": ""}
+        with pytest.raises(CassetteMiss):
+            client.post("/items", json={"n": 2})
+        with pytest.raises(CassetteMiss):
+            client.get("/unrecorded")
+
+
+def test_recorded_secrets_are_redacted(tmp_path):
+    path = tmp_path / "c.cassette"
+    upstream = Upstream()
+    transport = ReplayTransport(
+        path, mode="record", transport=httpx.MockTransport(upstream)
+    )
+    with SpotifyTokenProvider(BASE_URL + "/token", transport=transport) as provider:
+        assert provider.fetch("id", "secret")[0] == "live-token"
+    transport.close()
+
+    raw = path.read_bytes()
+    assert b"live-token" not in raw and b"session=abc" not in raw
+
+    replay = ReplayTransport(path, mode="replay")
+    with SpotifyTokenProvider(BASE_URL + "/token", transport=replay) as provider:
+        assert provider.fetch("id", "secret") == (REDACTED, 3600)
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    def same(request):
+        return httpx.Response(200, json={"items": ["x" * 1000]})
+
+    path = tmp_path / "c.cassette"
+    record(path, same, [lambda c, i=i: c.get(f"/page/{i}") for i in range(10)])
+
+    assert path.stat().st_size < 2000
+    assert len(ReplayTransport(path, mode="replay")) == 10
+
+
+def test_spotify_client_replays_through_the_same_transport(tmp_path):
+    path = tmp_path / "spotify.cassette"
+    base_url = "https://api.spotify.com/v1"
+    album = {
+        "album_type": "album",
+        "artists": [{"id": "a1", "name": "Artist"}],
+        "id": "al1",
+        "name": "Album",
+        "release_date": "2025-05-01",
+        "total_tracks": 1,
+        "images": [],
+    }
+    track = {"id": "t1", "name": "Song", "album": album, "popularity": 50}
+    payload = {"tracks": [{**track, "artists": [], "preview_url": None}]}
+
+    def upstream(request):
+        if request.url.host == "accounts.spotify.com":
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 3600})
+        return httpx.Response(200, json=payload)
+
+    def top_tracks(transport):
+        with SpotifyClient(
+            base_url=base_url,
+            transport=transport,
+            token_provider=SpotifyTokenProvider(transport=transport),
+        ) as client:
+            return client.get_artist_top_tracks("3TVXtAsR1Inumwj472S9r4")
+
+    recorded = top_tracks(
+        ReplayTransport(path, mode="record", transport=httpx.MockTransport(upstream))
+    )
+    assert top_tracks(ReplayTransport(path, mode="replay")) == recorded
+
+
+def test_async_clients_record_and_replay(tmp_path):
+    path = tmp_path / "c.cassette"
+
+    async def upstream(request):
+        return httpx.Response(200, json={"ok": True})
+
+    async def fetch(transport):
+        async with AsyncAPIClient(base_url=BASE_URL, transport=transport) as client:
+            return await client.get("/items")
+
+    recorder = ReplayTransport(
+        path, mode="record", transport=httpx.MockTransport(upstream)
+    )
+    assert asyncio.run(fetch(recorder)) == {"ok": True}
+    assert asyncio.run(fetch(ReplayTransport(path, mode="replay"))) == {"ok": True}
+
+
+def test_invalid_mode_and_file_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ReplayTransport(tmp_path / "c.cassette", mode="rewind")
+
+    bogus = tmp_path / "bogus.cassette"
+    bogus.write_bytes(b"not a cassette")
+    with pytest.raises(ValueError):
+        ReplayTransport(bogus)
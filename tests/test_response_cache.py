@@ -0,0 +1,172 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.cache import ResponseCache
+from api_testing_framework.client import APIClient
+from api_testing_framework.exceptions import APIError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingHandler:
+    def __init__(self, status=200, body=None):
+        self.calls = []
+        self.status = status
+        self.body = body
+
+    def __call__(self, request):
+        self.calls.append(str(request.url))
+        body = self.body if self.body is not None else {"path": request.url.path}
+        return httpx.Response(self.status, json=body)
+
+
+def make_client(handler, cache):
+    return APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+        cache=cache,
+    )
+
+
+def test_repeated_get_is_served_from_cache():
+    handler = CountingHandler()
+    cache = ResponseCache()
+    client = make_client(handler, cache)
+
+    first = client.get("/albums", params={"limit": 20})
+    second = client.get("/albums", params={"limit": 20})
+
+    assert first == second == {"path": "/albums"}
+    assert len(handler.calls) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_cached_data_is_decoded_per_call():
+    cache = ResponseCache()
+    client = make_client(CountingHandler(), cache)
+
+    client.get("/albums")["path"] = "mutated"
+    assert client.get("/albums") == {"path": "/albums"}
+
+
+def test_key_normalizes_query_order_and_host_case():
+    a = httpx.Request("GET", "https://API.example.com/x?b=2&a=1")
+    b = httpx.Request("GET", "https://api.example.com/x?a=1&b=2")
+    c = httpx.Request("GET", "https://api.example.com/x?a=1&b=3")
+    assert ResponseCache.make_key(a) == ResponseCache.make_key(b)
+    assert ResponseCache.make_key(a) != ResponseCache.make_key(c)
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    handler = CountingHandler()
+    client = make_client(handler, ResponseCache(ttl=10, clock=clock))
+
+    client.get("/albums")
+    clock.now = 9.9
+    client.get("/albums")
+    clock.now = 10.0
+    client.get("/albums")
+
+    assert len(handler.calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    handler = CountingHandler()
+    cache = ResponseCache(max_entries=2)
+    client = make_client(handler, cache)
+
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")  # /a is now the most recently used
+    client.get("/c")  # evicts /b
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    client.get("/a")
+    client.get("/b")
+    assert [url.rsplit("/", 1)[1] for url in handler.calls] == ["a", "b", "c", "b"]
+
+
+def test_memory_budget_limits_entries():
+    cache = ResponseCache(max_bytes=1000)
+    client = make_client(CountingHandler(body={"data": "x" * 400}), cache)
+
+    for path in ("/a", "/b", "/c"):
+        client.get(path)
+
+    assert len(cache) == 2
+    assert cache.nbytes <= 1000
+
+
+def test_bypass_patterns_skip_the_cache():
+    handler = CountingHandler()
+    cache = ResponseCache(bypass=["/me*"])
+    client = make_client(handler, cache)
+
+    client.get("/me/player")
+    client.get("/me/player")
+
+    assert len(handler.calls) == 2
+    assert len(cache) == 0
+    assert cache.stats.bypassed == 2
+
+
+def test_only_successful_gets_are_cached():
+    handler = CountingHandler()
+    cache = ResponseCache()
+    client = make_client(handler, cache)
+
+    client.post("/albums", json={"name": "x"})
+    client.post("/albums", json={"name": "x"})
+    assert len(handler.calls) == 2
+    assert len(cache) == 0
+
+
+def test_error_responses_are_not_cached():
+    handler = CountingHandler(status=404, body={"error": "not found"})
+    cache = ResponseCache()
+    client = make_client(handler, cache)
+
+    with pytest.raises(APIError):
+        client.get("/missing")
+    assert len(cache) == 0
+
+
+def test_cache_is_shared_between_clients():
+    handler = CountingHandler()
+    cache = ResponseCache()
+    make_client(handler, cache).get("/albums")
+    make_client(handler, cache).get("/albums")
+
+    assert len(handler.calls) == 1
+
+
+def test_async_client_uses_cache():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            cache=ResponseCache(),
+        ) as client:
+            return [await client.get("/albums") for _ in range(3)]
+
+    assert asyncio.run(run()) == [{"ok": True}] * 3
+    assert calls == ["/albums"]
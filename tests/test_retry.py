@@ -0,0 +1,194 @@
+import asyncio
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.exceptions import APIError
+from api_testing_framework.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class ScriptedHandler:
+    """Replays the given responses (or exceptions) in order, then 200s."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        step = self.script.pop(0) if self.script else httpx.Response(200, json={})
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+def make_policy(**kwargs):
+    sleeps = []
+    kwargs.setdefault("budget", RetryBudget())
+    policy = RetryPolicy(sleep=sleeps.append, **kwargs)
+    return policy, sleeps
+
+
+def make_client(handler, policy):
+    return APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+        retry=policy,
+    )
+
+
+def test_client_errors_are_not_retried():
+    handler = ScriptedHandler(*[httpx.Response(404, json={"error": "missing"})] * 3)
+    policy, sleeps = make_policy()
+
+    with pytest.raises(APIError) as excinfo:
+        make_client(handler, policy).get("/missing")
+
+    assert excinfo.value.status_code == 404
+    assert handler.calls == 1
+    assert sleeps == []
+
+
+def test_server_errors_are_retried_until_attempts_run_out():
+    handler = ScriptedHandler(*[httpx.Response(500, json={"error": "boom"})] * 3)
+    policy, sleeps = make_policy(max_attempts=3, backoff=0.5)
+
+    with pytest.raises(APIError):
+        make_client(handler, policy).get("/flaky")
+
+    assert handler.calls == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0  # full jitter
+    assert policy.stats.retries == 2
+    assert policy.stats.gave_up == 1
+    assert policy.stats.by_reason == {"500": 2}
+
+
+def test_retry_after_is_honoured():
+    handler = ScriptedHandler(
+        httpx.Response(429, json={"error": "slow down"}, headers={"Retry-After": "2"})
+    )
+    policy, sleeps = make_policy(backoff=0.1)
+
+    assert make_client(handler, policy).get("/throttled") == {}
+    assert handler.calls == 2
+    assert 2.0 <= sleeps[0] <= 2.1
+
+
+def test_retry_after_beyond_limit_gives_up_immediately():
+    handler = ScriptedHandler(
+        httpx.Response(429, json={}, headers={"Retry-After": "3600"})
+    )
+    policy, sleeps = make_policy(max_retry_after=30)
+
+    with pytest.raises(APIError):
+        make_client(handler, policy).get("/throttled")
+    assert handler.calls == 1
+
+
+def test_transport_errors_are_retried():
+    handler = ScriptedHandler(httpx.ConnectError("refused"))
+    policy, _ = make_policy()
+
+    assert make_client(handler, policy).get("/") == {}
+    assert policy.stats.by_reason == {"ConnectError": 1}
+
+
+def test_non_json_error_body_is_retried():
+    handler = ScriptedHandler(httpx.Response(502, text="<html>Bad Gateway</html>"))
+    policy, _ = make_policy()
+
+    assert make_client(handler, policy).get("/") == {}
+    assert handler.calls == 2
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [httpx.ReadTimeout("timed out"), httpx.Response(503, json={})],
+    ids=["read-timeout", "503"],
+)
+def test_post_is_not_retried_after_it_may_have_been_applied(failure):
+    handler = ScriptedHandler(failure)
+    policy, sleeps = make_policy()
+
+    with pytest.raises((httpx.ReadTimeout, APIError)):
+        make_client(handler, policy).post("/orders", json={"n": 1})
+    assert handler.calls == 1 and sleeps == []
+
+
+def test_post_is_retried_after_connect_errors():
+    handler = ScriptedHandler(httpx.ConnectError("refused"))
+    policy, _ = make_policy()
+
+    assert make_client(handler, policy).post("/orders", json={"n": 1}) == {}
+    assert handler.calls == 2
+
+
+def test_post_retries_can_be_opted_into():
+    handler = ScriptedHandler(httpx.ReadTimeout("timed out"))
+    policy, _ = make_policy(methods={"GET", "POST"})
+
+    assert make_client(handler, policy).post("/orders", json={"n": 1}) == {}
+    assert handler.calls == 2
+
+
+def test_async_post_is_not_retried_after_a_read_timeout():
+    handler = ScriptedHandler(httpx.ReadTimeout("timed out"))
+    policy, _ = make_policy()
+
+    async def main():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            token="dummy",
+            retry=policy,
+        ) as client:
+            await client.post("/orders", json={"n": 1})
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(main())
+    assert handler.calls == 1
+
+
+def test_budget_limits_retries():
+    handler = ScriptedHandler(*[httpx.Response(503, json={})] * 10)
+    policy, sleeps = make_policy(budget=RetryBudget(ratio=0.0, initial=1.0))
+    client = make_client(handler, policy)
+
+    with pytest.raises(APIError):
+        client.get("/down")
+    with pytest.raises(APIError):
+        client.get("/down")
+
+    # One retry paid for, then the budget refuses the rest
+    assert len(sleeps) == 1
+    assert handler.calls == 3
+    assert policy.stats.budget_denied == 2
+
+
+def test_parse_retry_after_http_date():
+    now = 1_700_000_000
+    assert parse_retry_after(formatdate(now + 30, usegmt=True), now=now) == 30
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after(None) is None
+
+
+def test_async_client_retries_server_errors():
+    script = [httpx.Response(503, json={}), httpx.Response(200, json={"ok": True})]
+
+    async def handler(request):
+        return script.pop(0)
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(backoff=0.0, budget=RetryBudget()),
+        ) as client:
+            return await client.get("/")
+
+    assert asyncio.run(run()) == {"ok": True}
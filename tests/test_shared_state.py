@@ -0,0 +1,175 @@
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+import pytest
+
+from api_testing_framework.shared import (
+    SharedTokenBucket,
+    SharedTokenCache,
+    shared_dir,
+    shared_rate_limiter,
+)
+from api_testing_framework.spotify.client import AsyncSpotifyClient, SpotifyClient
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="forked workers need a POSIX platform"
+)
+
+
+def _worker_fetch(directory, log_path):
+    def fetch():
+        with open(log_path, "a") as log:
+            log.write(f"{os.getpid()}\n")
+        time.sleep(0.05)  # give the other workers time to pile up on the lock
+        return "shared-token", 3600
+
+    token, _ = SharedTokenCache(directory).get_or_fetch("client-id", fetch)
+    assert token == "shared-token"
+
+
+def test_token_is_fetched_once_across_processes(tmp_path):
+    log_path = tmp_path / "fetches.log"
+    ctx = multiprocessing.get_context("fork")
+    workers = [
+        ctx.Process(target=_worker_fetch, args=(str(tmp_path), str(log_path)))
+        for _ in range(4)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join(10)
+
+    assert [w.exitcode for w in workers] == [0] * 4
+    assert len(log_path.read_text().splitlines()) == 1
+
+
+def test_expired_tokens_are_refetched(tmp_path):
+    cache = SharedTokenCache(str(tmp_path), margin=10)
+    cache.put("client-id", "old", expires_in=5)  # inside the margin already
+
+    assert cache.get("client-id") is None
+    token, expires_at = cache.get_or_fetch("client-id", lambda: ("new", 3600))
+    assert token == "new"
+    assert cache.get("client-id") == ("new", expires_at)
+
+
+def test_secrets_and_ids_are_not_written(tmp_path):
+    SharedTokenCache(str(tmp_path)).put("my-client-id", "tok", 3600)
+
+    content = (tmp_path / "tokens.json").read_text()
+    assert "my-client-id" not in content
+    assert os.stat(tmp_path / "tokens.json").st_mode & 0o077 == 0
+
+
+def test_default_directory_is_private_outside_xdist(monkeypatch, tmp_path):
+    monkeypatch.delenv("API_TESTING_SHARED_DIR", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_TESTRUNUID", raising=False)
+    private = shared_dir()
+    assert "api-testing-framework-" in os.path.basename(private)
+    assert os.stat(private).st_mode & 0o077 == 0
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "run42")
+    assert shared_dir() == str(tmp_path / "api-testing-framework" / "run42")
+
+
+def test_buckets_with_the_same_name_share_one_budget(tmp_path):
+    a = SharedTokenBucket("host:api", rate=1.0, burst=2, directory=str(tmp_path))
+    b = SharedTokenBucket("host:api", rate=1.0, burst=2, directory=str(tmp_path))
+    other = SharedTokenBucket("host:other", rate=1.0, burst=2, directory=str(tmp_path))
+
+    assert a.reserve() == 0.0
+    assert b.reserve() == 0.0
+    assert a.reserve() == pytest.approx(1.0, abs=0.05)
+    assert b.reserve() == pytest.approx(2.0, abs=0.05)
+    assert other.reserve() == 0.0
+
+
+def test_throttling_is_seen_by_every_process(tmp_path):
+    a = SharedTokenBucket("host:api", rate=8.0, directory=str(tmp_path))
+    b = SharedTokenBucket("host:api", rate=8.0, directory=str(tmp_path))
+
+    a.throttled()
+    b.reserve()
+    assert b.rate == 4.0
+
+
+def test_shared_rate_limiter_paces_separate_limiters(tmp_path):
+    first = shared_rate_limiter(per_host=1.0, burst=1, directory=str(tmp_path))
+    second = shared_rate_limiter(per_host=1.0, burst=1, directory=str(tmp_path))
+    request = httpx.Request("GET", "https://api.example.com/items")
+
+    waits = [limiter._reserve(request) for limiter in (first, second, first, second)]
+    assert [round(w) for w in waits] == [0, 1, 2, 3]
+
+
+class FakeTokenProvider:
+    def __init__(self):
+        self.calls = []
+
+    def fetch(self, client_id, client_secret):
+        self.calls.append(client_id)
+        return "cached-token", 3600
+
+
+def test_spotify_clients_share_cached_token(tmp_path):
+    provider = FakeTokenProvider()
+    cache = SharedTokenCache(str(tmp_path))
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    clients = [
+        SpotifyClient(
+            base_url="https://api.example.com",
+            transport=transport,
+            token_cache=cache,
+            token_provider=provider,
+        )
+        for _ in range(3)
+    ]
+    for client in clients:
+        client.get("/me")
+        client.close()
+
+    assert len(provider.calls) == 1
+    assert {c._token for c in clients} == {"cached-token"}
+
+
+class FakeAsyncTokenProvider:
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, client_id, client_secret):
+        self.calls.append(client_id)
+        await asyncio.sleep(0.05)  # let the other clients reach the cache
+        return "cached-token", 3600
+
+
+def test_async_spotify_clients_share_cached_token(tmp_path):
+    provider = FakeAsyncTokenProvider()
+    cache = SharedTokenCache(str(tmp_path))
+
+    async def handler(request):
+        return httpx.Response(200, json={})
+
+    async def run():
+        clients = [
+            AsyncSpotifyClient(
+                base_url="https://api.example.com",
+                transport=httpx.MockTransport(handler),
+                token_cache=cache,
+                token_provider=provider,
+            )
+            for _ in range(3)
+        ]
+        await asyncio.gather(*(c.get("/me") for c in clients))
+        for client in clients:
+            await client.aclose()
+        return clients
+
+    clients = asyncio.run(run())
+    assert len(provider.calls) == 1
+    assert {c._token for c in clients} == {"cached-token"}
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.singleflight import AsyncSingleFlight, SingleFlight
+from tests.conftest import wait_for
+
+WORKERS = 8
+
+
+class GatedHandler:
+    """Holds every request until `release` is set, counting upstream calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.calls += 1
+        assert self.release.wait(5)
+        return httpx.Response(200, json={"artist": request.url.path})
+
+
+def make_client(handler, **kwargs):
+    return APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+        **kwargs,
+    )
+
+
+def test_concurrent_identical_gets_share_one_request():
+    handler = GatedHandler()
+    client = make_client(handler, coalesce=True)
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        futures = [pool.submit(client.get, "/artists/1") for _ in range(WORKERS)]
+        wait_for(lambda: client._flights.coalesced == WORKERS - 1)
+        handler.release.set()
+        results = [f.result() for f in futures]
+
+    assert handler.calls == 1
+    assert results == [{"artist": "/artists/1"}] * WORKERS
+    assert client._flights.executed == 1
+
+
+def test_different_urls_are_not_merged():
+    handler = GatedHandler()
+    handler.release.set()
+    client = make_client(handler, coalesce=True)
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(pool.map(lambda i: client.get(f"/artists/{i}"), range(WORKERS)))
+
+    assert handler.calls == WORKERS
+
+
+def test_writes_are_never_coalesced():
+    calls = []
+    client = make_client(
+        lambda request: calls.append(request) or httpx.Response(201, json={}),
+        coalesce=True,
+    )
+    client.post("/playlists", json={"name": "x"})
+    client.post("/playlists", json={"name": "x"})
+
+    assert len(calls) == 2
+    assert client._flights.executed == 0
+
+
+def test_leader_error_reaches_every_waiter():
+    flights = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        wait_for(lambda: flights.coalesced == WORKERS - 1)
+        raise httpx.ConnectError("boom")
+
+    def call(_):
+        with pytest.raises(httpx.ConnectError):
+            flights.do("key", fail)
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        first = pool.submit(call, 0)
+        started.wait(5)
+        rest = [pool.submit(call, i) for i in range(1, WORKERS)]
+        for future in [first, *rest]:
+            future.result()
+
+    # The failed call is not remembered
+    assert flights.do("key", lambda: "ok") == "ok"
+
+
+def test_async_concurrent_identical_gets_share_one_request():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+            coalesce=True,
+        ) as client:
+            return await asyncio.gather(
+                *(client.get("/artists/1") for _ in range(WORKERS))
+            )
+
+    assert asyncio.run(run()) == [{"ok": True}] * WORKERS
+    assert calls == ["/artists/1"]
+
+
+def test_async_cancelled_follower_does_not_cancel_leader():
+    flights = AsyncSingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        leader = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(run()) == "done"
+    assert flights.coalesced == 1
+
+
+def test_async_cancelled_leader_does_not_cancel_followers():
+    flights = AsyncSingleFlight()
+    release = None
+
+    async def slow():
+        await release.wait()
+        return "done"
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        leader = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "done"
+    assert (flights.executed, flights.coalesced) == (1, 1)
@@ -0,0 +1,179 @@
+import asyncio
+import json
+
+import allure
+import httpx
+import pytest
+
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.exceptions import APIError
+from api_testing_framework.jsonstream import JSONItemStream, JSONTokenizer
+
+DOCUMENT = {
+    "albums": {
+        "href": "https://api.example.com/albums",
+        "items": [
+            {"id": f"album{i}", "name": f'Album "{i}" \u00e9', "tracks": [i, 1.5]}
+            for i in range(50)
+        ],
+        "limit": 50,
+        "next": None,
+        "ok": True,
+    }
+}
+BODY = json.dumps(DOCUMENT)
+
+
+def chunked(text: str, size: int):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(BODY)])
+def test_item_stream_handles_any_chunk_boundary(size):
+    parser = JSONItemStream("/albums/items")
+    items = []
+    for chunk in chunked(BODY, size):
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+
+    assert items == DOCUMENT["albums"]["items"]
+
+
+def test_tokenizer_round_trips_scalars():
+    tokenizer = JSONTokenizer()
+    tokens = []
+    for chunk in chunked('[-12, 3.5e2, true, false, null, "a\\\\b"]', 3):
+        tokens.extend(tokenizer.feed(chunk))
+    tokens.extend(tokenizer.close())
+
+    values = [v for kind, v in tokens if kind == "value"]
+    assert values == [-12, 350.0, True, False, None, "a\\b"]
+
+
+def test_item_stream_stops_after_target():
+    parser = JSONItemStream("/first")
+    items = parser.feed('{"first": [1, 2], "second": ')
+    assert items == [1, 2]
+    assert parser.done
+    assert parser.feed("<anything, parsing has stopped>") == []
+
+
+def test_item_stream_missing_pointer():
+    parser = JSONItemStream("/missing")
+    parser.feed(BODY)
+    with pytest.raises(KeyError):
+        parser.close()
+
+
+def test_invalid_json_is_rejected():
+    with pytest.raises(ValueError):
+        JSONTokenizer().feed('{"a": nope}')
+
+
+def streaming_transport(
+    body: str, status: int = 200, chunk_size: int = 256, asynchronous: bool = False
+):
+    data = body.encode()
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    async def aiter_chunks():
+        for chunk in chunks:
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(
+            status,
+            headers={"Content-Type": "application/json"},
+            content=iter(chunks),
+        )
+
+    async def async_handler(request):
+        return httpx.Response(
+            status,
+            headers={"Content-Type": "application/json"},
+            content=aiter_chunks(),
+        )
+
+    return httpx.MockTransport(async_handler if asynchronous else handler)
+
+
+def test_iter_json_items_streams_items():
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=streaming_transport(BODY),
+    )
+    ids = [item["id"] for item in client.iter_json_items("/export", "/albums/items")]
+    assert ids == [f"album{i}" for i in range(50)]
+
+
+def test_iter_json_items_attaches_bounded_prefix(monkeypatch):
+    attached = []
+    monkeypatch.setenv("MAX_PAYLOAD_CHARS", "100")
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda content, name=None, attachment_type=None: attached.append(
+            (name, content)
+        ),
+    )
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=streaming_transport(BODY),
+    )
+
+    items = list(client.iter_json_items("/export", "/albums/items", attach=True))
+    assert len(items) == 50
+
+    bodies = [c for (n, c) in attached if n == "Response Body"]
+    assert len(bodies) == 1
+    assert "<truncated>" in bodies[0]
+    assert len(bodies[0]) < 150
+
+
+def test_iter_json_items_raises_api_error():
+    client = APIClient(
+        base_url="https://api.example.com",
+        token="dummy",
+        transport=streaming_transport('{"error": "not_found"}', status=404),
+    )
+    with pytest.raises(APIError) as exc_info:
+        list(client.iter_json_items("/export", "/albums/items"))
+    assert exc_info.value.status_code == 404
+
+
+def test_async_iter_json_items_streams_items():
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            token="dummy",
+            transport=streaming_transport(BODY, asynchronous=True),
+        ) as client:
+            return [
+                item["id"]
+                async for item in client.iter_json_items("/export", "/albums/items")
+            ]
+
+    assert asyncio.run(run()) == [f"album{i}" for i in range(50)]
+
+
+@pytest.mark.parametrize("text", ["[-2500.0, 1]", "[1E-5, 2]", "[3.25e+2, 4]"])
+def test_numbers_split_anywhere_are_decoded_whole(text):
+    expected = json.loads(text)
+    for cut in range(1, len(text)):
+        parser = JSONItemStream("")
+        items = parser.feed(text[:cut]) + parser.feed(text[cut:]) + parser.close()
+        assert items == expected, f"split at {cut}"
+
+
+def test_large_float_array_at_common_chunk_sizes():
+    text = json.dumps([i * 0.5 + 0.25 for i in range(20_000)])
+    for size in (4096, 8192, 65536):
+        parser = JSONItemStream("")
+        items = []
+        for chunk in chunked(text, size):
+            items.extend(parser.feed(chunk))
+        items.extend(parser.close())
+        assert items == json.loads(text)
@@ -0,0 +1,135 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from api_testing_framework import timing as timing_module
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.metrics import LatencyRecorder
+from api_testing_framework.retry import RetryBudget, RetryPolicy
+from api_testing_framework.timing import get_timing, subscribe
+
+
+@pytest.fixture
+def timings():
+    collected = []
+    unsubscribe = subscribe(collected.append)
+    yield collected
+    unsubscribe()
+
+
+def test_phases_are_captured_over_a_real_connection(local_server, timings):
+    with APIClient(base_url=local_server, token="dummy") as client:
+        client.get("/one")
+        client.get("/two")
+
+    first, second = timings
+    assert first.status_code == 200 and first.url.endswith("/one")
+    assert first.connect is not None and not first.reused_connection
+    assert first.tls is None  # plain http
+    for phase in ("queue", "send", "server", "ttfb", "download"):
+        assert 0 <= getattr(first, phase) <= first.total
+    assert second.reused_connection
+
+
+def test_nothing_is_traced_without_listeners(monkeypatch):
+    # Any listener (e.g. the latency plugin) turns tracing on
+    monkeypatch.setattr(timing_module, "_subscribers", [])
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    client = APIClient(
+        base_url="https://api.example.com",
+        transport=httpx.MockTransport(handler),
+        token="dummy",
+    )
+    client.get("/items")
+
+    assert "trace" not in seen[0].extensions
+    client.close()
+
+
+def test_failing_subscriber_does_not_break_requests(local_server):
+    def broken(timing):
+        raise RuntimeError("boom")
+
+    unsubscribe = subscribe(broken)
+    try:
+        with APIClient(base_url=local_server, token="dummy") as client:
+            assert client.get("/items") == {"ok": True}
+    finally:
+        unsubscribe()
+
+
+def test_timing_is_attached_to_allure(local_server, monkeypatch):
+    attached = {}
+    monkeypatch.setattr(
+        allure,
+        "attach",
+        lambda content, name=None, attachment_type=None: attached.update(
+            {name: content}
+        ),
+    )
+
+    with APIClient(base_url=local_server, token="dummy") as client:
+        client.get("/items", attach=True)
+        assert get_timing(client._last_response) is not None
+
+    assert "Timing" in attached
+    assert "ttfb" in attached["Timing"] and "total" in attached["Timing"]
+
+
+def test_async_client_is_timed(local_server, timings):
+    async def run():
+        async with AsyncAPIClient(base_url=local_server, token="dummy") as client:
+            await client.get("/items")
+
+    asyncio.run(run())
+
+    assert len(timings) == 1
+    assert timings[0].ttfb is not None and timings[0].download is not None
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_transport_errors_are_published(timings, asynchronous):
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def refuse_async(request):
+        refuse(request)
+
+    retry = RetryPolicy(max_attempts=2, budget=RetryBudget(), sleep=lambda s: None)
+    recorder = LatencyRecorder()
+
+    if asynchronous:
+
+        async def run():
+            async with AsyncAPIClient(
+                base_url="https://api.example.com",
+                transport=httpx.MockTransport(refuse_async),
+                retry=retry,
+            ) as client:
+                await client.get("/items")
+
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(run())
+    else:
+        client = APIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(refuse),
+            retry=retry,
+        )
+        with pytest.raises(httpx.ConnectError):
+            client.get("/items")
+
+    assert len(timings) == 2
+    assert all(t.status_code is None and t.error == "ConnectError" for t in timings)
+    assert "ConnectError" in timings[0].as_text()
+    for timing in timings:
+        recorder(timing)
+    assert recorder.summary()["GET /items"]["errors"] == 2
@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from api_testing_framework import client as client_module
+from api_testing_framework.async_client import AsyncAPIClient
+from api_testing_framework.client import APIClient
+from api_testing_framework.codec import type_adapter
+from api_testing_framework.exceptions import APIError
+
+
+class Item(BaseModel):
+    id: str
+    count: int
+
+
+class NoDictCodec:
+    def loads(self, data):
+        raise AssertionError("typed requests must not decode into a dict")
+
+
+def make_client(body, status=200):
+    transport = httpx.MockTransport(lambda r: httpx.Response(status, json=body))
+    return APIClient(
+        base_url="https://api.example.com", transport=transport, token="dummy"
+    )
+
+
+def test_get_model_validates_raw_bytes(monkeypatch):
+    client = make_client({"id": "a", "count": 3})
+    monkeypatch.setattr(client_module, "get_codec", lambda: NoDictCodec())
+
+    item = client.get_model("/items/a", Item)
+
+    assert item == Item(id="a", count=3)
+    client.close()
+
+
+def test_get_model_accepts_any_type_adapter_type():
+    client = make_client([{"id": "a", "count": 1}, {"id": "b", "count": 2}])
+
+    items = client.get_model("/items", list[Item])
+
+    assert [i.id for i in items] == ["a", "b"]
+    assert type_adapter(list[Item]) is type_adapter(list[Item])
+    client.close()
+
+
+def test_get_model_raises_validation_errors():
+    client = make_client({"id": "a", "count": "many"})
+
+    with pytest.raises(ValidationError):
+        client.get_model("/items/a", Item)
+    client.close()
+
+
+def test_get_model_raises_api_error_for_error_statuses():
+    client = make_client({"error": "not found"}, status=404)
+
+    with pytest.raises(APIError) as exc:
+        client.get_model("/items/missing", Item)
+    assert exc.value.status_code == 404
+    client.close()
+
+
+def test_async_get_model():
+    async def handler(request):
+        return httpx.Response(200, json={"id": "a", "count": 3})
+
+    async def run():
+        async with AsyncAPIClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.get_model("/items/a", Item)
+
+    assert asyncio.run(run()) == Item(id="a", count=3)